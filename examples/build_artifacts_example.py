@@ -103,8 +103,8 @@ def example_build_artifacts():
     # Get rendered
     rendered = discovery.get_rendered_rule(product, rule_id)
     if rendered and rendered.rendered_yaml:
-        import yaml
-        rendered_data = yaml.safe_load(rendered.rendered_yaml)
+        from content_agent.core.yaml_loader import safe_load
+        rendered_data = safe_load(rendered.rendered_yaml)
         if "description" in rendered_data:
             print(f"\nRendered description: {rendered_data['description'][:200]}...")
 
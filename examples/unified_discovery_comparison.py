@@ -139,7 +139,7 @@ def example_comparison():
     from content_agent.config import initialize_settings
     from content_agent.core.integration import initialize_content_repository
     from content_agent.core import discovery
-    import yaml
+    from content_agent.core.yaml_loader import safe_load
 
     # Initialize
     initialize_settings()
@@ -159,7 +159,7 @@ def example_comparison():
         first_product = list(rule.rendered.keys())[0]
         rendered = rule.rendered[first_product]
 
-        rendered_data = yaml.safe_load(rendered.rendered_yaml)
+        rendered_data = safe_load(rendered.rendered_yaml)
         print(f"\nRendered for {first_product} (from build):")
         print(f"  Description: {rendered_data['description'][:200]}...")
 
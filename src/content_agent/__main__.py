@@ -1,18 +1,54 @@
 """Main entry point for content-agent."""
 
-import asyncio
 import logging
 import sys
 from pathlib import Path
 
 import click
 
-from content_agent.config import initialize_settings
-from content_agent.core.integration import (
-    initialize_content_repository,
-    initialize_ssg_modules,
-)
-from content_agent.server import run_stdio_server
+# Log level names accepted in settings and on the command line
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per second instead of once per record.
+
+    Only valid with a datefmt without sub-second fields, which is what setup_logging uses.
+    """
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        """Initialize formatter.
+
+        Args:
+            fmt: Log record format
+            datefmt: Timestamp format (second resolution)
+        """
+        super().__init__(fmt, datefmt=datefmt)
+        # (second, rendered timestamp), replaced as a whole to stay consistent across threads
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the record creation time, reusing the rendering for the same second.
+
+        Args:
+            record: Log record
+            datefmt: Timestamp format
+
+        Returns:
+            Formatted timestamp
+        """
+        second = int(record.created)
+        cached = self._cached_time
+        if cached[0] != second:
+            cached = (second, super().formatTime(record, datefmt))
+            self._cached_time = cached
+        return cached[1]
 
 
 def setup_logging(level: str, log_file: Path | None = None) -> None:
@@ -22,12 +58,10 @@ def setup_logging(level: str, log_file: Path | None = None) -> None:
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional log file path
     """
-    numeric_level = getattr(logging, level.upper(), None)
-    if not isinstance(numeric_level, int):
-        numeric_level = logging.INFO
+    numeric_level = _LOG_LEVELS.get(level.upper(), logging.INFO)
 
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = _SecondCachedFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -107,6 +141,19 @@ def main(
       # Debug mode
       $ content-agent --log-level DEBUG
     """
+    # Imported here so that --help and --version do not load pydantic, the models,
+    # the MCP SDK and the content repository integration
+    import asyncio
+
+    from content_agent.config import initialize_settings
+    from content_agent.core.discovery import warm_caches
+    from content_agent.core.discovery.rules import enable_rule_index_snapshot
+    from content_agent.core.integration import (
+        initialize_content_repository,
+        initialize_ssg_modules,
+    )
+    from content_agent.server import run_stdio_server
+
     try:
         # Initialize settings
         settings = initialize_settings(config)
@@ -150,6 +197,13 @@ def main(
         initialize_ssg_modules()
         logger.info("SSG modules loaded successfully")
 
+        # Reuse the rule directory scan of earlier runs
+        enable_rule_index_snapshot(settings.content.index_cache_dir)
+
+        # Populate discovery caches so the first listing requests are served from memory
+        logger.info("Warming discovery caches...")
+        warm_caches()
+
         # Run server based on mode
         if settings.server.mode == "stdio":
             logger.info("Starting stdio server...")
@@ -4,6 +4,7 @@ from content_agent.config.settings import (
     Settings,
     get_settings,
     initialize_settings,
+    reload_settings,
 )
 
-__all__ = ["Settings", "get_settings", "initialize_settings"]
+__all__ = ["Settings", "get_settings", "initialize_settings", "reload_settings"]
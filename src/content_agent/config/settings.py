@@ -1,13 +1,17 @@
 """Configuration settings using Pydantic Settings."""
 
+import copy
+import functools
 import os
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Default location for the managed repository, builds, job database and logs
+_BASE_DIR = Path.home() / ".content-agent"
+
 
 class ContentSettings(BaseSettings):
     """Content repository settings."""
@@ -17,7 +21,7 @@ class ContentSettings(BaseSettings):
         description="Repository location: 'managed' or absolute path",
     )
     managed_path: Path = Field(
-        default=Path.home() / ".content-agent" / "content",
+        default=_BASE_DIR / "content",
         description="Path for managed repository",
     )
     branch: str = Field(default="master", description="Git branch to use")
@@ -26,6 +30,10 @@ class ContentSettings(BaseSettings):
         default="https://github.com/ComplianceAsCode/content.git",
         description="Repository URL for managed checkout",
     )
+    index_cache_dir: Path | None = Field(
+        default=_BASE_DIR / "cache",
+        description="Directory for rule index snapshots (None to disable)",
+    )
 
     model_config = SettingsConfigDict(env_prefix="CONTENT_AGENT_CONTENT__")
 
@@ -54,7 +62,7 @@ class BuildSettings(BaseSettings):
     """Build settings."""
 
     build_dir: Path = Field(
-        default=Path.home() / ".content-agent" / "builds",
+        default=_BASE_DIR / "builds",
         description="Build artifacts directory",
     )
     max_concurrent_builds: int = Field(
@@ -87,7 +95,7 @@ class JobsSettings(BaseSettings):
     """Jobs settings."""
 
     database: Path = Field(
-        default=Path.home() / ".content-agent" / "jobs.db",
+        default=_BASE_DIR / "jobs.db",
         description="Job database file",
     )
     max_workers: int = Field(default=4, description="Thread pool size", ge=1, le=20)
@@ -139,6 +147,15 @@ class AISettings(BaseSettings):
         default=False,
         description="Enable AI-powered features",
     )
+    response_cache_dir: Path | None = Field(
+        default=_BASE_DIR / "claude_cache",
+        description="Cache directory for deterministic responses (None to disable)",
+    )
+    response_cache_ttl: int = Field(
+        default=86400,
+        description="Seconds a cached response is reused",
+        ge=0,
+    )
 
     model_config = SettingsConfigDict(env_prefix="CONTENT_AGENT_AI__")
 
@@ -154,7 +171,7 @@ class LoggingSettings(BaseSettings):
         description="Log format",
     )
     file: Path | None = Field(
-        default=Path.home() / ".content-agent" / "server.log",
+        default=_BASE_DIR / "server.log",
         description="Log file path",
     )
     console: bool = Field(default=True, description="Enable console logging")
@@ -186,8 +203,7 @@ class Settings(BaseSettings):
         Returns:
             Settings instance
         """
-        with open(yaml_path) as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml_cached(yaml_path)
 
         return cls(**config_data)
 
@@ -207,20 +223,18 @@ class Settings(BaseSettings):
             Settings instance
         """
         # Start with defaults from defaults.yaml
-        defaults_path = Path(__file__).parent / "defaults.yaml"
-        with open(defaults_path) as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml_cached(Path(__file__).parent / "defaults.yaml")
 
         # Override with user config file if provided
         if config_file and config_file.exists():
-            with open(config_file) as f:
-                user_config = yaml.safe_load(f)
-                config_data = _merge_dicts(config_data, user_config)
+            user_config = _load_yaml_cached(config_file)
+            config_data = _merge_dicts(config_data, user_config)
 
         # First create settings without config_data to let environment variables
         # be read by pydantic-settings, then overlay YAML defaults only where
         # environment variables are not set
         settings = cls()
+        env_keys = frozenset(k for k in os.environ if k.startswith("CONTENT_AGENT_"))
 
         # Apply YAML config as defaults (won't override already-set env values)
         if config_data:
@@ -229,17 +243,17 @@ class Settings(BaseSettings):
                 if hasattr(settings, key):
                     attr = getattr(settings, key)
                     if isinstance(value, dict) and isinstance(attr, BaseSettings):
-                        # For nested BaseSettings, rebuild with merged values
-                        current_dict = attr.model_dump()
-                        for nested_key, nested_value in value.items():
-                            # Only set if not already customized from environment
-                            if not _is_env_var_set(key, nested_key):
-                                current_dict[nested_key] = nested_value
-                        # Recreate the nested settings object to ensure validation
-                        setattr(settings, key, type(attr)(**current_dict))
+                        # Only set values not already customized from environment
+                        updates = {
+                            nested_key: nested_value
+                            for nested_key, nested_value in value.items()
+                            if _env_name(key, nested_key) not in env_keys
+                        }
+                        if updates:
+                            setattr(settings, key, _with_updates(attr, updates))
                     else:
                         # For simple fields, check if env var was set
-                        if not _is_env_var_set(key):
+                        if _env_name(key) not in env_keys:
                             setattr(settings, key, value)
 
         return settings
@@ -255,9 +269,54 @@ class Settings(BaseSettings):
         if self.logging.file:
             dirs_to_create.append(self.logging.file.parent)
 
+        # Most directories (often sharing ~/.content-agent) exist already on a warm start;
+        # one stat is cheaper than mkdir failing with EEXIST and then a stat
+        seen: set[str] = set()
         for directory in dirs_to_create:
-            directory = Path(directory).expanduser()
-            directory.mkdir(parents=True, exist_ok=True)
+            path = os.fspath(Path(directory).expanduser())
+            if path in seen:
+                continue
+            seen.add(path)
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+
+
+# Parsed YAML config files keyed by resolved path, tagged with the (mtime ns, size) of the
+# file they were parsed at. Keying by path alone means an edited file replaces its entry
+_yaml_cache: dict[Path, tuple[tuple[int, int], object]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML config file, reusing the result while the file is unchanged.
+
+    Args:
+        path: YAML file path
+
+    Returns:
+        A private copy of the parsed YAML data
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    # Imported here rather than at module level so importing the settings classes doesn't
+    # pay for PyYAML, and because importing content_agent.core pulls in modules that
+    # import this one
+    from content_agent.core.yaml_loader import safe_load
+
+    key = path.resolve()
+    st = key.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(key)
+    if cached and cached[0] == stamp:
+        data = cached[1]
+    else:
+        # libyaml decodes the raw bytes itself, skipping Python-level text decoding
+        with open(key, "rb") as f:
+            data = safe_load(f.read())
+        _yaml_cache[key] = (stamp, data)
+    # Callers merge into and pass on the parsed data, so they each get their own copy
+    return copy.deepcopy(data)
 
 
 def _merge_dicts(base: dict, override: dict) -> dict:
@@ -271,36 +330,65 @@ def _merge_dicts(base: dict, override: dict) -> dict:
         Merged dictionary
     """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    # Walk nested dicts with an explicit stack; only dicts present on both sides are copied
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = merged = current.copy()
+                stack.append((merged, value))
+            else:
+                target[key] = value
+    return result
+
+
+def _with_updates(model: BaseSettings, updates: dict[str, Any]) -> BaseSettings:
+    """Copy a settings object with some fields replaced and validated.
+
+    Only the updated fields are validated (with the same coercion and constraints as the
+    constructor); rebuilding the object would re-read the environment and revalidate
+    every field.
+
+    Args:
+        model: Settings object to copy
+        updates: Field values to set
+
+    Returns:
+        Updated copy of the settings object
+
+    Raises:
+        ValidationError: If a value is invalid or names an unknown field
+    """
+    result = model.model_copy()
+    validator = type(model).__pydantic_validator__
+    for name, value in updates.items():
+        validator.validate_assignment(result, name, value)
     return result
 
 
-def _is_env_var_set(*keys: str) -> bool:
-    """Check if an environment variable is set for the given setting path.
+@functools.cache
+def _env_name(*keys: str) -> str:
+    """Get the environment variable name for the given setting path.
 
     Args:
         *keys: Setting path components (e.g., 'content', 'repository')
 
     Returns:
-        True if corresponding environment variable exists
+        Environment variable name (e.g., CONTENT_AGENT_CONTENT__REPOSITORY)
     """
-    # Build environment variable name
     # Main prefix is CONTENT_AGENT_, nested delimiter is __
-    if len(keys) == 1:
-        env_var = f"CONTENT_AGENT_{keys[0].upper()}"
-    else:
-        env_var = f"CONTENT_AGENT_{'__'.join(k.upper() for k in keys)}"
-
-    return env_var in os.environ
+    return f"CONTENT_AGENT_{'__'.join(k.upper() for k in keys)}"
 
 
 # Global settings instance (initialized by main)
 _settings: Settings | None = None
 
+# Loaded settings keyed by config file, tagged with the config file mtime (ns) and the
+# CONTENT_AGENT_* environment they were loaded with
+_settings_cache: dict[Path | None, tuple[tuple, Settings]] = {}
+
 
 def get_settings() -> Settings:
     """Get the global settings instance.
@@ -319,6 +407,9 @@ def get_settings() -> Settings:
 def initialize_settings(config_file: Path | None = None) -> Settings:
     """Initialize global settings.
 
+    Repeated calls with the same config file reuse the loaded settings as long as
+    neither the file nor the CONTENT_AGENT_* environment variables changed.
+
     Args:
         config_file: Optional config file path
 
@@ -326,6 +417,49 @@ def initialize_settings(config_file: Path | None = None) -> Settings:
         Settings instance
     """
     global _settings
+    stamp = _settings_stamp(config_file)
+    cached = _settings_cache.get(config_file)
+    if cached and cached[0] == stamp:
+        _settings = cached[1]
+        return _settings
+
     _settings = Settings.load(config_file)
     _settings.ensure_directories()
+    _settings_cache[config_file] = (stamp, _settings)
     return _settings
+
+
+def _settings_stamp(config_file: Path | None) -> tuple:
+    """Get the inputs settings are loaded from, besides the bundled defaults.
+
+    Args:
+        config_file: Optional config file path
+
+    Returns:
+        Tuple of config file mtime (ns, -1 if missing) and sorted CONTENT_AGENT_* variables
+    """
+    try:
+        mtime = config_file.stat().st_mtime_ns if config_file else -1
+    except OSError:
+        mtime = -1
+    # pydantic-settings matches environment variable names case-insensitively
+    env = sorted(
+        (key, value)
+        for key, value in os.environ.items()
+        if key.upper().startswith("CONTENT_AGENT_")
+    )
+    return mtime, tuple(env)
+
+
+def reload_settings(config_file: Path | None = None) -> Settings:
+    """Reload global settings, bypassing the settings and config file caches.
+
+    Args:
+        config_file: Optional config file path
+
+    Returns:
+        Settings instance
+    """
+    _settings_cache.clear()
+    _yaml_cache.clear()
+    return initialize_settings(config_file)
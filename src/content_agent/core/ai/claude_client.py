@@ -1,7 +1,14 @@
 """Claude API client for AI operations."""
 
+import hashlib
 import json
-from typing import Any
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
 try:
     from anthropic import Anthropic
@@ -10,6 +17,23 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from anthropic.types import TextBlockParam
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Markdown code fences around JSON in responses; a ```json fence wins over a plain one
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+
+# Default number of seconds a cached response is reused
+DEFAULT_CACHE_TTL = 86400
+
 
 class ClaudeAPIError(Exception):
     """Exception raised for Claude API errors."""
@@ -26,14 +50,24 @@ class ClaudeClient:
         model: str = "claude-3-5-sonnet-20241022",
         max_tokens: int = 4096,
         temperature: float = 0.0,
+        cache_dir: Path | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_cache_entries: int = 1000,
     ):
         """Initialize Claude client.
 
+        With a cache directory, deterministic requests (temperature 0.0) are cached on
+        disk by a hash of the prompts and request parameters, so re-running extraction
+        or mapping with identical inputs within cache_ttl skips the API round-trip.
+
         Args:
             api_key: Anthropic API key
             model: Claude model to use
             max_tokens: Maximum tokens per request
             temperature: Temperature for generation (0.0 = deterministic)
+            cache_dir: Response cache directory, or None to disable the cache
+            cache_ttl: Seconds a cached response is reused
+            max_cache_entries: Cached responses kept before the oldest are evicted
 
         Raises:
             ClaudeAPIError: If anthropic package not installed
@@ -47,6 +81,9 @@ class ClaudeClient:
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.cache_dir = cache_dir.expanduser() if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self.max_cache_entries = max_cache_entries
 
     def create_message(
         self,
@@ -67,24 +104,141 @@ class ClaudeClient:
         Raises:
             ClaudeAPIError: If API request fails
         """
+        temperature = temperature if temperature is not None else self.temperature
+        # Sampled responses are meant to differ between calls, so only cache deterministic ones
+        cache_path = None
+        if self.cache_dir is not None and temperature == 0.0:
+            cache_path = self._cache_path(self.cache_dir, system_prompt, user_prompt, temperature)
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        # Mark the system prompt as a prompt-cache breakpoint: the extractors reuse the same
+        # system prompt for every request, so the API can serve that prefix from its cache
+        # for a few minutes instead of reprocessing it
+        system: list[TextBlockParam] = [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ]
+
         try:
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
-                temperature=temperature if temperature is not None else self.temperature,
-                system=system_prompt,
+                temperature=temperature,
+                system=system,
                 messages=[{"role": "user", "content": user_prompt}],
             )
 
             # Extract text from response
             content = response.content
             if isinstance(content, list) and len(content) > 0:
-                return content[0].text
-            return str(content)
+                text = content[0].text
+            else:
+                text = str(content)
 
         except Exception as e:
             raise ClaudeAPIError(f"Claude API request failed: {e}") from e
 
+        if cache_path is not None:
+            self._write_cache(cache_path, text)
+        return text
+
+    def _cache_path(
+        self, cache_dir: Path, system_prompt: str, user_prompt: str, temperature: float
+    ) -> Path:
+        """Get the cache file for a request.
+
+        Args:
+            cache_dir: Response cache directory
+            system_prompt: System prompt
+            user_prompt: User prompt
+            temperature: Effective temperature
+
+        Returns:
+            Path of the cache file (which may not exist)
+        """
+        key = "\x1f".join(
+            [system_prompt, user_prompt, str(temperature), self.model, str(self.max_tokens)]
+        )
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return cache_dir / digest[:2] / f"{digest}.json"
+
+    def _read_cache(self, cache_path: Path) -> str | None:
+        """Read a cached response.
+
+        Args:
+            cache_path: Cache file
+
+        Returns:
+            Cached response text, or None on a miss, an expired or unreadable entry
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+            entry = orjson.loads(data) if orjson is not None else json.loads(data)
+            response = entry["response"]
+            if not isinstance(response, str):
+                raise TypeError(f"response is {type(response).__name__}, expected str")
+            if time.time() - entry["ts"] > self.cache_ttl:
+                return None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable Claude cache entry %s: %s", cache_path, e)
+            return None
+        return response
+
+    def _write_cache(self, cache_path: Path, text: str) -> None:
+        """Store a response, evicting the oldest entries beyond max_cache_entries.
+
+        The cache is an optimization, so failures are logged and otherwise ignored.
+
+        Args:
+            cache_path: Cache file
+            text: Response text
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                entry = {"response": text, "ts": int(time.time())}
+                with os.fdopen(fd, "wb") as f:
+                    f.write(
+                        orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode()
+                    )
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            # Entries live in <cache_dir>/<shard>/
+            self._evict_cache(cache_path.parent.parent)
+        except (OSError, TypeError) as e:  # TypeError: orjson rejects lone surrogates
+            logger.warning("Failed to write Claude cache entry %s: %s", cache_path, e)
+
+    def _evict_cache(self, cache_dir: Path) -> None:
+        """Delete the least recently written cache entries beyond max_cache_entries.
+
+        Args:
+            cache_dir: Response cache directory
+        """
+        entries: list[tuple[int, str]] = []
+        for shard in os.scandir(cache_dir):
+            if shard.is_dir():
+                entries.extend(
+                    (entry.stat().st_mtime_ns, entry.path)
+                    for entry in os.scandir(shard.path)
+                    if entry.name.endswith(".json")
+                )
+        if len(entries) <= self.max_cache_entries:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_cache_entries]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
     def extract_json_response(self, response: str) -> dict[str, Any]:
         """Extract JSON from Claude response.
 
@@ -92,24 +246,23 @@ class ClaudeClient:
             response: Response text from Claude
 
         Returns:
-            Parsed JSON dictionary
+            Parsed JSON dictionary (callers also accept a bare array)
 
         Raises:
             ClaudeAPIError: If JSON extraction fails
         """
-        try:
-            # Try to find JSON in response (might be wrapped in markdown code block)
-            json_match = response
-            if "```json" in response:
-                start = response.find("```json") + 7
-                end = response.find("```", start)
-                json_match = response[start:end].strip()
-            elif "```" in response:
-                start = response.find("```") + 3
-                end = response.find("```", start)
-                json_match = response[start:end].strip()
-
-            return json.loads(json_match)
+        # Find JSON in response (might be wrapped in markdown code block)
+        match = _JSON_FENCE_RE.search(response) or _FENCE_RE.search(response)
+        payload = match.group(1).strip() if match else response
 
+        if orjson is not None:
+            try:
+                return cast(dict[str, Any], orjson.loads(payload))
+            except orjson.JSONDecodeError:
+                # The stdlib parser also accepts NaN/Infinity and arbitrarily large ints
+                pass
+
+        try:
+            return cast(dict[str, Any], json.loads(payload))
         except json.JSONDecodeError as e:
             raise ClaudeAPIError(f"Failed to parse JSON response: {e}") from e
@@ -1,8 +1,13 @@
 """AI-powered requirement extraction from policy documents."""
 
+from pydantic import TypeAdapter
+
 from content_agent.core.ai.claude_client import ClaudeClient
 from content_agent.models.control import ExtractedRequirement, ParsedDocument
 
+# Validates a whole response in one pydantic-core call instead of one model per item
+_requirements_adapter = TypeAdapter(list[ExtractedRequirement])
+
 
 class RequirementExtractor:
     """Extract structured requirements from policy documents using AI."""
@@ -70,16 +75,13 @@ Skip:
         # Parse JSON response
         requirements_data = self.client.extract_json_response(response)
 
-        # Convert to ExtractedRequirement objects
-        requirements = []
-        if isinstance(requirements_data, list):
-            for req_data in requirements_data:
-                requirements.append(ExtractedRequirement(**req_data))
-        elif isinstance(requirements_data, dict) and "requirements" in requirements_data:
-            for req_data in requirements_data["requirements"]:
-                requirements.append(ExtractedRequirement(**req_data))
+        # Claude returns either a bare array or {"requirements": [...]}
+        if isinstance(requirements_data, dict):
+            requirements_data = requirements_data.get("requirements", [])
+        elif not isinstance(requirements_data, list):
+            requirements_data = []
 
-        return requirements
+        return _requirements_adapter.validate_python(requirements_data)
 
     def extract_requirements_from_text(
         self,
@@ -113,15 +115,73 @@ Return the requirements as a JSON array."""
 
         requirements_data = self.client.extract_json_response(response)
 
-        requirements = []
-        if isinstance(requirements_data, list):
-            for req_data in requirements_data:
-                # Ensure section_id and section_title are set
-                req_data["section_id"] = req_data.get("section_id", section_id)
-                req_data["section_title"] = req_data.get("section_title", section_title)
-                requirements.append(ExtractedRequirement(**req_data))
+        return self._to_requirements(requirements_data, section_id, section_title)
+
+    def extract_requirements_batch(
+        self, items: list[tuple[str, str, str]]
+    ) -> list[list[ExtractedRequirement]]:
+        """Extract requirements from several texts in a single Claude request.
+
+        Equivalent to calling extract_requirements_from_text() for each item, but the
+        system prompt is sent and the API round-trip is paid once for the whole batch.
+
+        Args:
+            items: (text, section_id, section_title) tuples
+
+        Returns:
+            Extracted requirements for each item, in input order
+        """
+        if not items:
+            return []
+
+        prompt_parts = ["Extract requirements from each of the following items:", ""]
+        for index, (text, _section_id, section_title) in enumerate(items):
+            prompt_parts.extend([f"### Item {index}", f"Section: {section_title}", "", text, ""])
+        prompt_parts.append(
+            'Return a JSON object {"items": [[...], [...]]} with one JSON array of '
+            "requirements per item, in item order."
+        )
+
+        response = self.client.create_message(
+            system_prompt=self.SYSTEM_PROMPT,
+            user_prompt="\n".join(prompt_parts),
+        )
+
+        batch_data = self.client.extract_json_response(response)
+        item_data = batch_data.get("items", []) if isinstance(batch_data, dict) else batch_data
+        if not isinstance(item_data, list):
+            item_data = []
+
+        return [
+            self._to_requirements(
+                item_data[index] if index < len(item_data) else [], section_id, section_title
+            )
+            for index, (_text, section_id, section_title) in enumerate(items)
+        ]
+
+    def _to_requirements(
+        self, requirements_data: object, section_id: str, section_title: str
+    ) -> list[ExtractedRequirement]:
+        """Convert extracted requirement data for one text.
 
-        return requirements
+        Args:
+            requirements_data: Parsed JSON for the text (a list of requirement dicts)
+            section_id: Default section identifier
+            section_title: Default section title
+
+        Returns:
+            List of extracted requirements
+        """
+        if not isinstance(requirements_data, list):
+            return []
+
+        # Default section_id and section_title when Claude leaves them out
+        return _requirements_adapter.validate_python(
+            [
+                {"section_id": section_id, "section_title": section_title, **req_data}
+                for req_data in requirements_data
+            ]
+        )
 
     def _build_extraction_prompt(self, document: ParsedDocument) -> str:
         """Build extraction prompt from document.
@@ -161,17 +221,21 @@ Return the requirements as a JSON array."""
             List of formatted lines
         """
         lines = []
-        indent = "  " * depth
-
-        # Add section header
-        lines.append(f"{indent}## {section.title} (ID: {section.id})")
-
-        # Add content if present
-        if section.content.strip():
-            lines.append(f"{indent}{section.content}")
-
-        # Add subsections recursively
-        for subsection in section.subsections:
-            lines.extend(self._format_section(subsection, depth + 1))
+        # Depth-first with an explicit stack, appending to one list instead of merging
+        # the lines returned by recursive calls
+        stack = [(section, depth)]
+        while stack:
+            section, depth = stack.pop()
+            indent = "  " * depth
+
+            # Add section header
+            lines.append(f"{indent}## {section.title} (ID: {section.id})")
+
+            # Add content if present
+            if section.content.strip():
+                lines.append(f"{indent}{section.content}")
+
+            # Queue subsections so they are emitted in document order
+            stack.extend((sub, depth + 1) for sub in reversed(section.subsections))
 
         return lines
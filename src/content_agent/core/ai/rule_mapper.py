@@ -1,11 +1,23 @@
 """AI-powered rule mapping for control requirements."""
 
+import heapq
+from collections import OrderedDict
+from operator import attrgetter
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from content_agent.core.ai.claude_client import ClaudeClient
 from content_agent.core.discovery.rules import RuleDiscovery
+from content_agent.models import RuleSearchResult
 from content_agent.models.control import ControlRequirement, RuleSuggestion
 
+# Fields of a rule search result that its entry in the rules context is built from
+_RuleKey = tuple[str, str, str | None]
+
+# Validates a whole response in one pydantic-core call instead of one model per item
+_suggestions_adapter = TypeAdapter(list[RuleSuggestion])
+
 
 class RuleMapper:
     """Map control requirements to ComplianceAsCode rules using AI."""
@@ -49,6 +61,9 @@ Return a JSON array of suggestions:
 
 Be conservative - only suggest rules with confidence >= 0.3. Limit to top 10 most relevant rules."""
 
+    # Number of rules context strings kept per mapper
+    RULES_CONTEXT_CACHE_SIZE = 16
+
     def __init__(self, claude_client: ClaudeClient, content_path: Path | None = None):
         """Initialize rule mapper.
 
@@ -57,9 +72,17 @@ Be conservative - only suggest rules with confidence >= 0.3. Limit to top 10 mos
             content_path: Path to ComplianceAsCode content repository
         """
         self.client = claude_client
+        # Each mapper has its own discovery; the directory scan records behind rule indexes
+        # are shared at module level, so building another index only lists directories
+        # modified since the last scan
         self.rule_discovery = RuleDiscovery()
         if content_path:
-            self.rule_discovery.content_repo.content_path = content_path
+            self.rule_discovery.set_content_path(content_path)
+        # Rules context strings keyed by the (rule ID, title, description) of the rules
+        # they list
+        self._rules_ctx_cache: OrderedDict[tuple[_RuleKey, ...], str] = OrderedDict()
+        # Formatted context entries of the rules in the last context, keyed the same way
+        self._rule_block_cache: dict[_RuleKey, str] = {}
 
     def suggest_rules(
         self,
@@ -92,22 +115,22 @@ Be conservative - only suggest rules with confidence >= 0.3. Limit to top 10 mos
         # Parse response
         suggestions_data = self.client.extract_json_response(response)
 
+        # Claude returns either a bare array or {"suggestions": [...]}
+        if isinstance(suggestions_data, dict):
+            suggestions_data = suggestions_data.get("suggestions", [])
+        elif not isinstance(suggestions_data, list):
+            suggestions_data = []
+
         # Convert to RuleSuggestion objects
-        suggestions = []
-        if isinstance(suggestions_data, list):
-            for sug_data in suggestions_data:
-                suggestion = RuleSuggestion(**sug_data)
-                if suggestion.confidence >= min_confidence:
-                    suggestions.append(suggestion)
-        elif isinstance(suggestions_data, dict) and "suggestions" in suggestions_data:
-            for sug_data in suggestions_data["suggestions"]:
-                suggestion = RuleSuggestion(**sug_data)
-                if suggestion.confidence >= min_confidence:
-                    suggestions.append(suggestion)
-
-        # Sort by confidence (descending) and limit
-        suggestions.sort(key=lambda s: s.confidence, reverse=True)
-        return suggestions[:max_suggestions]
+        suggestions = [
+            suggestion
+            for suggestion in _suggestions_adapter.validate_python(suggestions_data)
+            if suggestion.confidence >= min_confidence
+        ]
+
+        # Top suggestions by confidence (descending); ties keep response order, as with a
+        # stable sort
+        return heapq.nlargest(max_suggestions, suggestions, key=attrgetter("confidence"))
 
     def suggest_rules_for_text(
         self,
@@ -143,30 +166,73 @@ Be conservative - only suggest rules with confidence >= 0.3. Limit to top 10 mos
         Returns:
             Formatted rules context
         """
-        # Get all rules (or search for relevant ones)
+        # The rule index and the search results validate themselves against the rule
+        # directories and rule.yml files, so rules added or edited since the last call
+        # are picked up without parsing the unchanged ones again
+        self.rule_discovery.refresh_index()
         rules = self.rule_discovery.search_rules(limit=limit)
 
+        key = tuple((rule.rule_id, rule.title, rule.description) for rule in rules)
+        cached = self._rules_ctx_cache.get(key)
+        if cached is not None:
+            self._rules_ctx_cache.move_to_end(key)
+            return cached
+
+        context = self._format_rules_context(rules, key)
+        self._rules_ctx_cache[key] = context
+        if len(self._rules_ctx_cache) > self.RULES_CONTEXT_CACHE_SIZE:
+            self._rules_ctx_cache.popitem(last=False)
+        return context
+
+    def _format_rules_context(
+        self, rules: list[RuleSearchResult], rule_keys: tuple[_RuleKey, ...]
+    ) -> str:
+        """Format the rules context.
+
+        Args:
+            rules: Rules to include
+            rule_keys: (rule ID, title, description) of each rule
+
+        Returns:
+            Formatted rules context
+        """
         if not rules:
             return "No rules available in the content repository."
 
         context_parts = [f"Available rules (showing {len(rules)}):", ""]
-
-        for rule in rules:
-            context_parts.append(f"- {rule.rule_id}:")
-            if rule.title:
-                context_parts.append(f"  Title: {rule.title}")
-            if rule.description:
-                # Truncate long descriptions
-                desc = (
-                    rule.description[:200] + "..."
-                    if len(rule.description) > 200
-                    else rule.description
-                )
-                context_parts.append(f"  Description: {desc}")
-            context_parts.append("")
+        blocks = {}
+        for rule, rule_key in zip(rules, rule_keys, strict=True):
+            block = self._rule_block_cache.get(rule_key)
+            if block is None:
+                block = self._format_rule_block(rule)
+            blocks[rule_key] = block
+            context_parts.append(block)
+        self._rule_block_cache = blocks
 
         return "\n".join(context_parts)
 
+    @staticmethod
+    def _format_rule_block(rule: RuleSearchResult) -> str:
+        """Format one rule's entry in the rules context.
+
+        Args:
+            rule: Rule search result
+
+        Returns:
+            Rule ID, title and truncated description lines, followed by a blank line
+        """
+        lines = [f"- {rule.rule_id}:"]
+        if rule.title:
+            lines.append(f"  Title: {rule.title}")
+        if rule.description:
+            # Truncate long descriptions
+            desc = (
+                rule.description[:200] + "..." if len(rule.description) > 200 else rule.description
+            )
+            lines.append(f"  Description: {desc}")
+        lines.append("")
+        return "\n".join(lines)
+
     def _build_mapping_prompt(self, requirement: ControlRequirement, rules_context: str) -> str:
         """Build prompt for rule mapping.
 
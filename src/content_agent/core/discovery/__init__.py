@@ -3,7 +3,9 @@
 from content_agent.core.discovery.build_artifacts import (
     get_datastream_info,
     get_rendered_rule,
+    get_rendered_rules_batch,
     list_built_products,
+    list_built_products_with_info,
     search_rendered_content,
 )
 from content_agent.core.discovery.controls import list_controls
@@ -11,6 +13,7 @@ from content_agent.core.discovery.products import get_product_details, list_prod
 from content_agent.core.discovery.profiles import get_profile_details, list_profiles
 from content_agent.core.discovery.rules import get_rule_details, search_rules
 from content_agent.core.discovery.templates import get_template_schema, list_templates
+from content_agent.core.discovery.warmup import warm_caches
 
 __all__ = [
     # Products
@@ -29,7 +32,11 @@ __all__ = [
     "list_controls",
     # Build artifacts
     "list_built_products",
+    "list_built_products_with_info",
     "get_rendered_rule",
+    "get_rendered_rules_batch",
     "get_datastream_info",
     "search_rendered_content",
+    # Startup
+    "warm_caches",
 ]
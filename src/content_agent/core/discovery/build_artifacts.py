@@ -4,16 +4,157 @@ This module provides access to rendered content from the build/<product> directo
 These files contain the final content after Jinja template processing and variable expansion.
 """
 
+import json
 import logging
+import os
+import re
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO, TypeVar
 
+try:
+    from lxml import etree  # type: ignore[import-untyped]
+except ImportError:  # lxml is an optional speedup
+    etree = None
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from content_agent.core.discovery.cache import file_stamp, shared_instance
 from content_agent.core.integration import get_content_repository
-from content_agent.models import DatastreamInfo, RenderedRule, RenderSearchResult
+from content_agent.core.yaml_loader import safe_dump
+from content_agent.models import (
+    DatastreamInfo,
+    RenderedRule,
+    RenderedRuleMetadata,
+    RenderSearchResult,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Upper bound on threads used for per-product lookups
+MAX_PRODUCT_WORKERS = 8
+
+XCCDF_PROFILE_TAG = "{http://checklists.nist.gov/xccdf/1.2}Profile"
+XCCDF_RULE_TAG = "{http://checklists.nist.gov/xccdf/1.2}Rule"
+
+# Subdirectories that mark a directory as a product build: HTML guides, Ansible
+# playbooks, Bash scripts and rendered rules
+PRODUCT_BUILD_SUBDIRS = frozenset({"guides", "ansible", "bash", "rules"})
+
+# Remediation types read by get_rendered_rule and the file extension of each
+REMEDIATION_TYPES = (
+    ("bash", ".sh"),
+    ("ansible", ".yml"),
+    ("anaconda", ".anaconda"),
+    ("puppet", ".pp"),
+    ("ignition", ".yml"),
+    ("kubernetes", ".yml"),
+    ("blueprint", ".toml"),
+)
+
+# Extensions of the text remediation files searched by search_rendered_content
+REMEDIATION_SUFFIXES = frozenset({".sh", ".yml", ".yaml", ".pp", ".toml", ".anaconda"})
+
+# Index of rendered artifact directories: (file names, subdirectory names) keyed by
+# directory and tagged with the directory mtime (ns) they were listed at, so the
+# listing is only rebuilt when files are added to or removed from that directory
+_rendered_index: dict[Path, tuple[int, frozenset[str], tuple[str, ...]]] = {}
+
+# Sorted built product names keyed by build directory, tagged with the build directory
+# mtime (ns) and the mtimes of the subdirectories that did not look like product builds
+# yet, since a product directory only qualifies once its first artifacts are written
+_built_products_cache: dict[Path, tuple[int, tuple[tuple[Path, int], ...], list[str]]] = {}
+
+# (profiles, rules) counts keyed by datastream file, tagged with the (mtime ns, size) the
+# file was parsed at, so unchanged datastreams are not parsed again
+_datastream_counts: dict[Path, tuple[tuple[int, int], tuple[int, int]]] = {}
+
+# Rendered YAML sizes keyed by rule JSON path, tagged with the (mtime ns, size) of the
+# JSON file, so metadata lookups do not render unchanged rules again
+_rendered_yaml_sizes: dict[Path, tuple[tuple[int, int], int]] = {}
+
+
+class _RenderedContentCache:
+    """LRU cache of rendered artifact file contents.
+
+    Entries are validated against the file's (st_mtime_ns, st_size) on every read, so a
+    cache hit costs a single stat instead of open/read/decode. The cache is bounded by
+    the total number of characters held.
+    """
+
+    def __init__(self, budget: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            budget: Maximum total characters of cached content
+        """
+        self._budget = budget
+        self._size = 0
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read_text(self, path: Path) -> str:
+        """Read a file's text, serving unchanged files from the cache.
+
+        Args:
+            path: File path
+
+        Returns:
+            File content
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached and cached[0] == version:
+                self._entries.move_to_end(path)
+                return cached[1]
+
+        content = path.read_text()
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous:
+                self._size -= len(previous[1])
+            self._entries[path] = (version, content)
+            self._size += len(content)
+
+            while self._size > self._budget and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+        return content
+
+
+_rendered_contents = _RenderedContentCache(budget=64 * 1024 * 1024)
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that a file will be read sequentially (larger read-ahead).
+
+    Args:
+        fd: Open file descriptor
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError as e:
+            logger.debug(f"posix_fadvise failed: {e}")
+
 
 class BuildArtifactsDiscovery:
     """Discovery and access for build artifacts."""
@@ -30,20 +171,50 @@ class BuildArtifactsDiscovery:
         """
         logger.debug("Listing built products")
 
+        built_products = list(self._iter_built_products())
+        logger.info(f"Found {len(built_products)} built products")
+        return built_products
+
+    def _iter_built_products(self) -> Iterator[str]:
+        """Yield built products in sorted order, checking product directories lazily.
+
+        A product directory is only inspected when the consumer asks for the next
+        product, so callers that stop early (e.g., a search that reached its limit)
+        skip the remaining directories. The listing is cached once fully consumed.
+
+        Yields:
+            Product identifiers with build artifacts
+        """
         build_path = self.content_repo.build_path
-        if not build_path.exists():
+        try:
+            mtime = build_path.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"Build directory does not exist: {build_path}")
-            return []
+            return
 
-        built_products = []
-        for product_dir in build_path.iterdir():
-            if product_dir.is_dir() and not product_dir.name.startswith("."):
-                # Check if it looks like a product build (has some common files/dirs)
-                if self._is_product_build_dir(product_dir):
-                    built_products.append(product_dir.name)
+        cached = _built_products_cache.get(build_path)
+        if cached and cached[0] == mtime and all(file_stamp(d)[0] == m for d, m in cached[1]):
+            yield from cached[2]
+            return
 
-        logger.info(f"Found {len(built_products)} built products")
-        return sorted(built_products)
+        with os.scandir(build_path) as entries:
+            names = sorted(
+                entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")
+            )
+
+        built_products = []
+        candidates = []
+        for name in names:
+            product_dir = build_path / name
+            product_mtime = file_stamp(product_dir)[0]
+            # Check if it looks like a product build (has some common files/dirs)
+            if self._is_product_build_dir(product_dir):
+                built_products.append(name)
+                yield name
+            else:
+                candidates.append((product_dir, product_mtime))
+
+        _built_products_cache[build_path] = (mtime, tuple(candidates), built_products)
 
     def get_rendered_rule(self, product: str, rule_id: str) -> RenderedRule | None:
         """Get rendered rule content from build directory.
@@ -57,66 +228,32 @@ class BuildArtifactsDiscovery:
         """
         logger.debug(f"Getting rendered rule: {rule_id} for product: {product}")
 
-        product_build = self.content_repo.get_product_build_path(product)
-        if not product_build:
-            logger.warning(f"No build directory for product: {product}")
-            return None
-
-        # Build directory structure:
-        # build/{product}/rules/{rule_id}.json - rendered rule metadata
-        # build/{product}/fixes_from_templates/{type}/{rule_id}.sh - rendered remediations
-        # build/{product}/checks/oval/{rule_id}.xml - rendered OVAL checks
-
-        # Read rendered rule JSON
-        import json
-
-        rule_json_path = product_build / "rules" / f"{rule_id}.json"
-        if not rule_json_path.exists():
-            logger.debug(f"Rule {rule_id} not found in build for {product}")
+        located = self._locate_rendered_rule(product, rule_id)
+        if located is None:
             return None
+        rule_json_path, oval_path, remediation_paths = located
 
         try:
-            with open(rule_json_path) as f:
-                rule_data = json.load(f)
-
-            # Convert JSON back to YAML-like format for consistency
-            import yaml
-
-            rendered_yaml = yaml.dump(rule_data, default_flow_style=False, sort_keys=False)
+            rendered_yaml = _render_rule_yaml(rule_json_path)
         except Exception as e:
             logger.warning(f"Failed to read rendered rule JSON: {e}")
             return None
 
         # Read rendered OVAL
         rendered_oval = None
-        oval_path = product_build / "checks" / "oval" / f"{rule_id}.xml"
-        if oval_path.exists():
+        if oval_path:
             try:
-                rendered_oval = oval_path.read_text()
+                rendered_oval = _rendered_contents.read_text(oval_path)
             except Exception as e:
                 logger.debug(f"Failed to read OVAL: {e}")
 
         # Read rendered remediations
         rendered_remediations = {}
-        remediation_types = {
-            "bash": ".sh",
-            "ansible": ".yml",
-            "anaconda": ".anaconda",
-            "puppet": ".pp",
-            "ignition": ".yml",
-            "kubernetes": ".yml",
-            "blueprint": ".toml",
-        }
-
-        for rem_type, ext in remediation_types.items():
-            rem_dir = product_build / "fixes_from_templates" / rem_type
-            if rem_dir.exists():
-                rem_file = rem_dir / f"{rule_id}{ext}"
-                if rem_file.exists():
-                    try:
-                        rendered_remediations[rem_type] = rem_file.read_text()
-                    except Exception as e:
-                        logger.debug(f"Failed to read {rem_type} remediation: {e}")
+        for rem_type, rem_path in remediation_paths.items():
+            try:
+                rendered_remediations[rem_type] = _rendered_contents.read_text(rem_path)
+            except Exception as e:
+                logger.debug(f"Failed to read {rem_type} remediation: {e}")
 
         return RenderedRule(
             rule_id=rule_id,
@@ -127,6 +264,151 @@ class BuildArtifactsDiscovery:
             build_path=str(rule_json_path.parent.relative_to(self.content_repo.path)),
         )
 
+    def get_rendered_rule_metadata(self, product: str, rule_id: str) -> RenderedRuleMetadata | None:
+        """Get the sizes of a rule's rendered artifacts without reading them.
+
+        OVAL and remediation sizes come from stat(); the rendered YAML is only produced
+        again when the rule JSON changed.
+
+        Args:
+            product: Product identifier
+            rule_id: Rule identifier
+
+        Returns:
+            RenderedRuleMetadata or None if not found
+        """
+        logger.debug(f"Getting rendered rule metadata: {rule_id} for product: {product}")
+
+        located = self._locate_rendered_rule(product, rule_id)
+        if located is None:
+            return None
+        rule_json_path, oval_path, remediation_paths = located
+
+        yaml_size: int | None = None
+        try:
+            stat = rule_json_path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _rendered_yaml_sizes.get(rule_json_path)
+            if cached and cached[0] == stamp:
+                yaml_size = cached[1]
+            else:
+                # The rendered YAML is ASCII (non-ASCII characters are escaped), so its
+                # length is its size in bytes
+                yaml_size = len(_render_rule_yaml(rule_json_path))
+                _rendered_yaml_sizes[rule_json_path] = (stamp, yaml_size)
+        except Exception as e:
+            logger.warning(f"Failed to read rendered rule JSON: {e}")
+
+        oval_size = None
+        if oval_path:
+            try:
+                oval_size = oval_path.stat().st_size
+            except OSError as e:
+                logger.debug(f"Failed to stat OVAL: {e}")
+
+        remediation_sizes = {}
+        for rem_type, rem_path in remediation_paths.items():
+            try:
+                remediation_sizes[rem_type] = rem_path.stat().st_size
+            except OSError as e:
+                logger.debug(f"Failed to stat {rem_type} remediation: {e}")
+
+        return RenderedRuleMetadata(
+            rule_id=rule_id,
+            product=product,
+            yaml_size=yaml_size,
+            oval_size=oval_size,
+            remediation_sizes=remediation_sizes,
+            build_path=str(rule_json_path.parent.relative_to(self.content_repo.path)),
+        )
+
+    def _locate_rendered_rule(
+        self, product: str, rule_id: str
+    ) -> tuple[Path, Path | None, dict[str, Path]] | None:
+        """Find the rendered artifacts of a rule in a product build.
+
+        Args:
+            product: Product identifier
+            rule_id: Rule identifier
+
+        Returns:
+            Tuple of (rule JSON path, OVAL path or None, remediation paths by type), or
+            None if the rule was not built for the product
+        """
+        product_build = self.content_repo.get_product_build_path(product)
+        if not product_build:
+            logger.warning(f"No build directory for product: {product}")
+            return None
+
+        # Build directory structure:
+        # build/{product}/rules/{rule_id}.json - rendered rule metadata
+        # build/{product}/fixes_from_templates/{type}/{rule_id}.sh - rendered remediations
+        # build/{product}/checks/oval/{rule_id}.xml - rendered OVAL checks
+
+        rule_json_path = product_build / "rules" / f"{rule_id}.json"
+        if rule_json_path.name not in self._indexed_files(rule_json_path.parent):
+            logger.debug(f"Rule {rule_id} not found in build for {product}")
+            return None
+
+        oval_dir = product_build / "checks" / "oval"
+        oval_path: Path | None = None
+        if f"{rule_id}.xml" in self._indexed_files(oval_dir):
+            oval_path = oval_dir / f"{rule_id}.xml"
+
+        remediation_paths = {}
+        fixes_dir = product_build / "fixes_from_templates"
+        # Only remediation types whose directory exists in this build are looked at
+        rem_types = self._indexed_subdirs(fixes_dir)
+
+        for rem_type, ext in REMEDIATION_TYPES:
+            if rem_type not in rem_types:
+                continue
+            rem_dir = fixes_dir / rem_type
+            rem_name = f"{rule_id}{ext}"
+            if rem_name in self._indexed_files(rem_dir):
+                remediation_paths[rem_type] = rem_dir / rem_name
+
+        return rule_json_path, oval_path, remediation_paths
+
+    def get_rendered_rules_batch(
+        self, products: list[str], rule_id: str
+    ) -> dict[str, RenderedRule | None]:
+        """Get rendered content of a rule for several products concurrently.
+
+        Args:
+            products: Product identifiers
+            rule_id: Rule identifier
+
+        Returns:
+            Dict mapping each product to its RenderedRule (or None if not found)
+        """
+        return self._map_products(lambda p: self.get_rendered_rule(p, rule_id), products)
+
+    def get_rendered_rule_metadata_batch(
+        self, products: list[str], rule_id: str
+    ) -> dict[str, RenderedRuleMetadata | None]:
+        """Get rendered artifact sizes of a rule for several products concurrently.
+
+        Args:
+            products: Product identifiers
+            rule_id: Rule identifier
+
+        Returns:
+            Dict mapping each product to its RenderedRuleMetadata (or None if not found)
+        """
+        return self._map_products(lambda p: self.get_rendered_rule_metadata(p, rule_id), products)
+
+    def get_datastream_info_batch(self, products: list[str]) -> dict[str, DatastreamInfo | None]:
+        """Get datastream information for several products concurrently.
+
+        Args:
+            products: Product identifiers
+
+        Returns:
+            Dict mapping each product to its DatastreamInfo
+        """
+        return self._map_products(self.get_datastream_info, products)
+
     def get_datastream_info(self, product: str) -> DatastreamInfo | None:
         """Get information about a built datastream.
 
@@ -155,35 +437,113 @@ class BuildArtifactsDiscovery:
 
         if not datastream_path:
             logger.debug(f"Datastream not found for product: {product}")
-            return DatastreamInfo(
-                product=product,
-                datastream_path=f"build/ssg-{product}-ds.xml",
-                file_size=0,
-                build_time=None,
-                profiles_count=0,
-                rules_count=0,
-                exists=False,
+            return self._missing_datastream_info(product)
+
+        return self._load_datastream_info(product, datastream_path, datastream_path.stat())
+
+    def list_built_products_with_info(self) -> list[DatastreamInfo]:
+        """List built products together with their datastream information.
+
+        Scans the build directory once and takes datastream sizes and timestamps from
+        that scan, instead of calling list_built_products() and then
+        get_datastream_info() for each product.
+
+        Returns:
+            List of DatastreamInfo objects, one per built product
+        """
+        logger.debug("Listing built products with datastream info")
+
+        build_path = self.content_repo.build_path
+        if not build_path.exists():
+            logger.warning(f"Build directory does not exist: {build_path}")
+            return []
+
+        product_dirs = []
+        datastream_files: dict[str, os.DirEntry] = {}
+        with os.scandir(build_path) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    product_dirs.append(entry)
+                elif entry.name.startswith("ssg-") and entry.name.endswith(".xml"):
+                    datastream_files[entry.name] = entry
+
+        infos = []
+        for product_dir in sorted(product_dirs, key=lambda e: e.name):
+            if not self._is_product_build_dir(Path(product_dir.path)):
+                continue
+
+            product = product_dir.name
+            ds_entry = datastream_files.get(f"ssg-{product}-ds.xml") or datastream_files.get(
+                f"ssg-{product}-xccdf.xml"
             )
+            if ds_entry:
+                infos.append(
+                    self._load_datastream_info(product, Path(ds_entry.path), ds_entry.stat())
+                )
+                continue
+
+            nested_path = build_path / product / f"ssg-{product}-ds.xml"
+            if nested_path.exists():
+                infos.append(self._load_datastream_info(product, nested_path, nested_path.stat()))
+            else:
+                infos.append(self._missing_datastream_info(product))
+
+        logger.info(f"Found {len(infos)} built products")
+        return infos
+
+    def _missing_datastream_info(self, product: str) -> DatastreamInfo:
+        """Build the DatastreamInfo returned when no datastream exists.
+
+        Args:
+            product: Product identifier
+
+        Returns:
+            DatastreamInfo with exists=False
+        """
+        return DatastreamInfo(
+            product=product,
+            datastream_path=f"build/ssg-{product}-ds.xml",
+            file_size=0,
+            build_time=None,
+            profiles_count=0,
+            rules_count=0,
+            exists=False,
+        )
+
+    def _load_datastream_info(
+        self, product: str, datastream_path: Path, stat: os.stat_result
+    ) -> DatastreamInfo:
+        """Build DatastreamInfo for an existing datastream file.
 
+        Args:
+            product: Product identifier
+            datastream_path: Path to the datastream file
+            stat: Stat result of the datastream file
+
+        Returns:
+            DatastreamInfo with file metadata and profile/rule counts
+        """
         # Get file info
-        file_size = datastream_path.stat().st_size
-        build_time = datetime.fromtimestamp(datastream_path.stat().st_mtime)
+        file_size = stat.st_size
+        build_time = datetime.fromtimestamp(stat.st_mtime)
 
-        # Parse datastream for counts (basic parsing)
+        # Stream the datastream and count profiles/rules without building the tree
         profiles_count = 0
         rules_count = 0
         try:
-            tree = ET.parse(datastream_path)
-            root = tree.getroot()
-
-            # Count profiles (rough estimation)
-            profiles = root.findall(".//{http://checklists.nist.gov/xccdf/1.2}Profile")
-            profiles_count = len(profiles)
-
-            # Count rules (rough estimation)
-            rules = root.findall(".//{http://checklists.nist.gov/xccdf/1.2}Rule")
-            rules_count = len(rules)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _datastream_counts.get(datastream_path)
+            if cached and cached[0] == stamp:
+                profiles_count, rules_count = cached[1]
+            else:
+                with open(datastream_path, "rb") as f:
+                    _advise_sequential(f.fileno())
+                    profiles_count, rules_count = _count_profiles_and_rules(f)
+                _datastream_counts[datastream_path] = (stamp, (profiles_count, rules_count))
         except Exception as e:
+            profiles_count = rules_count = 0
             logger.debug(f"Failed to parse datastream XML: {e}")
 
         return DatastreamInfo(
@@ -212,13 +572,12 @@ class BuildArtifactsDiscovery:
         logger.debug(f"Searching rendered content: query={query}, product={product}")
 
         results = []
-        query_lower = query.lower()
+        # Compiled once and reused for every file; matching is case-insensitive
+        query_pattern = re.compile(re.escape(query), re.IGNORECASE)
 
-        # Determine which products to search
-        if product:
-            products = [product]
-        else:
-            products = self.list_built_products()
+        # Determine which products to search; built products are discovered lazily so
+        # that a search which reaches its limit early does not inspect the rest
+        products = [product] if product else self._iter_built_products()
 
         # Search through build artifacts
         for prod in products:
@@ -226,86 +585,130 @@ class BuildArtifactsDiscovery:
             if not product_build:
                 continue
 
-            # Search in rule JSON files
-            rules_dir = product_build / "rules"
-            if rules_dir.exists():
-                for rule_json in rules_dir.glob("*.json"):
-                    try:
-                        content = rule_json.read_text()
-                        if query_lower in content.lower():
-                            # Extract snippet around match
-                            snippet = self._extract_snippet(content, query_lower)
-                            rule_id = rule_json.stem  # filename without .json
-                            results.append(
-                                RenderSearchResult(
-                                    rule_id=rule_id,
-                                    product=prod,
-                                    match_type="rule_json",
-                                    match_snippet=snippet,
-                                    file_path=str(rule_json.relative_to(self.content_repo.path)),
-                                )
-                            )
-                            if len(results) >= limit:
-                                return results
-                    except Exception as e:
-                        logger.debug(f"Failed to search in {rule_json}: {e}")
-
-            # Search in remediation files
-            fixes_dir = product_build / "fixes_from_templates"
-            if fixes_dir.exists():
-                for rem_file in fixes_dir.glob("**/*"):
-                    if not rem_file.is_file():
-                        continue
-                    # Skip if not a text file
-                    if rem_file.suffix not in [".sh", ".yml", ".yaml", ".pp", ".toml", ".anaconda"]:
-                        continue
-
-                    try:
-                        content = rem_file.read_text()
-                        if query_lower in content.lower():
-                            snippet = self._extract_snippet(content, query_lower)
-                            rule_id = rem_file.stem  # filename without extension
-                            rem_type = rem_file.parent.name  # bash, ansible, etc.
-                            results.append(
-                                RenderSearchResult(
-                                    rule_id=rule_id,
-                                    product=prod,
-                                    match_type=f"remediation_{rem_type}",
-                                    match_snippet=snippet,
-                                    file_path=str(rem_file.relative_to(self.content_repo.path)),
-                                )
+            for match_type, path in self._iter_search_targets(product_build):
+                try:
+                    content = _rendered_contents.read_text(path)
+                    match = query_pattern.search(content)
+                    if match:
+                        # Extract snippet around match
+                        results.append(
+                            RenderSearchResult(
+                                rule_id=path.stem,  # filename without extension
+                                product=prod,
+                                match_type=match_type,
+                                match_snippet=self._extract_snippet(content, match),
+                                file_path=str(path.relative_to(self.content_repo.path)),
                             )
-                            if len(results) >= limit:
-                                return results
-                    except Exception as e:
-                        logger.debug(f"Failed to search in {rem_file}: {e}")
-
-            # Search in OVAL files
-            oval_dir = product_build / "checks" / "oval"
-            if oval_dir.exists():
-                for oval_file in oval_dir.glob("*.xml"):
-                    try:
-                        content = oval_file.read_text()
-                        if query_lower in content.lower():
-                            snippet = self._extract_snippet(content, query_lower)
-                            rule_id = oval_file.stem
-                            results.append(
-                                RenderSearchResult(
-                                    rule_id=rule_id,
-                                    product=prod,
-                                    match_type="oval",
-                                    match_snippet=snippet,
-                                    file_path=str(oval_file.relative_to(self.content_repo.path)),
-                                )
-                            )
-                            if len(results) >= limit:
-                                return results
-                    except Exception as e:
-                        logger.debug(f"Failed to search in {oval_file}: {e}")
+                        )
+                        if len(results) >= limit:
+                            return results
+                except Exception as e:
+                    logger.debug(f"Failed to search in {path}: {e}")
 
         logger.info(f"Found {len(results)} matches in rendered content")
         return results
 
+    def _iter_search_targets(self, product_build: Path) -> Iterator[tuple[str, Path]]:
+        """Yield the rendered artifacts of a product build that are searched.
+
+        Takes directory listings from the rendered artifact index, so no directory is
+        listed or file stat'ed more than once per search.
+
+        Args:
+            product_build: Product build directory
+
+        Yields:
+            Tuples of (match type, file path): rule JSON files, then remediations
+            (match type "remediation_<type>"), then OVAL checks
+        """
+        rules_dir = product_build / "rules"
+        for name in sorted(self._indexed_files(rules_dir)):
+            if name.endswith(".json"):
+                yield "rule_json", rules_dir / name
+
+        fixes_dir = product_build / "fixes_from_templates"
+        for rem_type in self._indexed_subdirs(fixes_dir):
+            rem_dir = fixes_dir / rem_type
+            for name in sorted(self._indexed_files(rem_dir)):
+                # Skip if not a text file
+                if os.path.splitext(name)[1] in REMEDIATION_SUFFIXES:
+                    yield f"remediation_{rem_type}", rem_dir / name
+
+        oval_dir = product_build / "checks" / "oval"
+        for name in sorted(self._indexed_files(oval_dir)):
+            if name.endswith(".xml"):
+                yield "oval", oval_dir / name
+
+    def _map_products(self, func: Callable[[str], T], products: list[str]) -> dict[str, T]:
+        """Run a per-product lookup for several products on a thread pool.
+
+        The lookups are dominated by file reads and XML parsing, which release the GIL.
+
+        Args:
+            func: Lookup to run for each product
+            products: Product identifiers
+
+        Returns:
+            Dict mapping each product to its lookup result, in input order
+        """
+        if len(products) <= 1:
+            return {product: func(product) for product in products}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PRODUCT_WORKERS, len(products))) as executor:
+            return dict(zip(products, executor.map(func, products), strict=True))
+
+    def _index_directory(self, directory: Path) -> tuple[frozenset[str], tuple[str, ...]]:
+        """Get the indexed listing of a rendered artifact directory.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            Tuple of (file names, sorted subdirectory names); empty if missing
+        """
+        try:
+            mtime = directory.stat().st_mtime_ns
+            cached = _rendered_index.get(directory)
+            if cached and cached[0] == mtime:
+                return cached[1], cached[2]
+
+            files = []
+            subdirs = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+        except OSError:
+            return frozenset(), ()
+
+        listing = (frozenset(files), tuple(sorted(subdirs)))
+        _rendered_index[directory] = (mtime, *listing)
+        return listing
+
+    def _indexed_files(self, directory: Path) -> frozenset[str]:
+        """Get names of the files in a rendered artifact directory.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            Set of file names (empty if the directory does not exist)
+        """
+        return self._index_directory(directory)[0]
+
+    def _indexed_subdirs(self, directory: Path) -> tuple[str, ...]:
+        """Get names of the subdirectories of a rendered artifact directory.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            Sorted subdirectory names (empty if the directory does not exist)
+        """
+        return self._index_directory(directory)[1]
+
     def _is_product_build_dir(self, path: Path) -> bool:
         """Check if a directory looks like a product build directory.
 
@@ -315,39 +718,34 @@ class BuildArtifactsDiscovery:
         Returns:
             True if it appears to be a product build
         """
-        # Look for common build artifacts
-        indicators = [
-            "ssg-*.xml",  # Datastreams
-            "guides/",  # HTML guides
-            "ansible/",  # Ansible playbooks
-            "bash/",  # Bash scripts
-            "rules/",  # Rules directory
-        ]
-
-        for indicator in indicators:
-            if list(path.glob(indicator)):
-                return True
+        # Look for common build artifacts in a single directory read: datastreams
+        # (ssg-*.xml) or one of the artifact subdirectories
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("ssg-") and name.endswith(".xml"):
+                        return True
+                    if name in PRODUCT_BUILD_SUBDIRS and entry.is_dir():
+                        return True
+        except OSError:
+            return False
 
         return False
 
-    def _extract_snippet(self, content: str, query: str, context_chars: int = 100) -> str:
+    def _extract_snippet(self, content: str, match: re.Match, context_chars: int = 100) -> str:
         """Extract a snippet around the search match.
 
         Args:
             content: Full content
-            query: Search query (lowercase)
+            match: Match of the search query in content
             context_chars: Characters of context on each side
 
         Returns:
             Snippet with surrounding context
         """
-        content_lower = content.lower()
-        pos = content_lower.find(query)
-        if pos == -1:
-            return ""
-
-        start = max(0, pos - context_chars)
-        end = min(len(content), pos + len(query) + context_chars)
+        start = max(0, match.start() - context_chars)
+        end = min(len(content), match.end() + context_chars)
 
         snippet = content[start:end]
         if start > 0:
@@ -365,8 +763,16 @@ def list_built_products() -> list[str]:
     Returns:
         List of product identifiers
     """
-    discovery = BuildArtifactsDiscovery()
-    return discovery.list_built_products()
+    return shared_instance(BuildArtifactsDiscovery).list_built_products()
+
+
+def list_built_products_with_info() -> list[DatastreamInfo]:
+    """List built products with their datastream information.
+
+    Returns:
+        List of DatastreamInfo objects
+    """
+    return shared_instance(BuildArtifactsDiscovery).list_built_products_with_info()
 
 
 def get_rendered_rule(product: str, rule_id: str) -> RenderedRule | None:
@@ -379,8 +785,75 @@ def get_rendered_rule(product: str, rule_id: str) -> RenderedRule | None:
     Returns:
         RenderedRule or None if not found
     """
-    discovery = BuildArtifactsDiscovery()
-    return discovery.get_rendered_rule(product, rule_id)
+    return shared_instance(BuildArtifactsDiscovery).get_rendered_rule(product, rule_id)
+
+
+def get_rendered_rules_batch(products: list[str], rule_id: str) -> dict[str, RenderedRule | None]:
+    """Get rendered rule content for several products.
+
+    Args:
+        products: Product identifiers
+        rule_id: Rule identifier
+
+    Returns:
+        Dict mapping each product to its RenderedRule (or None if not found)
+    """
+    return shared_instance(BuildArtifactsDiscovery).get_rendered_rules_batch(products, rule_id)
+
+
+def _render_rule_yaml(rule_json_path: Path) -> str:
+    """Convert a rendered rule JSON back to YAML, for consistency with rule.yml.
+
+    Args:
+        rule_json_path: Rendered rule JSON file
+
+    Returns:
+        Rendered YAML
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    content = _rendered_contents.read_text(rule_json_path)
+    rule_data = orjson.loads(content) if orjson is not None else json.loads(content)
+    return safe_dump(rule_data, default_flow_style=False, sort_keys=False)
+
+
+def _count_profiles_and_rules(f: BinaryIO) -> tuple[int, int]:
+    """Count XCCDF profiles and rules in a datastream without keeping its tree.
+
+    Uses lxml's C parser, which only reports the two tags of interest and lets already
+    counted elements be dropped from the tree, when lxml is installed.
+
+    Args:
+        f: Datastream file opened in binary mode
+
+    Returns:
+        Tuple of (profiles count, rules count)
+    """
+    profiles_count = 0
+    rules_count = 0
+    if etree is not None:
+        for _, element in etree.iterparse(
+            f, events=("end",), tag=(XCCDF_PROFILE_TAG, XCCDF_RULE_TAG)
+        ):
+            if element.tag == XCCDF_PROFILE_TAG:
+                profiles_count += 1
+            else:
+                rules_count += 1
+            element.clear(keep_tail=True)
+            # Drop finished siblings too, so the partial tree stays small
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        return profiles_count, rules_count
+
+    for _, element in ET.iterparse(f, events=("end",)):
+        if element.tag == XCCDF_PROFILE_TAG:
+            profiles_count += 1
+        elif element.tag == XCCDF_RULE_TAG:
+            rules_count += 1
+        element.clear()
+    return profiles_count, rules_count
 
 
 def get_datastream_info(product: str) -> DatastreamInfo | None:
@@ -392,8 +865,7 @@ def get_datastream_info(product: str) -> DatastreamInfo | None:
     Returns:
         DatastreamInfo or None if not found
     """
-    discovery = BuildArtifactsDiscovery()
-    return discovery.get_datastream_info(product)
+    return shared_instance(BuildArtifactsDiscovery).get_datastream_info(product)
 
 
 def search_rendered_content(
@@ -409,5 +881,4 @@ def search_rendered_content(
     Returns:
         List of RenderSearchResult objects
     """
-    discovery = BuildArtifactsDiscovery()
-    return discovery.search_rendered_content(query, product, limit)
+    return shared_instance(BuildArtifactsDiscovery).search_rendered_content(query, product, limit)
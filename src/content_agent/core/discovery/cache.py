@@ -0,0 +1,54 @@
+"""Helpers shared by the discovery caches."""
+
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from content_agent.core.integration import ContentRepository, get_content_repository
+
+# Stamp of a path that does not exist
+MISSING_STAMP = (-1, -1)
+
+
+class _Discovery(Protocol):
+    """A discovery class bound to a content repository."""
+
+    content_repo: ContentRepository
+
+
+DiscoveryT = TypeVar("DiscoveryT", bound=_Discovery)
+
+# Instances shared by the module-level discovery functions, keyed by class. Each is bound
+# to the content repository it was created for, and replaced once the repository is
+# re-initialized
+_shared_instances: dict[type, Any] = {}
+
+
+def shared_instance(cls: type[DiscoveryT]) -> DiscoveryT:
+    """Get the shared instance of a discovery class for the current content repository.
+
+    Args:
+        cls: Discovery class, constructed without arguments
+
+    Returns:
+        Instance of cls bound to the current content repository
+    """
+    instance: DiscoveryT | None = _shared_instances.get(cls)
+    if instance is None or instance.content_repo is not get_content_repository():
+        instance = _shared_instances[cls] = cls()
+    return instance
+
+
+def file_stamp(path: Path) -> tuple[int, int]:
+    """Get the (mtime ns, size) of a path used to validate cached data.
+
+    Args:
+        path: File or directory path
+
+    Returns:
+        Tuple of (st_mtime_ns, st_size), or MISSING_STAMP if the path does not exist
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return MISSING_STAMP
+    return st.st_mtime_ns, st.st_size
@@ -1,15 +1,30 @@
 """Control framework discovery implementation."""
 
 import logging
+import os
+import re
+from collections import OrderedDict
 from pathlib import Path
 
-import yaml
-
+from content_agent.core.discovery.cache import MISSING_STAMP, file_stamp, shared_instance
 from content_agent.core.integration import get_content_repository
+from content_agent.core.yaml_loader import safe_load
 from content_agent.models.control import ControlFile, ControlRequirement
 
 logger = logging.getLogger(__name__)
 
+# Sorted control framework names keyed by controls directory, tagged with the
+# directory mtime (ns) they were listed at so additions/removals invalidate them
+_list_cache: dict[Path, tuple[int, list[str]]] = {}
+
+# LRU of parsed control files keyed by path, tagged with the (mtime ns, size) of the
+# control file and of each included requirement file at parse time. Callers may pass
+# paths outside the repository (e.g. files under review), hence the bound
+_CONTROL_FILE_CACHE_SIZE = 128
+_control_file_cache: OrderedDict[
+    Path, tuple[tuple[tuple[Path, tuple[int, int]], ...], ControlFile]
+] = OrderedDict()
+
 
 class ControlDiscovery:
     """Control framework discovery."""
@@ -25,18 +40,28 @@ class ControlDiscovery:
             List of control framework names
         """
         logger.debug("Listing control frameworks")
-        controls = []
 
         controls_dir = self.content_repo.path / "controls"
-        if not controls_dir.exists():
+        try:
+            mtime = controls_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        for control_file in controls_dir.glob("*.yml"):
-            controls.append(control_file.stem)
+        cached = _list_cache.get(controls_dir)
+        if cached and cached[0] == mtime:
+            return list(cached[1])
+
+        with os.scandir(controls_dir) as entries:
+            controls = [
+                entry.name[:-4]
+                for entry in entries
+                if entry.name.endswith(".yml") and entry.is_file()
+            ]
 
         controls.sort()
+        _list_cache[controls_dir] = (mtime, controls)
         logger.info(f"Found {len(controls)} control frameworks")
-        return controls
+        return list(controls)
 
     def get_control_details(self, control_id: str) -> ControlFile | None:
         """Parse and return complete control file details.
@@ -67,9 +92,28 @@ class ControlDiscovery:
         Returns:
             ControlFile object, or None if parsing fails
         """
+        control_file = self._load_control_file(file_path)
+        # The cached model is shared, so callers get their own copy to modify
+        return control_file.model_copy(deep=True) if control_file else None
+
+    def _load_control_file(self, file_path: Path) -> ControlFile | None:
+        """Parse a control file through the parse cache.
+
+        Args:
+            file_path: Path to control file
+
+        Returns:
+            Cached ControlFile object (not to be modified), or None if parsing fails
+        """
+        cached = _control_file_cache.get(file_path)
+        if cached and all(file_stamp(path) == stamp for path, stamp in cached[0]):
+            _control_file_cache.move_to_end(file_path)
+            return cached[1]
+
         try:
+            stamps = [(file_path, file_stamp(file_path))]
             with open(file_path) as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
 
             # Parse included files if present
             if "includes" in data and data["includes"]:
@@ -79,17 +123,25 @@ class ControlDiscovery:
 
                 for include_path in data["includes"]:
                     full_path = base_dir / include_path
-                    if full_path.exists():
-                        req = self._parse_requirement_file(full_path)
-                        if req:
-                            controls.append(req)
-                    else:
+                    stamp = file_stamp(full_path)
+                    stamps.append((full_path, stamp))
+                    # The stamp doubles as the existence check, saving a second stat
+                    if stamp == MISSING_STAMP:
                         logger.warning(f"Included file not found: {full_path}")
+                        continue
+                    req = self._parse_requirement_file(full_path)
+                    if req:
+                        controls.append(req)
 
                 data["controls"] = controls
 
             # Parse control file
-            return ControlFile(**data)
+            control_file = ControlFile(**data)
+            _control_file_cache[file_path] = (tuple(stamps), control_file)
+            _control_file_cache.move_to_end(file_path)
+            if len(_control_file_cache) > _CONTROL_FILE_CACHE_SIZE:
+                _control_file_cache.popitem(last=False)
+            return control_file
 
         except Exception as e:
             logger.error(f"Failed to parse control file {file_path}: {e}")
@@ -114,26 +166,38 @@ class ControlDiscovery:
         results = []
 
         # Determine which controls to search
+        # Controls are only read here, so the cached models are searched without copying
+        # them; the matching requirements are copied below
+        controls_dir = self.content_repo.path / "controls"
         if control_id:
-            control = self.get_control_details(control_id)
+            control_path = controls_dir / f"{control_id}.yml"
+            control = self._load_control_file(control_path) if control_path.exists() else None
             controls_to_search = [control] if control else []
         else:
-            control_ids = self.list_controls()
-            controls_to_search = [self.get_control_details(cid) for cid in control_ids]
-            controls_to_search = [c for c in controls_to_search if c is not None]
-
-        # Search through controls
-        query_lower = query.lower()
+            # The (cached) listing only names existing files, so they are parsed directly
+            # (through the parse cache) without another existence check per control
+            controls_to_search = [
+                control
+                for control in (
+                    self._load_control_file(controls_dir / f"{cid}.yml")
+                    for cid in self.list_controls()
+                )
+                if control is not None
+            ]
+
+        # Search through controls; one case-insensitive pattern instead of
+        # lowercased copies of every field
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
 
         for control in controls_to_search:
             for req in control.controls:
                 # Search in title and description
                 if (
-                    query_lower in req.title.lower()
-                    or query_lower in req.description.lower()
-                    or query_lower in req.id.lower()
+                    pattern.search(req.title)
+                    or pattern.search(req.description)
+                    or pattern.search(req.id)
                 ):
-                    results.append(req)
+                    results.append(req.model_copy(deep=True))
 
         logger.info(f"Found {len(results)} matching requirements")
         return results
@@ -149,7 +213,7 @@ class ControlDiscovery:
         """
         try:
             with open(file_path) as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
 
             return ControlRequirement(**data)
 
@@ -164,7 +228,7 @@ def list_controls() -> list[str]:
     Returns:
         List of control framework names
     """
-    discovery = ControlDiscovery()
+    discovery = shared_instance(ControlDiscovery)
     return discovery.list_controls()
 
 
@@ -177,7 +241,7 @@ def get_control_details(control_id: str) -> ControlFile | None:
     Returns:
         ControlFile with details, or None if not found
     """
-    discovery = ControlDiscovery()
+    discovery = shared_instance(ControlDiscovery)
     return discovery.get_control_details(control_id)
 
 
@@ -191,5 +255,5 @@ def search_controls(query: str, control_id: str | None = None) -> list[ControlRe
     Returns:
         List of matching requirements
     """
-    discovery = ControlDiscovery()
+    discovery = shared_instance(ControlDiscovery)
     return discovery.search_controls(query, control_id)
@@ -1,15 +1,24 @@
 """Product discovery implementation."""
 
 import logging
+import os
 from pathlib import Path
 
-import yaml
-
+from content_agent.core.discovery.cache import file_stamp, shared_instance
 from content_agent.core.integration import get_content_repository, get_ssg_modules
+from content_agent.core.yaml_loader import safe_load
 from content_agent.models import ProductDetails, ProductStats, ProductSummary
 
 logger = logging.getLogger(__name__)
 
+# Product summaries keyed by product.yml path, tagged with the (mtime_ns, size) of the
+# file they were parsed from
+_summary_cache: dict[Path, tuple[tuple[int, int], ProductSummary]] = {}
+
+# Product details keyed by product.yml path, tagged with the (mtime_ns, size) of the file
+# and the mtime (ns) of the product's profiles directory, which details list
+_details_cache: dict[Path, tuple[tuple[int, int, int], ProductDetails]] = {}
+
 
 class ProductDiscovery:
     """Product discovery and information retrieval."""
@@ -18,7 +27,6 @@ class ProductDiscovery:
         """Initialize product discovery."""
         self.content_repo = get_content_repository()
         self.ssg = get_ssg_modules()
-        self._product_cache: dict | None = None
 
     def list_products(self) -> list[ProductSummary]:
         """List all available products.
@@ -39,12 +47,21 @@ class ProductDiscovery:
                 continue
 
             product_yml = product_dir / "product.yml"
-            if not product_yml.exists():
+            try:
+                stat = product_yml.stat()
+            except FileNotFoundError:
+                continue
+
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _summary_cache.get(product_yml)
+            if cached and cached[0] == stamp:
+                products.append(cached[1])
                 continue
 
             try:
                 summary = self._load_product_summary(product_dir.name, product_yml)
                 if summary:
+                    _summary_cache[product_yml] = (stamp, summary)
                     products.append(summary)
             except Exception as e:
                 logger.warning(f"Failed to load product {product_dir.name}: {e}")
@@ -72,15 +89,22 @@ class ProductDiscovery:
             return None
 
         product_yml = product_dir / "product.yml"
-        if not product_yml.exists():
+        try:
+            stat = product_yml.stat()
+        except FileNotFoundError:
             logger.warning(f"product.yml not found for {product_id}")
             return None
 
+        stamp = (stat.st_mtime_ns, stat.st_size, file_stamp(product_dir / "profiles")[0])
+        cached = _details_cache.get(product_yml)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
         try:
             # Note: safe_load is appropriate here - product.yml files do not contain
             # Jinja2 macros per ComplianceAsCode ADR-0002 (Jinja2 Boundaries)
             with open(product_yml) as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
 
             # Get profiles
             profiles = self._get_product_profiles(product_id)
@@ -105,6 +129,7 @@ class ProductDiscovery:
             )
 
             logger.debug(f"Loaded details for product {product_id}")
+            _details_cache[product_yml] = (stamp, details)
             return details
 
         except Exception as e:
@@ -125,7 +150,7 @@ class ProductDiscovery:
             # Note: safe_load is appropriate here - product.yml files do not contain
             # Jinja2 macros per ComplianceAsCode ADR-0002 (Jinja2 Boundaries)
             with open(product_yml) as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
 
             return ProductSummary(
                 product_id=product_id,
@@ -149,14 +174,18 @@ class ProductDiscovery:
         """
         profiles_dir = self.content_repo.path / "products" / product_id / "profiles"
 
-        if not profiles_dir.exists():
+        try:
+            with os.scandir(profiles_dir) as entries:
+                profile_ids = [
+                    entry.name[: -len(".profile")]
+                    for entry in entries
+                    if entry.name.endswith(".profile")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
 
-        profile_ids = []
-        for profile_file in profiles_dir.glob("*.profile"):
-            profile_id = profile_file.stem
-            profile_ids.append(profile_id)
-
         return sorted(profile_ids)
 
     def _calculate_product_stats(self, product_id: str) -> ProductStats | None:
@@ -193,8 +222,7 @@ def list_products() -> list[ProductSummary]:
     Returns:
         List of ProductSummary objects
     """
-    discovery = ProductDiscovery()
-    return discovery.list_products()
+    return shared_instance(ProductDiscovery).list_products()
 
 
 def get_product_details(product_id: str) -> ProductDetails | None:
@@ -206,5 +234,4 @@ def get_product_details(product_id: str) -> ProductDetails | None:
     Returns:
         ProductDetails or None if not found
     """
-    discovery = ProductDiscovery()
-    return discovery.get_product_details(product_id)
+    return shared_instance(ProductDiscovery).get_product_details(product_id)
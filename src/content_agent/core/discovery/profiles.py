@@ -1,13 +1,38 @@
 """Profile discovery implementation."""
 
 import logging
+import re
 from pathlib import Path
+from typing import Any
 
+from content_agent.core.discovery.cache import shared_instance
 from content_agent.core.integration import get_content_repository
 from content_agent.models import ProfileDetails, ProfileSummary
 
 logger = logging.getLogger(__name__)
 
+# The profile patterns start with the newline before a line, a literal the regex engine
+# scans for quickly, instead of a multiline "^"; the parser prepends a newline so the
+# first line is matched as well
+
+# Top-level profile keys read by the parser, with their stripped inline values
+_PROFILE_KEY_RE = re.compile(
+    r"\n(title|description|extends|selections|controls):[^\S\n]*((?:\S(?:.*\S)?)?)"
+)
+
+# Top-level keys that may appear inside a description or selections block without
+# ending it
+_INLINE_KEYS = r"(?:title|extends|controls|documentation_complete):"
+
+# Newline before the first line ending a block; blank lines and top-level comments never
+# do. Descriptions continue with indented lines, selections with list items
+_DESCRIPTION_END_RE = re.compile(rf"\n(?![^\S\n]|#|$|{_INLINE_KEYS})", re.M)
+_SELECTIONS_END_RE = re.compile(rf"\n(?![^\S\n]*(?:-|$)|#|{_INLINE_KEYS})", re.M)
+
+# Indented description lines and list items, stripped
+_DESCRIPTION_LINE_RE = re.compile(r"\n[ \t][^\S\n]*(\S(?:.*\S)?)")
+_SELECTION_RE = re.compile(r"\n[^\S\n]*-[^\S\n]*((?:\S(?:.*\S)?)?)")
+
 
 class ProfileDiscovery:
     """Profile discovery and information retrieval."""
@@ -162,58 +187,38 @@ class ProfileDiscovery:
         Returns:
             Parsed data dict
         """
-        data = {
+        data: dict[str, Any] = {
             "title": None,
             "description": None,
             "extends": None,
-            "selections": [],
             "variables": {},
             "controls": None,
         }
 
-        lines = content.split("\n")
-        current_section = None
-        description_lines = []
-
-        for line in lines:
-            line = line.rstrip()
-
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse key-value pairs
-            if line.startswith("documentation_complete:"):
-                continue
-            elif line.startswith("title:"):
-                data["title"] = line.split(":", 1)[1].strip().strip("'\"")
-            elif line.startswith("description:"):
-                desc = line.split(":", 1)[1].strip()
-                if desc:
-                    description_lines.append(desc.strip("'\""))
-                current_section = "description"
-            elif line.startswith("extends:"):
-                data["extends"] = line.split(":", 1)[1].strip()
-            elif line.startswith("selections:"):
-                current_section = "selections"
-            elif line.startswith("controls:"):
-                data["controls"] = line.split(":", 1)[1].strip()
-            elif current_section == "description":
-                # Multi-line description
-                if line.startswith(" ") or line.startswith("\t"):
-                    description_lines.append(line.strip())
-                else:
-                    current_section = None
-            elif current_section == "selections":
-                # Selection line (starts with -)
-                if line.strip().startswith("-"):
-                    selection = line.strip()[1:].strip()
-                    # Handle !unselect
-                    if selection.startswith("!unselect"):
-                        continue
-                    data["selections"].append(selection)
-                else:
-                    current_section = None
+        description_lines: list[str] = []
+        selections: list[str] = []
+
+        content = "\n" + content
+        for match in _PROFILE_KEY_RE.finditer(content):
+            key, value = match.groups()
+            if key == "title":
+                data["title"] = value.strip("'\"")
+            elif key in ("extends", "controls"):
+                data[key] = value
+            elif key == "description":
+                if value:
+                    description_lines.append(value.strip("'\""))
+                block = _section_block(content, match.end(), _DESCRIPTION_END_RE)
+                description_lines.extend(_DESCRIPTION_LINE_RE.findall(block))
+            else:
+                block = _section_block(content, match.end(), _SELECTIONS_END_RE)
+                selections.extend(
+                    selection
+                    for selection in _SELECTION_RE.findall(block)
+                    if not selection.startswith("!unselect")
+                )
+
+        data["selections"] = selections
 
         # Join description lines
         if description_lines:
@@ -222,6 +227,21 @@ class ProfileDiscovery:
         return data
 
 
+def _section_block(content: str, start: int, end_re: re.Pattern[str]) -> str:
+    """Get the lines of a description or selections block.
+
+    Args:
+        content: Profile file content
+        start: Offset of the end of the block's key line
+        end_re: Pattern matching the newline before the first line after the block
+
+    Returns:
+        Block content, starting with the newline ending the key line
+    """
+    end = end_re.search(content, start)
+    return content[start : end.start() if end else len(content)]
+
+
 def list_profiles(product: str | None = None) -> list[ProfileSummary]:
     """List profiles for a product or all products.
 
@@ -231,8 +251,7 @@ def list_profiles(product: str | None = None) -> list[ProfileSummary]:
     Returns:
         List of ProfileSummary objects
     """
-    discovery = ProfileDiscovery()
-    return discovery.list_profiles(product)
+    return shared_instance(ProfileDiscovery).list_profiles(product)
 
 
 def get_profile_details(profile_id: str, product: str) -> ProfileDetails | None:
@@ -245,5 +264,4 @@ def get_profile_details(profile_id: str, product: str) -> ProfileDetails | None:
     Returns:
         ProfileDetails or None if not found
     """
-    discovery = ProfileDiscovery()
-    return discovery.get_profile_details(profile_id, product)
+    return shared_instance(ProfileDiscovery).get_profile_details(profile_id, product)
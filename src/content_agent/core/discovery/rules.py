@@ -9,13 +9,21 @@ These are used throughout rule.yml files and are expanded at build time.
 See docs/COMPLIANCEASCODE_REFERENCE.md for more details.
 """
 
+import hashlib
+import json
 import logging
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-
-from content_agent.core.integration import get_content_repository
+from content_agent.core.discovery.cache import file_stamp, shared_instance
+from content_agent.core.integration import ContentRepository, get_content_repository
+from content_agent.core.yaml_loader import safe_load
 from content_agent.models import (
     RuleDetails,
     RuleIdentifiers,
@@ -24,8 +32,54 @@ from content_agent.models import (
     RuleSearchResult,
 )
 
+if TYPE_CHECKING:
+    from content_agent.core.discovery.build_artifacts import BuildArtifactsDiscovery
+
 logger = logging.getLogger(__name__)
 
+# LRU of get_rule_details() results without rendered content, keyed by (repository path,
+# rule ID). Each entry records the stamp of the rule directory (see _rule_dir_stamp) it
+# was loaded at, and is discarded once it changes. Rendered content is looked up on every
+# call, from the build artifact caches that validate themselves
+_RULE_DETAILS_CACHE_SIZE = 1024
+_rule_details_cache: OrderedDict[tuple[Path, str], tuple[tuple[int, ...], RuleDetails]] = (
+    OrderedDict()
+)
+
+# LRU of parsed rule.yml data keyed by path, tagged with the (mtime ns, size) of the file
+# at parse time, shared by searches and get_rule_details(). The parsed data is treated
+# as read-only; a rule parses to a few KB, so a full cache stays in the tens of MB
+_RULE_DATA_CACHE_SIZE = 4096
+_rule_data_cache: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+
+# Search results and their lowercased search text keyed by rule.yml path, tagged with the
+# (mtime ns, size) of the file at parse time; a None result records a rule.yml that
+# failed to load
+_search_results: dict[Path, tuple[tuple[int, int], tuple[RuleSearchResult | None, str]]] = {}
+
+# Upper bound on threads scanning rule directory subtrees, and how many directory levels
+# below the search roots may be expanded to split the scan into subtrees
+MAX_INDEX_WORKERS = 8
+INDEX_SPLIT_DEPTH = 3
+
+# Thread pool scanning the subtrees, created on first use and kept for later index builds
+# (which refresh_index() makes frequent) so they don't pay for starting threads
+_index_executor: ThreadPoolExecutor | None = None
+
+# Record of a scanned rule tree directory: its mtime (ns) at scan time, its subdirectories
+# and whether it holds a rule.yml
+_DirRecord = tuple[int, tuple[str, ...], bool]
+
+# Scanned rule directory trees keyed by repository path, mapping each directory path to
+# its record, so later index builds stat every directory but only list the ones that
+# changed
+_rule_trees: dict[Path, dict[str, _DirRecord]] = {}
+
+# Directory of the JSON snapshots of scanned rule trees, reused across processes
+# (disabled if None)
+_RULE_INDEX_VERSION = 1
+_rule_index_cache_dir: Path | None = None
+
 
 class RuleDiscovery:
     """Rule discovery and information retrieval."""
@@ -35,6 +89,22 @@ class RuleDiscovery:
         self.content_repo = get_content_repository()
         self._rule_cache: dict[str, Path] | None = None
 
+    def set_content_path(self, content_path: Path) -> None:
+        """Point discovery at another content repository checkout.
+
+        Args:
+            content_path: Path to a ComplianceAsCode content repository
+        """
+        self.content_repo = ContentRepository(content_path)
+        self._rule_cache = None
+
+    def refresh_index(self) -> None:
+        """Rebuild the rule index to pick up rules added, moved or removed since it was built.
+
+        Only directories modified since the previous scan are listed again.
+        """
+        self._build_rule_index()
+
     def search_rules(
         self,
         query: str | None = None,
@@ -66,30 +136,15 @@ class RuleDiscovery:
         query_lower = query.lower() if query else None
 
         for rule_id, rule_path in self._rule_cache.items():
-            # Quick ID match
-            if query_lower and query_lower in rule_id.lower():
-                result = self._load_search_result(rule_id, rule_path)
-                if result and self._matches_filters(result, product, severity):
-                    results.append(result)
-                    if len(results) >= limit:
-                        break
+            result, searchable = self._load_search_entry(rule_id, rule_path)
+            if result is None:
                 continue
-
-            # Load rule for full-text search
-            if query_lower:
-                result = self._load_search_result(rule_id, rule_path)
-                if result and self._matches_query(result, query_lower):
-                    if self._matches_filters(result, product, severity):
-                        results.append(result)
-                        if len(results) >= limit:
-                            break
-            else:
-                # No query, just filter
-                result = self._load_search_result(rule_id, rule_path)
-                if result and self._matches_filters(result, product, severity):
-                    results.append(result)
-                    if len(results) >= limit:
-                        break
+            if query_lower and query_lower not in searchable:
+                continue
+            if self._matches_filters(result, product, severity):
+                results.append(result)
+                if len(results) >= limit:
+                    break
 
         logger.info(f"Found {len(results)} rules matching search criteria")
         return results
@@ -129,10 +184,7 @@ class RuleDiscovery:
             return None
 
         try:
-            # Load YAML with Jinja2 templates
-            with open(rule_path) as f:
-                content = f.read()
-                data = yaml.load(content, Loader=yaml.FullLoader)
+            data = _load_rule_data(rule_path)
 
             rule_dir = rule_path.parent
 
@@ -145,11 +197,14 @@ class RuleDiscovery:
             # Extract products from identifiers
             products = self._extract_products_from_identifiers(data)
 
+            # List the rule directory once for the remediation and check probes
+            rule_dir_entries = _list_dir(rule_dir)
+
             # Detect available remediations
-            remediations = self._detect_remediations(rule_dir)
+            remediations = self._detect_remediations(rule_dir, rule_dir_entries)
 
             # Detect available checks
-            checks = self._detect_checks(rule_dir)
+            checks = self._detect_checks(rule_dir_entries)
 
             # Find test scenarios
             test_scenarios = self._find_test_scenarios(rule_dir)
@@ -189,7 +244,9 @@ class RuleDiscovery:
 
             # Include rendered content if requested
             if include_rendered:
-                rendered_content = self._get_rendered_content(rule_id, product, rendered_detail)
+                rendered_content = self._get_rendered_content(
+                    rule_id, product, rendered_detail, self._parse_prodtype(data)
+                )
                 if rendered_content:
                     details.rendered = rendered_content
 
@@ -212,39 +269,86 @@ class RuleDiscovery:
             self.content_repo.path / "shared",
         ]
 
-        for search_path in search_paths:
-            if not search_path.exists():
-                continue
+        repo_path = self.content_repo.path
+        previous = _load_rule_tree(repo_path)
+        tree: dict[str, _DirRecord] = {}
+
+        # The top directory levels are expanded in walk order into rule files and
+        # subtrees until there are enough subtrees to spread over the workers, which then
+        # scan them concurrently, since listing and stat'ing directories releases the GIL
+        entries = [(False, str(search_path)) for search_path in search_paths]
+        for _ in range(INDEX_SPLIT_DEPTH):
+            expanded = []
+            for is_rule_file, path in entries:
+                record = None if is_rule_file else _scan_dir(path, previous)
+                if record is None:
+                    if is_rule_file:
+                        expanded.append((True, path))
+                    continue
+                tree[path] = record
+                if record[2]:
+                    expanded.append((True, os.path.join(path, "rule.yml")))
+                expanded.extend((False, subdir) for subdir in record[1])
+            entries = expanded
+            if sum(not is_rule_file for is_rule_file, _ in entries) >= 4 * MAX_INDEX_WORKERS:
+                break
+
+        def scan_subtree(path: str) -> tuple[list[str], dict[str, _DirRecord]]:
+            subtree: dict[str, _DirRecord] = {}
+            return list(_iter_rule_files(path, previous, subtree)), subtree
+
+        subtrees = [path for is_rule_file, path in entries if not is_rule_file]
+        # A single subtree gains nothing from the pool
+        scans: Iterator[tuple[list[str], dict[str, _DirRecord]]]
+        if len(subtrees) <= 1:
+            scans = map(scan_subtree, subtrees)
+        else:
+            scans = _get_index_executor().map(scan_subtree, subtrees)
+        for is_rule_file, path in entries:
+            if is_rule_file:
+                rule_files = [path]
+            else:
+                rule_files, subtree = next(scans)
+                tree.update(subtree)
+            for rule_yml in rule_files:
+                rule_id = os.path.basename(os.path.dirname(rule_yml))
+                self._rule_cache[rule_id] = Path(rule_yml)
 
-            for rule_yml in search_path.rglob("rule.yml"):
-                rule_dir = rule_yml.parent
-                rule_id = rule_dir.name
-                self._rule_cache[rule_id] = rule_yml
+        _rule_trees[repo_path] = tree
+        if tree != previous:
+            _save_rule_tree(repo_path, tree)
 
         logger.info(f"Indexed {len(self._rule_cache)} rules")
 
-    def _load_search_result(self, rule_id: str, rule_path: Path) -> RuleSearchResult | None:
-        """Load rule as search result.
+    def _load_search_entry(
+        self, rule_id: str, rule_path: Path
+    ) -> tuple[RuleSearchResult | None, str]:
+        """Load rule as search result, together with the text queries are matched against.
+
+        Entries are reused while rule.yml keeps its mtime and size, so repeated searches
+        only stat the rules they visit instead of parsing them again.
 
         Args:
             rule_id: Rule identifier
             rule_path: Path to rule.yml
 
         Returns:
-            RuleSearchResult or None
+            Tuple of (RuleSearchResult or None, lowercased rule id, title and description)
         """
+        stamp = file_stamp(rule_path)
+        cached = _search_results.get(rule_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        result = None
+        searchable = ""
         try:
-            # Load YAML with Jinja2 templates - use FullLoader to be more lenient
-            # This will leave Jinja2 templates as strings in the YAML
-            with open(rule_path) as f:
-                content = f.read()
-                # Try to load YAML - if it has Jinja2 templates, they'll be treated as strings
-                data = yaml.load(content, Loader=yaml.FullLoader)
+            data = _load_rule_data(rule_path, stamp)
 
             # Extract products from identifiers (e.g., cce@rhel8, stigid@rhel9)
             products = self._extract_products_from_identifiers(data)
 
-            return RuleSearchResult(
+            result = RuleSearchResult(
                 rule_id=rule_id,
                 title=data.get("title", rule_id),
                 severity=data.get("severity", "unknown"),
@@ -252,50 +356,47 @@ class RuleDiscovery:
                 products=products,
                 file_path=str(rule_path.relative_to(self.content_repo.path)),
             )
+            # Lowercased once here so queries are matched with a plain substring test;
+            # the separator keeps a query from matching across fields
+            searchable = f"{rule_id}\0{result.title}\0{result.description}".lower()
         except Exception as e:
             logger.debug(f"Failed to load search result for {rule_id}: {e}")
-            return None
 
-    def _extract_products_from_identifiers(self, data: dict) -> list[str]:
-        """Extract product list from identifiers and references.
+        _search_results[rule_path] = (stamp, (result, searchable))
+        return result, searchable
+
+    def _parse_prodtype(self, data: dict) -> set[str] | None:
+        """Parse the products a rule is restricted to.
 
         Args:
             data: Rule YAML data
 
         Returns:
-            List of product IDs
+            Set of product identifiers, or None if the rule has no prodtype
         """
-        products = set()
-
-        # Extract from identifiers (e.g., cce@rhel8)
-        identifiers = data.get("identifiers", {})
-        for key in identifiers.keys():
-            if "@" in key:
-                product = key.split("@")[1]
-                products.add(product)
-
-        # Extract from references (e.g., stigid@rhel9)
-        references = data.get("references", {})
-        for key in references.keys():
-            if "@" in key:
-                product = key.split("@")[1]
-                products.add(product)
-
-        return sorted(products)
+        prodtype = data.get("prodtype")
+        if not isinstance(prodtype, str) or not prodtype.strip():
+            return None
+        return {p.strip() for p in prodtype.split(",") if p.strip()}
 
-    def _matches_query(self, result: RuleSearchResult, query: str) -> bool:
-        """Check if result matches search query.
+    def _extract_products_from_identifiers(self, data: dict) -> list[str]:
+        """Extract product list from identifiers and references.
 
         Args:
-            result: Search result
-            query: Query string (lowercase)
+            data: Rule YAML data
 
         Returns:
-            True if matches
+            List of product IDs
         """
-        # Search in title and description
-        searchable = f"{result.title} {result.description}".lower()
-        return query in searchable
+        # Product-qualified keys of identifiers (e.g., cce@rhel8) and references
+        # (e.g., stigid@rhel9)
+        products = {
+            key.split("@", 2)[1]
+            for mapping in (data.get("identifiers", {}), data.get("references", {}))
+            for key in mapping
+            if "@" in key
+        }
+        return sorted(products)
 
     def _matches_filters(
         self, result: RuleSearchResult, product: str | None, severity: str | None
@@ -380,11 +481,12 @@ class RuleDiscovery:
             },
         )
 
-    def _detect_remediations(self, rule_dir: Path) -> dict[str, bool]:
+    def _detect_remediations(self, rule_dir: Path, entries: dict[str, bool]) -> dict[str, bool]:
         """Detect available remediations for a rule.
 
         Args:
             rule_dir: Rule directory path
+            entries: Listing of the rule directory from _list_dir()
 
         Returns:
             Dict mapping remediation type to availability
@@ -393,25 +495,22 @@ class RuleDiscovery:
         remediations = {}
 
         for rem_type in remediation_types:
-            rem_dir = rule_dir / rem_type
             # Check for directory with files, or .sh/.yml files
             has_remediation = False
-            if rem_dir.exists() and rem_dir.is_dir():
-                has_remediation = len(list(rem_dir.iterdir())) > 0
-            elif (rule_dir / f"{rem_type}.sh").exists():
-                has_remediation = True
-            elif (rule_dir / f"{rem_type}.yml").exists():
+            if entries.get(rem_type):
+                has_remediation = bool(_list_dir(rule_dir / rem_type))
+            elif f"{rem_type}.sh" in entries or f"{rem_type}.yml" in entries:
                 has_remediation = True
 
             remediations[rem_type] = has_remediation
 
         return remediations
 
-    def _detect_checks(self, rule_dir: Path) -> dict[str, bool]:
+    def _detect_checks(self, entries: dict[str, bool]) -> dict[str, bool]:
         """Detect available checks for a rule.
 
         Args:
-            rule_dir: Rule directory path
+            entries: Listing of the rule directory from _list_dir()
 
         Returns:
             Dict mapping check type to availability
@@ -419,8 +518,7 @@ class RuleDiscovery:
         checks = {}
 
         # OVAL checks
-        oval_dir = rule_dir / "oval"
-        checks["oval"] = oval_dir.exists() and oval_dir.is_dir()
+        checks["oval"] = entries.get("oval", False)
 
         # Other check types can be added here
 
@@ -435,21 +533,14 @@ class RuleDiscovery:
         Returns:
             List of test scenario names
         """
-        tests_dir = rule_dir / "tests"
-        if not tests_dir.exists():
-            return []
-
-        scenarios = []
-        for test_file in tests_dir.glob("*.sh"):
-            scenarios.append(test_file.name)
-
-        return sorted(scenarios)
+        return sorted(name for name in _list_dir(rule_dir / "tests") if name.endswith(".sh"))
 
     def _get_rendered_content(
         self,
         rule_id: str,
         product_filter: str | None = None,
         detail_level: str = "metadata",
+        prodtype: set[str] | None = None,
     ) -> dict[str, RuleRenderedContent] | None:
         """Get rendered content for a rule from build artifacts.
 
@@ -457,6 +548,7 @@ class RuleDiscovery:
             rule_id: Rule identifier
             product_filter: Optional product to filter by
             detail_level: "metadata" for sizes/availability only, "full" for complete content
+            prodtype: Products the rule is restricted to, or None if it is not restricted
 
         Returns:
             Dict of RuleRenderedContent by product, or None if no builds found
@@ -465,66 +557,70 @@ class RuleDiscovery:
             # Import here to avoid circular dependencies
             from content_agent.core.discovery import build_artifacts
 
-            # Get list of built products
-            built_products = build_artifacts.list_built_products()
+            if product_filter:
+                # A missing build for the requested product simply yields no rendered
+                # rule, so there is no need to enumerate every built product
+                built_products = [product_filter]
+            else:
+                built_products = build_artifacts.list_built_products()
+                # Products outside the rule's prodtype never render it
+                if prodtype is not None:
+                    built_products = [p for p in built_products if p in prodtype]
             if not built_products:
                 return None
 
-            # Filter by product if specified
-            if product_filter:
-                built_products = [p for p in built_products if p == product_filter]
-                if not built_products:
-                    return None
-
-            # Try to get rendered content for each product
+            artifacts = shared_instance(build_artifacts.BuildArtifactsDiscovery)
             rendered_dict = {}
-            for prod in built_products:
-                rendered = build_artifacts.get_rendered_rule(prod, rule_id)
-                if rendered:
-                    # Get datastream info for build time
-                    datastream_info = build_artifacts.get_datastream_info(prod)
-                    build_time = datastream_info.build_time if datastream_info else None
-
-                    # Calculate sizes and availability
-                    yaml_size = len(rendered.rendered_yaml) if rendered.rendered_yaml else 0
-                    oval_size = len(rendered.rendered_oval) if rendered.rendered_oval else 0
-                    remediation_sizes = {
-                        k: len(v) for k, v in rendered.rendered_remediations.items()
-                    }
-                    available_rems = list(rendered.rendered_remediations.keys())
-
-                    # For metadata mode, don't include the full content (save tokens!)
-                    if detail_level == "metadata":
-                        rendered_dict[prod] = RuleRenderedContent(
-                            product=prod,
-                            rendered_yaml=None,  # Exclude full content
-                            rendered_oval=None,  # Exclude full content
-                            rendered_remediations={},  # Exclude full content
-                            build_path=rendered.build_path,
-                            build_time=build_time,
-                            # Include metadata
-                            yaml_size=yaml_size,
-                            oval_size=oval_size,
-                            remediation_sizes=remediation_sizes,
-                            has_yaml=rendered.rendered_yaml is not None,
-                            has_oval=rendered.rendered_oval is not None,
-                            available_remediations=available_rems,
-                        )
-                    else:  # "full" mode
+            if detail_level == "metadata":
+                # Sizes come from the build artifacts without reading the full content
+                # (save tokens!)
+                metadata = artifacts.get_rendered_rule_metadata_batch(built_products, rule_id)
+                # Like full mode, skip products whose rendered rule could not be read, so
+                # both modes report the same products
+                readable = {
+                    prod: meta
+                    for prod, meta in metadata.items()
+                    if meta and meta.yaml_size is not None
+                }
+                build_times = _get_build_times(artifacts, list(readable))
+                for prod, meta in readable.items():
+                    rendered_dict[prod] = RuleRenderedContent(
+                        product=prod,
+                        rendered_yaml=None,
+                        rendered_oval=None,
+                        build_path=meta.build_path,
+                        build_time=build_times[prod],
+                        yaml_size=meta.yaml_size or 0,
+                        oval_size=meta.oval_size or 0,
+                        remediation_sizes=meta.remediation_sizes,
+                        has_yaml=meta.yaml_size is not None,
+                        has_oval=meta.oval_size is not None,
+                        available_remediations=list(meta.remediation_sizes),
+                    )
+            else:  # "full" mode
+                rendered_rules = artifacts.get_rendered_rules_batch(built_products, rule_id)
+                build_times = _get_build_times(
+                    artifacts, [p for p in built_products if rendered_rules[p]]
+                )
+                for prod in built_products:
+                    rendered = rendered_rules[prod]
+                    if rendered:
                         rendered_dict[prod] = RuleRenderedContent(
                             product=prod,
                             rendered_yaml=rendered.rendered_yaml,
                             rendered_oval=rendered.rendered_oval,
                             rendered_remediations=rendered.rendered_remediations,
                             build_path=rendered.build_path,
-                            build_time=build_time,
-                            # Also include metadata
-                            yaml_size=yaml_size,
-                            oval_size=oval_size,
-                            remediation_sizes=remediation_sizes,
+                            build_time=build_times[prod],
+                            # Also include metadata, in bytes as in metadata mode
+                            yaml_size=_byte_size(rendered.rendered_yaml),
+                            oval_size=_byte_size(rendered.rendered_oval),
+                            remediation_sizes={
+                                k: _byte_size(v) for k, v in rendered.rendered_remediations.items()
+                            },
                             has_yaml=rendered.rendered_yaml is not None,
                             has_oval=rendered.rendered_oval is not None,
-                            available_remediations=available_rems,
+                            available_remediations=list(rendered.rendered_remediations),
                         )
 
             return rendered_dict if rendered_dict else None
@@ -534,6 +630,34 @@ class RuleDiscovery:
             return None
 
 
+def _get_build_times(
+    artifacts: "BuildArtifactsDiscovery", products: list[str]
+) -> dict[str, datetime | None]:
+    """Get the datastream build time of each product concurrently.
+
+    Args:
+        artifacts: Build artifacts discovery
+        products: Product identifiers
+
+    Returns:
+        Dict of build time by product, None if the product has no datastream
+    """
+    datastream_infos = artifacts.get_datastream_info_batch(products)
+    return {p: info.build_time if info else None for p, info in datastream_infos.items()}
+
+
+def _byte_size(text: str | None) -> int:
+    """Get the size of rendered content in bytes, as reported for build artifacts.
+
+    Args:
+        text: Rendered content, or None if there is none
+
+    Returns:
+        Size of the UTF-8 encoded text, 0 for None
+    """
+    return len(text.encode("utf-8")) if text else 0
+
+
 def search_rules(
     query: str | None = None,
     product: str | None = None,
@@ -572,5 +696,318 @@ def get_rule_details(
     Returns:
         RuleDetails or None if not found
     """
+    content_repo = get_content_repository()
     discovery = RuleDiscovery()
-    return discovery.get_rule_details(rule_id, include_rendered, product, rendered_detail)
+    key = (content_repo.path, rule_id)
+
+    details: RuleDetails | None = None
+    cached = _rule_details_cache.get(key)
+    if cached:
+        cached_stamp, cached_details = cached
+        rule_path = content_repo.path / cached_details.file_path
+        if cached_stamp == _rule_dir_stamp(rule_path):
+            _rule_details_cache.move_to_end(key)
+            details = cached_details
+
+    if details is None:
+        details = discovery.get_rule_details(rule_id, include_rendered=False)
+        if details is None:
+            _rule_details_cache.pop(key, None)
+            return None
+
+        rule_path = content_repo.path / details.file_path
+        _rule_details_cache[key] = (_rule_dir_stamp(rule_path), details)
+        _rule_details_cache.move_to_end(key)
+        if len(_rule_details_cache) > _RULE_DETAILS_CACHE_SIZE:
+            _rule_details_cache.popitem(last=False)
+
+    # Callers get their own copy, so changes to it never reach the cache
+    details = details.model_copy(deep=True)
+    if include_rendered:
+        prodtype = discovery._parse_prodtype(_load_rule_data(rule_path))
+        details.rendered = discovery._get_rendered_content(
+            rule_id, product, rendered_detail, prodtype
+        )
+    return details
+
+
+def _iter_rule_files(
+    path: str,
+    previous: dict[str, _DirRecord],
+    tree: dict[str, _DirRecord],
+) -> Iterator[str]:
+    """Yield the rule.yml files below a directory.
+
+    Directories whose mtime matches their record in ``previous`` are not listed again,
+    since adding, removing or renaming an entry always updates the mtime of the
+    directory holding it. Others are listed with os.scandir, whose entries carry the
+    file type. Like Path.rglob, each directory's own rule.yml comes before those of its
+    subdirectories and symlinked directories are not descended into.
+
+    Args:
+        path: Directory to search
+        previous: Directory records from an earlier scan
+        tree: Directory records of this scan, filled in as directories are visited
+
+    Yields:
+        Paths of rule.yml files
+    """
+    record = _scan_dir(path, previous)
+    if record is None:
+        return
+    tree[path] = record
+
+    if record[2]:
+        yield os.path.join(path, "rule.yml")
+    for subdir in record[1]:
+        yield from _iter_rule_files(subdir, previous, tree)
+
+
+def _get_index_executor() -> ThreadPoolExecutor:
+    """Get the thread pool scanning rule directory subtrees.
+
+    Returns:
+        Shared thread pool with MAX_INDEX_WORKERS workers
+    """
+    global _index_executor
+    if _index_executor is None:
+        _index_executor = ThreadPoolExecutor(
+            max_workers=MAX_INDEX_WORKERS, thread_name_prefix="rule-index"
+        )
+    return _index_executor
+
+
+def _scan_dir(path: str, previous: dict[str, _DirRecord]) -> _DirRecord | None:
+    """Get the record of one directory in a rule tree, listing it only if it changed.
+
+    Args:
+        path: Directory path
+        previous: Directory records from an earlier scan
+
+    Returns:
+        Tuple of (mtime ns, subdirectory paths, whether it holds a rule.yml), or None
+        if the directory does not exist
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    record = previous.get(path)
+    if record is not None and record[0] == mtime:
+        return record
+
+    subdirs = []
+    has_rule = False
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name == "rule.yml":
+                has_rule = True
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    return mtime, tuple(subdirs), has_rule
+
+
+def enable_rule_index_snapshot(cache_dir: Path | None) -> None:
+    """Persist scanned rule trees on disk so new processes skip the initial listing.
+
+    Args:
+        cache_dir: Directory for the snapshot files, or None to disable them
+    """
+    global _rule_index_cache_dir
+    _rule_index_cache_dir = cache_dir.expanduser() if cache_dir is not None else None
+
+
+def _rule_tree_snapshot_path(repo_path: Path) -> Path | None:
+    """Get the snapshot file of a repository's rule tree.
+
+    Args:
+        repo_path: Content repository path
+
+    Returns:
+        Snapshot file path, or None if snapshots are disabled
+    """
+    if _rule_index_cache_dir is None:
+        return None
+    digest = hashlib.blake2b(str(repo_path).encode(), digest_size=8).hexdigest()
+    return _rule_index_cache_dir / f"rule_index-{digest}.json"
+
+
+def _load_rule_tree(repo_path: Path) -> dict[str, _DirRecord]:
+    """Get the last scanned rule tree of a repository, from memory or the snapshot.
+
+    Args:
+        repo_path: Content repository path
+
+    Returns:
+        Directory records, empty if the repository was not scanned yet
+    """
+    tree = _rule_trees.get(repo_path)
+    if tree is not None:
+        return tree
+
+    snapshot_path = _rule_tree_snapshot_path(repo_path)
+    if snapshot_path is None:
+        return {}
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = json.load(f)
+        if snapshot["version"] != _RULE_INDEX_VERSION or snapshot["path"] != str(repo_path):
+            return {}
+        tree = _parse_rule_tree(repo_path, snapshot["tree"])
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        logger.debug(f"Ignoring unreadable rule index snapshot: {e}")
+        return {}
+
+    logger.debug(f"Loaded rule tree from snapshot {snapshot_path}")
+    return tree
+
+
+def _parse_rule_tree(repo_path: Path, data: object) -> dict[str, _DirRecord]:
+    """Validate the directory records read from a rule tree snapshot.
+
+    Args:
+        repo_path: Content repository path
+        data: Decoded "tree" member of the snapshot
+
+    Returns:
+        Directory records
+
+    Raises:
+        ValueError: If the records are malformed or name directories outside the
+            repository
+    """
+    if not isinstance(data, dict):
+        raise ValueError("rule tree is not an object")
+    prefix = os.path.join(repo_path, "")
+    tree: dict[str, _DirRecord] = {}
+    for path, record in data.items():
+        if not (isinstance(record, list) and len(record) == 3):
+            raise ValueError(f"malformed record for {path}")
+        mtime, subdirs, has_rule = record
+        # Subdirectories are walked by the index, so each must be a direct child of its
+        # (in-repository) parent
+        if not (
+            path.startswith(prefix)
+            and isinstance(mtime, int)
+            and isinstance(subdirs, list)
+            and all(_is_child_dir(path, name) for name in subdirs)
+            and isinstance(has_rule, bool)
+        ):
+            raise ValueError(f"malformed record for {path}")
+        tree[path] = (mtime, tuple(subdirs), has_rule)
+    return tree
+
+
+def _is_child_dir(parent: str, name: object) -> bool:
+    """Check that a snapshot entry names a direct subdirectory of its parent.
+
+    Args:
+        parent: Directory path of the record
+        name: Subdirectory path read from the snapshot
+
+    Returns:
+        True if name is a path directly below parent
+    """
+    if not isinstance(name, str):
+        return False
+    head, tail = os.path.split(name)
+    return head == parent and tail not in ("", os.curdir, os.pardir)
+
+
+def _save_rule_tree(repo_path: Path, tree: dict[str, _DirRecord]) -> None:
+    """Write the scanned rule tree of a repository to its snapshot file.
+
+    Args:
+        repo_path: Content repository path
+        tree: Directory records
+    """
+    snapshot_path = _rule_tree_snapshot_path(repo_path)
+    if snapshot_path is None:
+        return
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": _RULE_INDEX_VERSION, "path": str(repo_path), "tree": tree}, f)
+            os.replace(tmp_name, snapshot_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, ValueError) as e:
+        logger.debug(f"Failed to write rule index snapshot: {e}")
+
+
+def _list_dir(path: Path) -> dict[str, bool]:
+    """List a directory with one scandir.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Dict mapping entry names to whether they are directories, empty if the
+        directory does not exist
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+
+def _load_rule_data(rule_path: Path, stamp: tuple[int, int] | None = None) -> dict:
+    """Parse a rule.yml, reusing the previous parse while the file is unchanged.
+
+    Jinja2 templates are left as strings by the safe loader.
+
+    Args:
+        rule_path: Path to rule.yml
+        stamp: The file's (mtime ns, size), if already known
+
+    Returns:
+        Parsed rule data; must not be modified
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if stamp is None:
+        stamp = file_stamp(rule_path)
+    cached = _rule_data_cache.get(rule_path)
+    if cached and cached[0] == stamp:
+        _rule_data_cache.move_to_end(rule_path)
+        return cached[1]
+
+    with open(rule_path) as f:
+        data: dict = safe_load(f)
+
+    _rule_data_cache[rule_path] = (stamp, data)
+    _rule_data_cache.move_to_end(rule_path)
+    if len(_rule_data_cache) > _RULE_DATA_CACHE_SIZE:
+        _rule_data_cache.popitem(last=False)
+    return data
+
+
+def _rule_dir_stamp(rule_path: Path) -> tuple[int, ...]:
+    """Get the stamp used to validate cached details of a rule.
+
+    Covers rule.yml and the listings of the rule directory and its subdirectories
+    (checks, remediations, test scenarios), whose mtimes change when entries are added,
+    removed or renamed.
+
+    Args:
+        rule_path: Path to rule.yml
+
+    Returns:
+        Tuple of the rule.yml (mtime ns, size) followed by the mtimes of the rule
+        directory and of each of its subdirectories in name order
+    """
+    rule_dir = rule_path.parent
+    stamp = [*file_stamp(rule_path), file_stamp(rule_dir)[0]]
+    for name, is_dir in sorted(_list_dir(rule_dir).items()):
+        if is_dir:
+            stamp.append(file_stamp(rule_dir / name)[0])
+    return tuple(stamp)
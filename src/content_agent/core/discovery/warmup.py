@@ -0,0 +1,23 @@
+"""Warm-up of discovery caches at server startup."""
+
+import logging
+
+from content_agent.core.discovery.build_artifacts import list_built_products
+from content_agent.core.discovery.controls import list_controls
+from content_agent.core.discovery.products import list_products
+
+logger = logging.getLogger(__name__)
+
+
+def warm_caches() -> None:
+    """Populate the discovery listing caches before the first request.
+
+    The caches validate themselves against file modification times, so warming only
+    moves the initial directory scans and YAML parsing to startup. Failures are logged
+    and the affected listing is built on first use instead.
+    """
+    for warm in (list_products, list_controls, list_built_products):
+        try:
+            warm()
+        except Exception as e:
+            logger.warning(f"Failed to warm {warm.__name__} cache: {e}")
@@ -1,6 +1,7 @@
 """Content repository management."""
 
 import logging
+import re
 import shutil
 import sys
 from pathlib import Path
@@ -236,8 +237,6 @@ class ContentRepository:
         try:
             content = cmake_file.read_text()
             # Look for project(scap_security_guide VERSION X.Y.Z)
-            import re
-
             match = re.search(r"project\([^)]*VERSION\s+(\S+)", content)
             if match:
                 return match.group(1)
@@ -250,6 +249,9 @@ class ContentRepository:
 # Global content repository instance
 _content_repo: ContentRepository | None = None
 
+# Initialized content repositories keyed by repository path
+_content_repos: dict[Path, ContentRepository] = {}
+
 
 def get_content_repository() -> ContentRepository:
     """Get the global content repository instance.
@@ -270,6 +272,9 @@ def get_content_repository() -> ContentRepository:
 def initialize_content_repository(repo_path: Path | None = None) -> ContentRepository:
     """Initialize the global content repository.
 
+    Repeated calls for the same repository path reuse the already initialized
+    repository unless the settings were re-initialized in between.
+
     Args:
         repo_path: Optional explicit repository path
 
@@ -277,6 +282,13 @@ def initialize_content_repository(repo_path: Path | None = None) -> ContentRepos
         ContentRepository instance
     """
     global _content_repo
-    _content_repo = ContentRepository(repo_path)
-    _content_repo.initialize()
+    repo = ContentRepository(repo_path)
+    cached = _content_repos.get(repo.path)
+    if cached and cached.settings is repo.settings and cached.is_managed == repo.is_managed:
+        _content_repo = cached
+        return _content_repo
+
+    repo.initialize()
+    _content_repos[repo.path] = repo
+    _content_repo = repo
     return _content_repo
@@ -4,6 +4,7 @@ This module provides a safe interface to import and use SSG modules after
 the content repository has been added to the Python path.
 """
 
+import importlib
 import logging
 from typing import Any
 
@@ -11,20 +12,49 @@ logger = logging.getLogger(__name__)
 
 
 class SSGModules:
-    """Wrapper for accessing SSG Python modules."""
+    """Wrapper for accessing SSG Python modules.
+
+    The submodules listed in ``SUBMODULES`` (e.g. ``ssg_modules.rules`` for ssg.rules)
+    are imported on first attribute access once load_modules() has been called.
+    """
+
+    __slots__ = ("_modules_loaded", "_ssg", "_submodules")
+
+    SUBMODULES = frozenset(
+        {
+            "build_yaml",
+            "constants",
+            "products",
+            "rules",
+            "templates",
+            "profiles",
+            "controls",
+            "yaml",
+        }
+    )
 
     def __init__(self) -> None:
         """Initialize SSG modules wrapper."""
         self._modules_loaded = False
         self._ssg = None
-        self._build_yaml = None
-        self._products = None
-        self._rules = None
-        self._templates = None
-        self._profiles = None
-        self._controls = None
-        self._yaml = None
-        self._constants = None
+        self._submodules: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an ssg submodule, importing it on first access.
+
+        Args:
+            name: Submodule name (e.g., 'rules' for ssg.rules)
+
+        Returns:
+            ssg submodule
+
+        Raises:
+            AttributeError: If name is not a known ssg submodule
+            ImportError: If modules not loaded
+        """
+        if name not in self.SUBMODULES:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return self._import_submodule(name)
 
     def load_modules(self) -> None:
         """Load SSG Python modules.
@@ -38,26 +68,11 @@ class SSGModules:
         try:
             logger.info("Loading SSG Python modules")
 
-            # Core SSG modules
+            # Only the top-level package is imported eagerly to verify the content
+            # repository is importable; submodules are imported on first access
             import ssg
-            import ssg.build_yaml
-            import ssg.constants
-            import ssg.controls
-            import ssg.products
-            import ssg.profiles
-            import ssg.rules
-            import ssg.templates
-            import ssg.yaml
 
             self._ssg = ssg
-            self._build_yaml = ssg.build_yaml
-            self._constants = ssg.constants
-            self._products = ssg.products
-            self._rules = ssg.rules
-            self._templates = ssg.templates
-            self._profiles = ssg.profiles
-            self._controls = ssg.controls
-            self._yaml = ssg.yaml
 
             self._modules_loaded = True
             logger.info("SSG modules loaded successfully")
@@ -69,117 +84,27 @@ class SSGModules:
                 f"Error: {e}"
             ) from e
 
-    @property
-    def build_yaml(self) -> Any:
-        """Get ssg.build_yaml module.
-
-        Returns:
-            ssg.build_yaml module
-
-        Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._build_yaml
+    def _import_submodule(self, name: str) -> Any:
+        """Import an ssg submodule on first use and cache it.
 
-    @property
-    def products(self) -> Any:
-        """Get ssg.products module.
+        Args:
+            name: Submodule name (e.g., 'rules' for ssg.rules)
 
         Returns:
-            ssg.products module
+            Imported submodule
 
         Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._products
-
-    @property
-    def rules(self) -> Any:
-        """Get ssg.rules module.
-
-        Returns:
-            ssg.rules module
-
-        Raises:
-            ImportError: If modules not loaded
+            ImportError: If modules not loaded or the submodule cannot be imported
         """
         if not self._modules_loaded:
             raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._rules
-
-    @property
-    def templates(self) -> Any:
-        """Get ssg.templates module.
 
-        Returns:
-            ssg.templates module
-
-        Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._templates
-
-    @property
-    def profiles(self) -> Any:
-        """Get ssg.profiles module.
-
-        Returns:
-            ssg.profiles module
-
-        Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._profiles
-
-    @property
-    def controls(self) -> Any:
-        """Get ssg.controls module.
-
-        Returns:
-            ssg.controls module
-
-        Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._controls
-
-    @property
-    def yaml(self) -> Any:
-        """Get ssg.yaml module.
-
-        Returns:
-            ssg.yaml module
-
-        Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._yaml
-
-    @property
-    def constants(self) -> Any:
-        """Get ssg.constants module.
-
-        Returns:
-            ssg.constants module
-
-        Raises:
-            ImportError: If modules not loaded
-        """
-        if not self._modules_loaded:
-            raise ImportError("SSG modules not loaded. Call load_modules() first.")
-        return self._constants
+        module = self._submodules.get(name)
+        if module is None:
+            logger.debug(f"Importing ssg.{name}")
+            module = importlib.import_module(f"ssg.{name}")
+            self._submodules[name] = module
+        return module
 
 
 # Global SSG modules instance
@@ -6,6 +6,7 @@ from pathlib import Path
 import yaml
 
 from content_agent.core.discovery.rules import RuleDiscovery
+from content_agent.core.yaml_loader import safe_load
 from content_agent.models.control import ControlFile, ControlValidationResult
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,7 @@ class ControlValidator:
             # Parse YAML
             try:
                 with open(file_path) as f:
-                    control_data = yaml.safe_load(f)
+                    control_data = safe_load(f)
             except yaml.YAMLError as e:
                 return ControlValidationResult(
                     valid=False,
@@ -5,6 +5,7 @@ import re
 
 import yaml
 
+from content_agent.core.yaml_loader import safe_load
 from content_agent.models import ValidationError, ValidationResult
 
 logger = logging.getLogger(__name__)
@@ -35,7 +36,7 @@ class RuleValidator:
         """Validate rule YAML content.
 
         Note: This validator is designed for NEW rules being created during scaffolding.
-        It uses yaml.safe_load() which does not expand Jinja2 templates. If you need to
+        It uses a safe YAML loader which does not expand Jinja2 templates. If you need to
         validate existing rules from ComplianceAsCode/content that contain Jinja2 macros
         ({{{ }}}), the templates will be treated as literal strings in the validation.
 
@@ -53,7 +54,7 @@ class RuleValidator:
 
         try:
             # Parse YAML
-            data = yaml.safe_load(yaml_content)
+            data = safe_load(yaml_content)
 
             if not isinstance(data, dict):
                 errors.append(
@@ -0,0 +1,48 @@
+"""YAML loading and dumping helpers.
+
+PyYAML's ``safe_load`` and ``dump`` always use the pure-Python loader and emitter. These
+helpers use the libyaml-backed ``CSafeLoader``/``CSafeDumper`` when PyYAML was built with
+libyaml, which handle the same documents several times faster, and fall back to the
+pure-Python ``SafeLoader``/``SafeDumper``.
+"""
+
+from typing import IO, Any, cast
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML content or an open file
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, **kwargs: Any) -> str:
+    """Serialize plain data to YAML with the fastest available safe emitter.
+
+    Args:
+        data: YAML-compatible data (dicts, lists, scalars)
+        **kwargs: Options passed to ``yaml.dump`` (e.g., sort_keys)
+
+    Returns:
+        YAML document
+
+    Raises:
+        yaml.representer.RepresenterError: If the data contains unsupported types
+    """
+    return cast(str, yaml.dump(data, Dumper=SafeDumper, **kwargs))
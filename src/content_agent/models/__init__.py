@@ -8,6 +8,7 @@ from content_agent.models.build import (
     BuildStatus,
     DatastreamInfo,
     RenderedRule,
+    RenderedRuleMetadata,
     RenderSearchResult,
 )
 from content_agent.models.control import (
@@ -41,6 +42,7 @@ from content_agent.models.rule import (
     ValidationError,
     ValidationResult,
 )
+from content_agent.models.serialization import serialize
 from content_agent.models.test import (
     TestJobId,
     TestJobStatus,
@@ -58,6 +60,7 @@ __all__ = [
     "BuildStatus",
     "DatastreamInfo",
     "RenderedRule",
+    "RenderedRuleMetadata",
     "RenderSearchResult",
     # Control models
     "ControlFile",
@@ -90,6 +93,8 @@ __all__ = [
     "RuleSearchResult",
     "ValidationError",
     "ValidationResult",
+    # Serialization
+    "serialize",
     # Test models
     "TestJobId",
     "TestJobStatus",
@@ -36,6 +36,7 @@ class BuildJobId(BaseModel):
     class Config:
         """Pydantic config."""
 
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "job_id": "build_1234567890",
@@ -55,6 +56,11 @@ class BuildArtifact(BaseModel):
     type: str = Field(..., description="Artifact type (datastream, playbook, guide, etc.)")
     size: int | None = Field(None, description="File size in bytes")
 
+    class Config:
+        """Pydantic config."""
+
+        defer_build = True
+
 
 class BuildStatus(BaseModel):
     """Status of a build job."""
@@ -76,6 +82,7 @@ class BuildStatus(BaseModel):
     class Config:
         """Pydantic config."""
 
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "job_id": "build_1234567890",
@@ -117,6 +124,7 @@ class RenderedRule(BaseModel):
     class Config:
         """Pydantic config."""
 
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "rule_id": "sshd_set_idle_timeout",
@@ -131,6 +139,39 @@ class RenderedRule(BaseModel):
         }
 
 
+class RenderedRuleMetadata(BaseModel):
+    """Sizes and availability of a rule's rendered artifacts, without their content."""
+
+    rule_id: str = Field(..., description="Rule identifier")
+    product: str = Field(..., description="Product this rule was built for")
+    yaml_size: int | None = Field(
+        None, description="Size of rendered YAML in bytes, or None if it could not be rendered"
+    )
+    oval_size: int | None = Field(
+        None, description="Size of rendered OVAL in bytes, or None if there is none"
+    )
+    remediation_sizes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Sizes of rendered remediation scripts in bytes by type",
+    )
+    build_path: str = Field(..., description="Path to build artifact directory")
+
+    class Config:
+        """Pydantic config."""
+
+        defer_build = True
+        json_schema_extra = {
+            "example": {
+                "rule_id": "sshd_set_idle_timeout",
+                "product": "rhel9",
+                "yaml_size": 2048,
+                "oval_size": 1536,
+                "remediation_sizes": {"bash": 412},
+                "build_path": "build/rhel9/rules",
+            }
+        }
+
+
 class DatastreamInfo(BaseModel):
     """Information about a built datastream."""
 
@@ -145,6 +186,7 @@ class DatastreamInfo(BaseModel):
     class Config:
         """Pydantic config."""
 
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "product": "rhel9",
@@ -170,6 +212,7 @@ class RenderSearchResult(BaseModel):
     class Config:
         """Pydantic config."""
 
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "rule_id": "sshd_set_idle_timeout",
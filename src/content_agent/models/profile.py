@@ -1,8 +1,8 @@
 """Profile data models."""
 
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 
-from pydantic import BaseModel, Field
+from content_agent.models.rule import ValidationResult
 
 
 class ProfileSummary(BaseModel):
@@ -14,10 +14,8 @@ class ProfileSummary(BaseModel):
     product: str = Field(..., description="Product this profile belongs to")
     rule_count: int | None = Field(None, description="Number of rules in profile")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "profile_id": "ospp",
                 "title": "Protection Profile for General Purpose Operating Systems",
@@ -25,7 +23,8 @@ class ProfileSummary(BaseModel):
                 "product": "rhel9",
                 "rule_count": 156,
             }
-        }
+        },
+    )
 
 
 class ProfileDetails(BaseModel):
@@ -46,10 +45,8 @@ class ProfileDetails(BaseModel):
         None, description="Control file if profile is based on controls"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "profile_id": "ospp",
                 "title": "Protection Profile for General Purpose Operating Systems",
@@ -62,7 +59,8 @@ class ProfileDetails(BaseModel):
                 "rule_count": 156,
                 "control_file": "controls/ospp.yml",
             }
-        }
+        },
+    )
 
 
 class TemplateSummary(BaseModel):
@@ -73,17 +71,16 @@ class TemplateSummary(BaseModel):
     language: str = Field(..., description="Template language (jinja2, etc.)")
     category: str | None = Field(None, description="Template category")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "sshd_lineinfile",
                 "description": "Template for SSH daemon configuration options",
                 "language": "jinja2",
                 "category": "ssh",
             }
-        }
+        },
+    )
 
 
 class TemplateParameter(BaseModel):
@@ -109,10 +106,8 @@ class TemplateSchema(BaseModel):
     )
     example_usage: dict[str, str] | None = Field(None, description="Example parameter values")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "sshd_lineinfile",
                 "description": "Template for SSH daemon configuration options",
@@ -135,7 +130,8 @@ class TemplateSchema(BaseModel):
                     "value": "300",
                 },
             }
-        }
+        },
+    )
 
 
 class ScaffoldingResult(BaseModel):
@@ -146,14 +142,13 @@ class ScaffoldingResult(BaseModel):
     files_created: list[str] = Field(default_factory=list, description="Files that were created")
     rule_dir: str = Field(..., description="Path to rule directory")
     message: str = Field(..., description="Success or error message")
-    validation: Optional["ValidationResult"] = Field(  # Forward reference
+    validation: ValidationResult | None = Field(
         None, description="Validation result if validation was performed"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "success": True,
                 "rule_id": "sshd_max_auth_tries",
@@ -165,10 +160,5 @@ class ScaffoldingResult(BaseModel):
                 "rule_dir": "linux_os/guide/services/ssh/ssh_server/sshd_max_auth_tries",
                 "message": "Rule scaffolding created successfully",
             }
-        }
-
-
-# Import at end to avoid circular import
-from content_agent.models.rule import ValidationResult
-
-ScaffoldingResult.model_rebuild()
+        },
+    )
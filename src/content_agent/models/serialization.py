@@ -0,0 +1,48 @@
+"""JSON serialization of model responses.
+
+Uses orjson when it is installed, which serializes large responses (e.g. search results)
+several times faster, and falls back to the standard library ``json`` module.
+"""
+
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def serialize(obj: Any) -> str:
+    """Serialize models, or lists and dicts of them, to indented JSON.
+
+    Args:
+        obj: Pydantic model, JSON-compatible data, or lists and dicts containing models
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    payload = _to_jsonable(obj)
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert models nested in lists and dicts to JSON-compatible data.
+
+    Args:
+        obj: Object to convert
+
+    Returns:
+        JSON-compatible data
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, list | tuple):
+        return [_to_jsonable(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _to_jsonable(value) for key, value in obj.items()}
+    return obj
@@ -1,17 +1,146 @@
 """MCP resource handlers."""
 
+import json
 import logging
-from typing import Any
-from urllib.parse import urlparse
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import partial
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs
+
+from pydantic import BaseModel, TypeAdapter
 
 from content_agent.core import discovery
+from content_agent.core.integration import get_content_repository
+from content_agent.models import (
+    ProductSummary,
+    ProfileSummary,
+    RuleSearchResult,
+    TemplateSummary,
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def handle_resource_read(uri: str) -> str:
+# Resource definitions
+RESOURCES = [
+    {
+        "uri": "cac://products",
+        "name": "Products",
+        "description": "List of all available products",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://products/{product_id}",
+        "name": "Product Details",
+        "description": "Detailed information about a specific product",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://rules",
+        "name": "Rules",
+        "description": "List of available rules",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://rules/{rule_id}",
+        "name": "Rule Details",
+        "description": "Detailed information about a specific rule",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://templates",
+        "name": "Templates",
+        "description": "List of available templates",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://templates/{template_name}",
+        "name": "Template Schema",
+        "description": "Schema definition for a template",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://profiles",
+        "name": "Profiles",
+        "description": "List of all profiles",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://profiles/{product}/{profile_id}",
+        "name": "Profile Details",
+        "description": "Detailed information about a specific profile",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://controls",
+        "name": "Control Frameworks",
+        "description": "List of available control frameworks",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://build",
+        "name": "Built Products",
+        "description": "List of products with build artifacts available",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://build/{product}",
+        "name": "Product Build Info",
+        "description": "Build information and datastream details for a product",
+        "mimeType": "application/json",
+    },
+    {
+        "uri": "cac://build/{product}/rules/{rule_id}",
+        "name": "Rendered Rule",
+        "description": "Fully rendered rule content from build directory (after Jinja processing)",
+        "mimeType": "application/json",
+    },
+]
+
+
+# Scheme, path and query of a resource URI; "cac://products/rhel9" and
+# "cac:products/rhel9" are both accepted, and any fragment is ignored
+_URI_RE = re.compile(
+    r"^(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*):(?P<path>[^?#]*)(?:\?(?P<query>[^#]*))?"
+)
+
+
+class _Collection(NamedTuple):
+    """Readers of a collection resource such as cac://products."""
+
+    name: str
+    list_items: Callable[[], list[Any]]
+    # Serializes the whole list to JSON in pydantic-core
+    list_adapter: TypeAdapter
+    get_item: Callable[..., BaseModel | None]
+    # Number of path components identifying a single item
+    key_parts: int
+    # Message for a missing item, formatted with the key path components
+    not_found: str
+
+
+# Serialized resource responses keyed by (repository path, resource type, path parts,
+# indent) and tagged with the time.monotonic() they were produced at. Entries expire after
+# RESPONSE_CACHE_TTL seconds so changes made outside the server are eventually seen.
+RESPONSE_CACHE_TTL = 30.0
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+
+
+def invalidate_resource_cache() -> None:
+    """Drop all cached resource responses (call after modifying content)."""
+    _response_cache.clear()
+
+
+def handle_resource_read(uri: str) -> str:
     """Handle resource read requests.
 
+    JSON is compact unless the URI has a ``pretty=1`` query parameter
+    (e.g., cac://rules/sshd_set_idle_timeout?pretty=1).
+
     Args:
         uri: Resource URI (e.g., cac://products, cac://rules/sshd_set_idle_timeout)
 
@@ -21,146 +150,216 @@ async def handle_resource_read(uri: str) -> str:
     Raises:
         ValueError: If URI is invalid or resource not found
     """
-    logger.debug(f"Reading resource: {uri}")
+    logger.debug("Reading resource: %s", uri)
+
+    # Bare collection URIs (cac://products, cac://rules, ...) are the most frequent reads
+    # and need no regex, splitting or query parsing
+    resource_type = _BARE_URIS.get(uri)
+    if resource_type is not None:
+        return _read_cached(resource_type, [], uri, None)
+
+    match = _URI_RE.match(uri)
+    if match is None:
+        # No scheme at all, which urlparse() reported as an empty one
+        raise ValueError("Invalid URI scheme: , expected 'cac'")
+    scheme = match["scheme"].lower()
+    if scheme != "cac":
+        raise ValueError(f"Invalid URI scheme: {scheme}, expected 'cac'")
+
+    # strip/split run in C; empty segments from doubled slashes are rare, so the filtering
+    # comprehension only runs when one is present
+    path_parts = match["path"].strip("/").split("/")
+    if "" in path_parts:
+        path_parts = [p for p in path_parts if p]
+    if not path_parts:
+        raise ValueError("Invalid resource path")
+
+    resource_type, *path_parts = path_parts
+    if resource_type not in _HANDLERS:
+        raise ValueError(f"Unknown resource type: {resource_type}")
+
+    pretty = parse_qs(match["query"] or "").get("pretty", [""])[-1].lower()
+    indent = 2 if pretty in ("1", "true", "yes") else None
+
+    return _read_cached(resource_type, path_parts, uri, indent)
+
+
+def _read_cached(resource_type: str, path_parts: list[str], uri: str, indent: int | None) -> str:
+    """Serve a parsed resource read from the response cache.
+
+    Args:
+        resource_type: First path segment of the URI
+        path_parts: Remaining path segments
+        uri: Original resource URI (for error messages)
+        indent: JSON indentation, or None for compact output
+
+    Returns:
+        Resource content as string (JSON-serialized)
+    """
+    key = (get_content_repository().path, resource_type, tuple(path_parts), indent)
+    now = time.monotonic()
+    cached = _response_cache.get(key)
+    if cached and now - cached[0] < RESPONSE_CACHE_TTL:
+        _response_cache.move_to_end(key)
+        return cached[1]
+
+    content = _HANDLERS[resource_type](path_parts, uri, indent)
+    _response_cache[key] = (now, content)
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+    return content
+
+
+def _dumps(data: Any, indent: int | None) -> str:
+    """Serialize plain data to JSON.
+
+    Args:
+        data: JSON-compatible data
+        indent: JSON indentation, or None for compact output
+
+    Returns:
+        JSON string
+    """
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=indent)
+
+
+def _read_collection(
+    collection: _Collection, path_parts: list[str], uri: str, indent: int | None
+) -> str:
+    """Read a collection resource, either the whole list or a single item.
+
+    Args:
+        collection: Collection readers
+        path_parts: URI path components after the resource type
+        uri: Full resource URI
+        indent: JSON indentation, or None for compact output
+
+    Returns:
+        JSON-serialized resource content
+
+    Raises:
+        ValueError: If the path is invalid or the item is not found
+    """
+    if not path_parts:
+        items = collection.list_items()
+        return collection.list_adapter.dump_json(items, indent=indent).decode()
+    elif len(path_parts) == collection.key_parts:
+        item = collection.get_item(*path_parts)
+        if not item:
+            raise ValueError(collection.not_found.format(*path_parts))
+        return item.model_dump_json(indent=indent)
+    else:
+        raise ValueError(f"Invalid {collection.name} resource path: {uri}")
+
+
+def _read_controls(path_parts: list[str], uri: str, indent: int | None) -> str:
+    """Read cac://controls.
+
+    Args:
+        path_parts: URI path components after the resource type
+        uri: Full resource URI
+        indent: JSON indentation, or None for compact output
 
-    parsed = urlparse(uri)
-    if parsed.scheme != "cac":
-        raise ValueError(f"Invalid URI scheme: {parsed.scheme}, expected 'cac'")
+    Returns:
+        JSON-serialized resource content
 
-    # Handle both cac://products and cac:products formats
-    # urlparse treats "cac://products" as netloc, not path
-    if parsed.netloc:
-        # cac://products format - netloc contains the resource type
-        path_parts = [parsed.netloc] + [p for p in parsed.path.strip("/").split("/") if p]
+    Raises:
+        ValueError: If the path is invalid
+    """
+    if not path_parts:
+        # List control frameworks
+        controls = discovery.list_controls()
+        return _dumps(controls, indent)
     else:
-        # cac:products format - path contains everything
-        path_parts = [p for p in parsed.path.strip("/").split("/") if p]
+        raise ValueError(f"Invalid controls resource path: {uri}")
 
-    if not path_parts or not path_parts[0]:
-        raise ValueError("Invalid resource path")
 
-    resource_type = path_parts[0]
-
-    # Handle different resource types
-    if resource_type == "products":
-        if len(path_parts) == 1:
-            # List all products
-            products = discovery.list_products()
-            import json
-
-            return json.dumps([p.model_dump() for p in products], indent=2)
-        elif len(path_parts) == 2:
-            # Get specific product
-            product_id = path_parts[1]
-            product = discovery.get_product_details(product_id)
-            if not product:
-                raise ValueError(f"Product not found: {product_id}")
-            import json
-
-            return json.dumps(product.model_dump(), indent=2)
-        else:
-            raise ValueError(f"Invalid products resource path: {uri}")
-
-    elif resource_type == "rules":
-        if len(path_parts) == 1:
-            # List all rules (limited)
-            rules = discovery.search_rules(limit=100)
-            import json
-
-            return json.dumps([r.model_dump() for r in rules], indent=2)
-        elif len(path_parts) == 2:
-            # Get specific rule
-            rule_id = path_parts[1]
-            rule = discovery.get_rule_details(rule_id)
-            if not rule:
-                raise ValueError(f"Rule not found: {rule_id}")
-            import json
-
-            return json.dumps(rule.model_dump(), indent=2)
-        else:
-            raise ValueError(f"Invalid rules resource path: {uri}")
-
-    elif resource_type == "templates":
-        if len(path_parts) == 1:
-            # List all templates
-            templates = discovery.list_templates()
-            import json
-
-            return json.dumps([t.model_dump() for t in templates], indent=2)
-        elif len(path_parts) == 2:
-            # Get template schema
-            template_name = path_parts[1]
-            schema = discovery.get_template_schema(template_name)
-            if not schema:
-                raise ValueError(f"Template not found: {template_name}")
-            import json
-
-            return json.dumps(schema.model_dump(), indent=2)
-        else:
-            raise ValueError(f"Invalid templates resource path: {uri}")
-
-    elif resource_type == "profiles":
-        if len(path_parts) == 1:
-            # List all profiles
-            profiles = discovery.list_profiles()
-            import json
-
-            return json.dumps([p.model_dump() for p in profiles], indent=2)
-        elif len(path_parts) == 3:
-            # Get specific profile (product/profile_id)
-            product = path_parts[1]
-            profile_id = path_parts[2]
-            profile = discovery.get_profile_details(profile_id, product)
-            if not profile:
-                raise ValueError(f"Profile not found: {profile_id} in {product}")
-            import json
-
-            return json.dumps(profile.model_dump(), indent=2)
-        else:
-            raise ValueError(f"Invalid profiles resource path: {uri}")
-
-    elif resource_type == "controls":
-        if len(path_parts) == 1:
-            # List control frameworks
-            controls = discovery.list_controls()
-            import json
-
-            return json.dumps(controls, indent=2)
-        else:
-            raise ValueError(f"Invalid controls resource path: {uri}")
-
-    elif resource_type == "build":
-        # Handle build artifacts resources
-        if len(path_parts) == 1:
-            # List built products
-            products = discovery.list_built_products()
-            import json
-
-            return json.dumps({"products": products, "count": len(products)}, indent=2)
-        elif len(path_parts) == 2:
-            # Get product datastream info
-            product = path_parts[1]
-            info = discovery.get_datastream_info(product)
-            if not info:
-                raise ValueError(f"No build artifacts for product: {product}")
-            import json
-
-            return json.dumps(info.model_dump(), indent=2)
-        elif len(path_parts) >= 4 and path_parts[2] == "rules":
-            # Get rendered rule: build/{product}/rules/{rule_id}
-            product = path_parts[1]
-            rule_id = path_parts[3]
-            rendered = discovery.get_rendered_rule(product, rule_id)
-            if not rendered:
-                raise ValueError(f"Rendered rule not found: {rule_id} for {product}")
-            import json
-
-            return json.dumps(rendered.model_dump(), indent=2)
-        else:
-            raise ValueError(f"Invalid build resource path: {uri}")
+def _read_build(path_parts: list[str], uri: str, indent: int | None) -> str:
+    """Read cac://build, cac://build/{product} and cac://build/{product}/rules/{rule_id}.
+
+    Args:
+        path_parts: URI path components after the resource type
+        uri: Full resource URI
+        indent: JSON indentation, or None for compact output
+
+    Returns:
+        JSON-serialized resource content
 
+    Raises:
+        ValueError: If the path is invalid or the build artifacts are not found
+    """
+    if not path_parts:
+        # List built products
+        products = discovery.list_built_products()
+        return _dumps({"products": products, "count": len(products)}, indent)
+    elif len(path_parts) == 1:
+        # Get product datastream info
+        product = path_parts[0]
+        info = discovery.get_datastream_info(product)
+        if not info:
+            raise ValueError(f"No build artifacts for product: {product}")
+        return info.model_dump_json(indent=indent)
+    elif len(path_parts) >= 3 and path_parts[1] == "rules":
+        # Get rendered rule: build/{product}/rules/{rule_id}
+        product = path_parts[0]
+        rule_id = path_parts[2]
+        rendered = discovery.get_rendered_rule(product, rule_id)
+        if not rendered:
+            raise ValueError(f"Rendered rule not found: {rule_id} for {product}")
+        return rendered.model_dump_json(indent=indent)
     else:
-        raise ValueError(f"Unknown resource type: {resource_type}")
+        raise ValueError(f"Invalid build resource path: {uri}")
+
+
+# Collection resources: cac://{name} lists the items, cac://{name}/{key...} reads one.
+# Discovery functions are looked up on each call rather than bound here.
+_COLLECTIONS = [
+    _Collection(
+        name="products",
+        list_items=lambda: discovery.list_products(),
+        list_adapter=TypeAdapter(list[ProductSummary]),
+        get_item=lambda product_id: discovery.get_product_details(product_id),
+        key_parts=1,
+        not_found="Product not found: {0}",
+    ),
+    _Collection(
+        name="rules",
+        list_items=lambda: discovery.search_rules(limit=100),
+        list_adapter=TypeAdapter(list[RuleSearchResult]),
+        get_item=lambda rule_id: discovery.get_rule_details(rule_id),
+        key_parts=1,
+        not_found="Rule not found: {0}",
+    ),
+    _Collection(
+        name="templates",
+        list_items=lambda: discovery.list_templates(),
+        list_adapter=TypeAdapter(list[TemplateSummary]),
+        get_item=lambda template_name: discovery.get_template_schema(template_name),
+        key_parts=1,
+        not_found="Template not found: {0}",
+    ),
+    _Collection(
+        name="profiles",
+        list_items=lambda: discovery.list_profiles(),
+        list_adapter=TypeAdapter(list[ProfileSummary]),
+        get_item=lambda product, profile_id: discovery.get_profile_details(profile_id, product),
+        key_parts=2,
+        not_found="Profile not found: {1} in {0}",
+    ),
+]
+
+# Resource readers by resource type (first URI path component)
+_HANDLERS: dict[str, Callable[[list[str], str, int | None], str]] = {
+    **{c.name: partial(_read_collection, c) for c in _COLLECTIONS},
+    "controls": _read_controls,
+    "build": _read_build,
+}
+
+# Exact URIs of the resource collections, resolved without parsing
+_BARE_URIS = {f"cac://{name}": name for name in _HANDLERS}
 
 
 def list_resources() -> list[dict[str, Any]]:
@@ -169,77 +368,4 @@ def list_resources() -> list[dict[str, Any]]:
     Returns:
         List of resource descriptors
     """
-    return [
-        {
-            "uri": "cac://products",
-            "name": "Products",
-            "description": "List of all available products",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://products/{product_id}",
-            "name": "Product Details",
-            "description": "Detailed information about a specific product",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://rules",
-            "name": "Rules",
-            "description": "List of available rules",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://rules/{rule_id}",
-            "name": "Rule Details",
-            "description": "Detailed information about a specific rule",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://templates",
-            "name": "Templates",
-            "description": "List of available templates",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://templates/{template_name}",
-            "name": "Template Schema",
-            "description": "Schema definition for a template",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://profiles",
-            "name": "Profiles",
-            "description": "List of all profiles",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://profiles/{product}/{profile_id}",
-            "name": "Profile Details",
-            "description": "Detailed information about a specific profile",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://controls",
-            "name": "Control Frameworks",
-            "description": "List of available control frameworks",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://build",
-            "name": "Built Products",
-            "description": "List of products with build artifacts available",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://build/{product}",
-            "name": "Product Build Info",
-            "description": "Build information and datastream details for a product",
-            "mimeType": "application/json",
-        },
-        {
-            "uri": "cac://build/{product}/rules/{rule_id}",
-            "name": "Rendered Rule",
-            "description": "Fully rendered rule content from build directory (after Jinja processing)",
-            "mimeType": "application/json",
-        },
-    ]
+    return RESOURCES
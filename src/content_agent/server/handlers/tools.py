@@ -2,9 +2,12 @@
 
 import json
 import logging
+from pathlib import Path
 from typing import Any
 
 from content_agent.core import discovery, scaffolding
+from content_agent.models import serialize
+from content_agent.server.handlers.resources import invalidate_resource_cache
 
 logger = logging.getLogger(__name__)
 
@@ -480,21 +483,21 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
     Raises:
         ValueError: If tool not found or execution fails
     """
-    logger.info(f"Calling tool: {name} with arguments: {arguments}")
+    logger.info("Calling tool: %s with arguments: %s", name, arguments)
 
     try:
         # Discovery tools
         if name == "list_products":
             products = discovery.list_products()
             result = [p.model_dump(mode="json") for p in products]
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": serialize(result)}]
 
         elif name == "get_product_details":
             product_id = arguments["product_id"]
             product = discovery.get_product_details(product_id)
             if not product:
                 return [{"type": "text", "text": f"Product not found: {product_id}"}]
-            return [{"type": "text", "text": json.dumps(product.model_dump(mode="json"), indent=2)}]
+            return [{"type": "text", "text": serialize(product)}]
 
         elif name == "search_rules":
             query = arguments.get("query")
@@ -507,7 +510,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             )
             result = [r.model_dump(mode="json") for r in rules]
             summary = f"Found {len(rules)} rules matching search criteria.\n\n"
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         elif name == "get_rule_details":
             rule_id = arguments["rule_id"]
@@ -520,7 +523,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                 return [{"type": "text", "text": f"Rule not found: {rule_id}"}]
 
             # Add informative message about rendered content
-            result_json = json.dumps(rule.model_dump(mode="json"), indent=2)
+            result_json = serialize(rule)
             if include_rendered and rule.rendered:
                 products_with_rendered = list(rule.rendered.keys())
                 detail_msg = (
@@ -542,20 +545,20 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
         elif name == "list_templates":
             templates = discovery.list_templates()
             result = [t.model_dump(mode="json") for t in templates]
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": serialize(result)}]
 
         elif name == "get_template_schema":
             template_name = arguments["template_name"]
             schema = discovery.get_template_schema(template_name)
             if not schema:
                 return [{"type": "text", "text": f"Template not found: {template_name}"}]
-            return [{"type": "text", "text": json.dumps(schema.model_dump(mode="json"), indent=2)}]
+            return [{"type": "text", "text": serialize(schema)}]
 
         elif name == "list_profiles":
             product = arguments.get("product")
             profiles = discovery.list_profiles(product=product)
             result = [p.model_dump(mode="json") for p in profiles]
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": serialize(result)}]
 
         elif name == "get_profile_details":
             profile_id = arguments["profile_id"]
@@ -568,7 +571,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                         "text": f"Profile not found: {profile_id} in {product}",
                     }
                 ]
-            return [{"type": "text", "text": json.dumps(profile.model_dump(mode="json"), indent=2)}]
+            return [{"type": "text", "text": serialize(profile)}]
 
         # Scaffolding tools
         elif name == "generate_rule_boilerplate":
@@ -581,7 +584,8 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                 location=arguments.get("location"),
                 rationale=arguments.get("rationale"),
             )
-            return [{"type": "text", "text": json.dumps(result.model_dump(mode="json"), indent=2)}]
+            invalidate_resource_cache()
+            return [{"type": "text", "text": serialize(result)}]
 
         elif name == "validate_rule_yaml":
             result = scaffolding.validate_rule_yaml(
@@ -589,7 +593,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                 check_references=arguments.get("check_references", True),
                 auto_fix=arguments.get("auto_fix", False),
             )
-            return [{"type": "text", "text": json.dumps(result.model_dump(mode="json"), indent=2)}]
+            return [{"type": "text", "text": serialize(result)}]
 
         elif name == "generate_rule_from_template":
             result = scaffolding.generate_rule_from_template(
@@ -598,14 +602,15 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                 rule_id=arguments["rule_id"],
                 product=arguments["product"],
             )
-            return [{"type": "text", "text": json.dumps(result.model_dump(mode="json"), indent=2)}]
+            invalidate_resource_cache()
+            return [{"type": "text", "text": serialize(result)}]
 
         # Build artifacts tools
         elif name == "list_built_products":
             products = discovery.list_built_products()
             summary = f"Found {len(products)} products with build artifacts.\n\n"
             result = {"products": products, "count": len(products)}
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         elif name == "get_rendered_rule":
             product = arguments["product"]
@@ -619,9 +624,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                         f"Make sure the product has been built (./build_product {product}).",
                     }
                 ]
-            return [
-                {"type": "text", "text": json.dumps(rendered.model_dump(mode="json"), indent=2)}
-            ]
+            return [{"type": "text", "text": serialize(rendered)}]
 
         elif name == "get_datastream_info":
             product = arguments["product"]
@@ -633,7 +636,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                         "text": f"Datastream info not available for product: {product}",
                     }
                 ]
-            return [{"type": "text", "text": json.dumps(info.model_dump(mode="json"), indent=2)}]
+            return [{"type": "text", "text": serialize(info)}]
 
         elif name == "search_rendered_content":
             query = arguments["query"]
@@ -643,12 +646,10 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             results = discovery.search_rendered_content(query, product, limit)
             result = [r.model_dump(mode="json") for r in results]
             summary = f"Found {len(results)} matches in rendered build artifacts.\n\n"
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         # Control file tools
         elif name == "parse_policy_document":
-            from pathlib import Path
-
             from content_agent.core.parsing import (
                 HTMLParser,
                 MarkdownParser,
@@ -678,11 +679,9 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             summary += f"Sections: {len(parsed.sections)}\n"
             summary += f"Source: {parsed.source_path}\n\n"
 
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         elif name == "generate_control_files":
-            from pathlib import Path
-
             from content_agent.core.scaffolding.control_generator import ControlGenerator
             from content_agent.models.control import ExtractedRequirement
 
@@ -750,6 +749,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                 version=version,
                 levels=levels,
             )
+            invalidate_resource_cache()
 
             summary = f"Generated control structure for {policy_id}\n"
             summary += f"Success: {result.success}\n"
@@ -760,7 +760,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             return [
                 {
                     "type": "text",
-                    "text": summary + json.dumps(result.model_dump(mode="json"), indent=2),
+                    "text": summary + serialize(result),
                 }
             ]
 
@@ -789,6 +789,8 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                 model=settings.ai.model,
                 max_tokens=settings.ai.max_tokens,
                 temperature=settings.ai.temperature,
+                cache_dir=settings.ai.response_cache_dir,
+                cache_ttl=settings.ai.response_cache_ttl,
             )
             mapper = RuleMapper(client)
 
@@ -802,11 +804,9 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             result = [s.model_dump(mode="json") for s in suggestions]
             summary = f"Found {len(suggestions)} rule suggestions\n\n"
 
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         elif name == "validate_control_file":
-            from pathlib import Path
-
             from content_agent.core.scaffolding.control_validators import (
                 ControlValidator,
             )
@@ -822,13 +822,11 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             return [
                 {
                     "type": "text",
-                    "text": summary + json.dumps(result.model_dump(mode="json"), indent=2),
+                    "text": summary + serialize(result),
                 }
             ]
 
         elif name == "review_control_generation":
-            from pathlib import Path
-
             from content_agent.config.settings import get_settings
             from content_agent.core.ai.claude_client import ClaudeClient
             from content_agent.core.ai.rule_mapper import RuleMapper
@@ -847,6 +845,8 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
                         model=settings.ai.model,
                         max_tokens=settings.ai.max_tokens,
                         temperature=settings.ai.temperature,
+                        cache_dir=settings.ai.response_cache_dir,
+                        cache_ttl=settings.ai.response_cache_ttl,
                     )
                     mapper = RuleMapper(client)
                     reviewer_kwargs["rule_mapper"] = mapper
@@ -866,7 +866,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             controls = discovery.list_controls()
             summary = f"Found {len(controls)} control frameworks\n\n"
             result = {"controls": controls, "count": len(controls)}
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         elif name == "get_control_details":
             from content_agent.core.discovery.controls import get_control_details
@@ -883,7 +883,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             return [
                 {
                     "type": "text",
-                    "text": summary + json.dumps(control.model_dump(mode="json"), indent=2),
+                    "text": summary + serialize(control),
                 }
             ]
 
@@ -897,7 +897,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> list[Any]:
             result = [r.model_dump(mode="json") for r in requirements]
             summary = f"Found {len(requirements)} matching requirements\n\n"
 
-            return [{"type": "text", "text": summary + json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": summary + serialize(result)}]
 
         else:
             raise ValueError(f"Unknown tool: {name}")
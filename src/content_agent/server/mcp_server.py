@@ -12,6 +12,64 @@ from content_agent.server.handlers import prompts, resources, tools
 logger = logging.getLogger(__name__)
 
 
+# Resource and tool definitions are static, so their MCP models are built once. They are
+# kept as tuples and each response gets a shallow list copy, so a caller mutating the
+# returned list cannot alter what later requests see.
+_STATIC_RESOURCES: tuple[Resource, ...] = tuple(
+    Resource(
+        uri=r["uri"],
+        name=r["name"],
+        description=r.get("description"),
+        mimeType=r.get("mimeType"),
+    )
+    for r in resources.list_resources()
+)
+_STATIC_TOOLS: tuple[Tool, ...] = tuple(
+    Tool(
+        name=t["name"],
+        description=t["description"],
+        inputSchema=t["inputSchema"],
+    )
+    for t in tools.list_tools()
+)
+
+
+async def handle_list_resources() -> list[Resource]:
+    """Handle list resources request."""
+    logger.debug("Listing resources")
+    return list(_STATIC_RESOURCES)
+
+
+async def handle_read_resource(uri: str) -> str:
+    """Handle read resource request."""
+    logger.debug("Reading resource: %s", uri)
+    return resources.handle_resource_read(uri)
+
+
+async def handle_list_tools() -> list[Tool]:
+    """Handle list tools request."""
+    logger.debug("Listing tools")
+    return list(_STATIC_TOOLS)
+
+
+async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[Any]:
+    """Handle call tool request."""
+    logger.debug("Calling tool: %s", name)
+    return await tools.handle_tool_call(name, arguments)
+
+
+async def handle_list_prompts() -> list[Any]:
+    """Handle list prompts request."""
+    logger.debug("Listing prompts")
+    return prompts.list_prompts()
+
+
+async def handle_get_prompt(name: str, arguments: dict[str, Any]) -> Any:
+    """Handle get prompt request."""
+    logger.debug("Getting prompt: %s", name)
+    return await prompts.handle_prompt_get(name, arguments)
+
+
 class ContentAgentServer:
     """MCP server for ComplianceAsCode/content."""
 
@@ -21,66 +79,13 @@ class ContentAgentServer:
         self._setup_handlers()
 
     def _setup_handlers(self) -> None:
-        """Set up MCP protocol handlers."""
-
-        # List resources handler
-        @self.server.list_resources()
-        async def handle_list_resources() -> list[Resource]:
-            """Handle list resources request."""
-            logger.debug("Listing resources")
-            resource_list = resources.list_resources()
-            return [
-                Resource(
-                    uri=r["uri"],
-                    name=r["name"],
-                    description=r.get("description"),
-                    mimeType=r.get("mimeType"),
-                )
-                for r in resource_list
-            ]
-
-        # Read resource handler
-        @self.server.read_resource()
-        async def handle_read_resource(uri: str) -> str:
-            """Handle read resource request."""
-            logger.debug(f"Reading resource: {uri}")
-            return await resources.handle_resource_read(uri)
-
-        # List tools handler
-        @self.server.list_tools()
-        async def handle_list_tools() -> list[Tool]:
-            """Handle list tools request."""
-            logger.debug("Listing tools")
-            tool_list = tools.list_tools()
-            return [
-                Tool(
-                    name=t["name"],
-                    description=t["description"],
-                    inputSchema=t["inputSchema"],
-                )
-                for t in tool_list
-            ]
-
-        # Call tool handler
-        @self.server.call_tool()
-        async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[Any]:
-            """Handle call tool request."""
-            logger.debug(f"Calling tool: {name}")
-            return await tools.handle_tool_call(name, arguments)
-
-        # List prompts handler
-        @self.server.list_prompts()
-        async def handle_list_prompts() -> list[Any]:
-            """Handle list prompts request."""
-            logger.debug("Listing prompts")
-            return prompts.list_prompts()
-
-        # Get prompt handler
-        @self.server.get_prompt()
-        async def handle_get_prompt(name: str, arguments: dict[str, Any]) -> Any:
-            """Handle get prompt request."""
-            logger.debug(f"Getting prompt: {name}")
-            return await prompts.handle_prompt_get(name, arguments)
+        """Register the module-level MCP protocol handlers."""
+        self.server.list_resources()(handle_list_resources)
+        self.server.read_resource()(handle_read_resource)
+        self.server.list_tools()(handle_list_tools)
+        self.server.call_tool()(handle_call_tool)
+        self.server.list_prompts()(handle_list_prompts)
+        self.server.get_prompt()(handle_get_prompt)
 
     async def run_stdio(self) -> None:
         """Run server with stdio transport."""
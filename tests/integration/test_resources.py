@@ -4,7 +4,13 @@ import json
 
 import pytest
 
-from content_agent.server.handlers.resources import handle_resource_read, list_resources
+from content_agent.core import discovery
+from content_agent.server.handlers import resources
+from content_agent.server.handlers.resources import (
+    handle_resource_read,
+    invalidate_resource_cache,
+    list_resources,
+)
 
 
 class TestResourceListing:
@@ -35,20 +41,18 @@ class TestResourceListing:
 class TestResourceRead:
     """Test resource reading (requires real content)."""
 
-    @pytest.mark.asyncio
-    async def test_read_products_resource(self):
+    def test_read_products_resource(self):
         """Test reading products resource."""
-        content = await handle_resource_read("cac://products")
+        content = handle_resource_read("cac://products")
 
         # Should be valid JSON
         data = json.loads(content)
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
-    async def test_read_specific_product(self):
+    def test_read_specific_product(self):
         """Test reading specific product resource."""
         try:
-            content = await handle_resource_read("cac://products/rhel9")
+            content = handle_resource_read("cac://products/rhel9")
             data = json.loads(content)
 
             assert "product_id" in data
@@ -57,70 +61,128 @@ class TestResourceRead:
             # Product might not exist in test environment
             pytest.skip("Product rhel9 not available")
 
-    @pytest.mark.asyncio
-    async def test_read_rules_resource(self):
+    def test_read_rules_resource(self):
         """Test reading rules resource."""
-        content = await handle_resource_read("cac://rules")
+        content = handle_resource_read("cac://rules")
 
         # Should be valid JSON array
         data = json.loads(content)
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
-    async def test_read_templates_resource(self):
+    def test_read_templates_resource(self):
         """Test reading templates resource."""
-        content = await handle_resource_read("cac://templates")
+        content = handle_resource_read("cac://templates")
 
         # Should be valid JSON array
         data = json.loads(content)
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
-    async def test_invalid_uri_scheme(self):
+    def test_invalid_uri_scheme(self):
         """Test reading resource with invalid URI scheme."""
         with pytest.raises(ValueError, match="Invalid URI scheme"):
-            await handle_resource_read("http://products")
+            handle_resource_read("http://products")
 
-    @pytest.mark.asyncio
-    async def test_invalid_resource_type(self):
+    def test_invalid_resource_type(self):
         """Test reading unknown resource type."""
         with pytest.raises(ValueError, match="Unknown resource type"):
-            await handle_resource_read("cac://unknown")
+            handle_resource_read("cac://unknown")
 
-    @pytest.mark.asyncio
-    async def test_invalid_resource_path(self):
+    def test_invalid_resource_path(self):
         """Test reading resource with invalid path."""
         with pytest.raises(ValueError):
-            await handle_resource_read("cac://products/invalid/extra/path")
+            handle_resource_read("cac://products/invalid/extra/path")
 
-    @pytest.mark.asyncio
-    async def test_nonexistent_product(self):
+    def test_nonexistent_product(self):
         """Test reading non-existent product."""
         with pytest.raises(ValueError, match="not found"):
-            await handle_resource_read("cac://products/nonexistent_product_12345")
+            handle_resource_read("cac://products/nonexistent_product_12345")
 
-    @pytest.mark.asyncio
-    async def test_nonexistent_rule(self):
+    def test_nonexistent_rule(self):
         """Test reading non-existent rule."""
         with pytest.raises(ValueError, match="not found"):
-            await handle_resource_read("cac://rules/nonexistent_rule_12345")
+            handle_resource_read("cac://rules/nonexistent_rule_12345")
 
 
 class TestResourceURIParsing:
     """Test URI parsing logic."""
 
-    @pytest.mark.asyncio
-    async def test_uri_with_trailing_slash(self, initialized_content_repo):
+    def test_uri_with_trailing_slash(self, initialized_content_repo):
         """Test URI with trailing slash."""
         # Should handle trailing slash gracefully
         try:
-            await handle_resource_read("cac://products/")
+            handle_resource_read("cac://products/")
         except ValueError as e:
             # May fail but shouldn't crash
             assert "not found" in str(e).lower() or "invalid" in str(e).lower()
 
-    @pytest.mark.asyncio
-    async def test_empty_path(self, initialized_content_repo):
+    def test_empty_path(self, initialized_content_repo):
         """Test URI with empty path."""
         with pytest.raises(ValueError, match="Invalid resource path"):
-            await handle_resource_read("cac://")
+            handle_resource_read("cac://")
+
+    def test_uri_forms(self, initialized_content_repo):
+        """Test that both URI forms resolve to the same resource."""
+        (initialized_content_repo.path / "controls" / "anssi.yml").write_text("id: anssi\n")
+
+        for uri in [
+            "cac://controls",
+            "cac:controls",
+            "CAC:///controls/?refresh=1#top",
+            "cac://controls//",
+        ]:
+            assert json.loads(handle_resource_read(uri)) == ["anssi"]
+
+    def test_invalid_uris(self, initialized_content_repo):
+        """Test rejection of malformed URIs."""
+        with pytest.raises(ValueError, match="Invalid URI scheme"):
+            handle_resource_read("controls")
+        with pytest.raises(ValueError, match="Unknown resource type"):
+            handle_resource_read("cac://unknown")
+        with pytest.raises(ValueError, match="Invalid controls resource path"):
+            handle_resource_read("cac://controls/anssi")
+
+
+class TestResourceSerialization:
+    """Test JSON serialization of resource responses."""
+
+    def test_product_resources(self, initialized_content_repo):
+        """Test that list and detail resources match the discovery models."""
+        products = json.loads(handle_resource_read("cac://products"))
+        assert products == [p.model_dump(mode="json") for p in discovery.list_products()]
+
+        product = json.loads(handle_resource_read("cac://products/rhel9"))
+        assert product == discovery.get_product_details("rhel9").model_dump(mode="json")
+
+    def test_compact_by_default(self, initialized_content_repo):
+        """Test that output is compact unless pretty printing is requested."""
+        (initialized_content_repo.path / "controls" / "anssi.yml").write_text("id: anssi\n")
+
+        assert handle_resource_read("cac://controls") == '["anssi"]'
+        assert handle_resource_read("cac://controls?pretty=1") == '[\n  "anssi"\n]'
+        assert "\n" not in handle_resource_read("cac://products")
+        assert "\n  " in handle_resource_read("cac://products?pretty=true")
+
+
+class TestResourceResponseCache:
+    """Test caching of serialized resource responses."""
+
+    def test_response_cached_until_invalidated(self, initialized_content_repo):
+        """Test that responses are reused until the cache is invalidated."""
+        controls_dir = initialized_content_repo.path / "controls"
+        (controls_dir / "anssi.yml").write_text("id: anssi\n")
+        first = handle_resource_read("cac://controls")
+
+        (controls_dir / "stig_rhel9.yml").write_text("id: stig_rhel9\n")
+        assert handle_resource_read("cac:controls") is first
+
+        invalidate_resource_cache()
+        assert json.loads(handle_resource_read("cac://controls")) == ["anssi", "stig_rhel9"]
+
+    def test_response_expires(self, initialized_content_repo, monkeypatch):
+        """Test that cached responses expire after the TTL."""
+        controls_dir = initialized_content_repo.path / "controls"
+        first = handle_resource_read("cac://controls")
+        (controls_dir / "anssi.yml").write_text("id: anssi\n")
+
+        monkeypatch.setattr(resources, "RESPONSE_CACHE_TTL", 0.0)
+        assert handle_resource_read("cac://controls") != first
@@ -0,0 +1,178 @@
+"""Unit tests for the Claude client and the AI helpers built on it."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from content_agent.core.ai.claude_client import ClaudeAPIError, ClaudeClient
+from content_agent.core.ai.requirement_extractor import RequirementExtractor
+from content_agent.core.ai.rule_mapper import RuleMapper
+from content_agent.core.integration import get_content_repository
+from content_agent.models.control import DocumentSection
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Provide a client whose API calls are counted instead of sent."""
+    client = ClaudeClient(api_key="test", cache_dir=tmp_path / "cache", max_cache_entries=2)
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=f"reply {len(calls)}")])
+
+    client.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    client.calls = calls
+    return client
+
+
+def test_deterministic_responses_cached(client):
+    """Test that identical deterministic requests are answered from the cache."""
+    assert client.create_message("system", "user") == "reply 1"
+    assert client.create_message("system", "user") == "reply 1"
+    assert client.create_message("system", "other") == "reply 2"
+    assert len(client.calls) == 2
+
+
+def test_sampled_responses_not_cached(client):
+    """Test that requests with a non-zero temperature always reach the API."""
+    client.create_message("system", "user", temperature=0.7)
+    client.create_message("system", "user", temperature=0.7)
+    assert len(client.calls) == 2
+
+
+def test_cache_eviction(client):
+    """Test that the cache keeps at most max_cache_entries responses."""
+    for prompt in ["a", "b", "c"]:
+        client.create_message("system", prompt)
+
+    assert len(list(client.cache_dir.rglob("*.json"))) == 2
+
+
+def test_cache_disabled(client, tmp_path):
+    """Test that the cache is disabled without a cache directory."""
+    client.cache_dir = None
+    client.create_message("system", "user")
+    client.create_message("system", "user")
+    assert len(client.calls) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cache_expiry(client, monkeypatch):
+    """Test that cached responses are not reused after cache_ttl seconds."""
+    client.create_message("system", "user")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + client.cache_ttl + 1)
+
+    assert client.create_message("system", "user") == "reply 2"
+    assert len(client.calls) == 2
+
+
+def test_extract_requirements_batch(client):
+    """Test that batch results are dispatched to their items."""
+    client.create_message = lambda **kwargs: (
+        '{"items": [[{"text": "Passwords must expire"}], [], '
+        '[{"text": "Logs shall be kept", "section_id": "3.1"}]]}'
+    )
+    extractor = RequirementExtractor(client)
+
+    results = extractor.extract_requirements_batch(
+        [("a", "1", "One"), ("b", "2", "Two"), ("c", "3", "Three"), ("d", "4", "Four")]
+    )
+
+    assert [len(r) for r in results] == [1, 0, 1, 0]
+    assert results[0][0].section_id == "1"
+    assert results[0][0].section_title == "One"
+    assert results[2][0].section_id == "3.1"
+    assert extractor.extract_requirements_batch([]) == []
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '{"a": 1}',
+        'Here you go:\n```json\n{"a": 1}\n```',
+        'Sure:\n```\n{"a": 1}\n```',
+        'Example:\n```python\nprint()\n```\nResult:\n```json\n{"a": 1}\n```',
+    ],
+)
+def test_extract_json_response(client, response):
+    """Test JSON extraction from plain and fenced responses."""
+    assert client.extract_json_response(response) == {"a": 1}
+
+
+def test_extract_json_response_invalid(client):
+    """Test that unparseable responses raise ClaudeAPIError."""
+    with pytest.raises(ClaudeAPIError, match="Failed to parse JSON"):
+        client.extract_json_response("no json here")
+
+
+def test_format_section_document_order(client):
+    """Test that nested sections are formatted depth-first in document order."""
+    section = DocumentSection(
+        id="1",
+        title="A",
+        content="x",
+        level=1,
+        subsections=[
+            DocumentSection(
+                id="1.1",
+                title="B",
+                content="y",
+                level=2,
+                subsections=[DocumentSection(id="1.1.1", title="C", content="", level=3)],
+            ),
+            DocumentSection(id="1.2", title="D", content="z", level=2),
+        ],
+    )
+
+    assert RequirementExtractor(client)._format_section(section) == [
+        "## A (ID: 1)",
+        "x",
+        "  ## B (ID: 1.1)",
+        "  y",
+        "    ## C (ID: 1.1.1)",
+        "  ## D (ID: 1.2)",
+        "  z",
+    ]
+
+
+def test_system_prompt_cache_breakpoint(client):
+    """Test that the system prompt is sent as a prompt-cache breakpoint."""
+    client.create_message("system", "user")
+
+    assert client.calls[0]["system"] == [
+        {"type": "text", "text": "system", "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+def test_rule_mapper_discovery(client, initialized_content_repo, tmp_path):
+    """Test that each mapper gets its own RuleDiscovery for its repository."""
+    first = RuleMapper(client)
+    second = RuleMapper(client)
+    assert second.rule_discovery is not first.rule_discovery
+    assert first.rule_discovery.content_repo is initialized_content_repo
+
+    other = RuleMapper(client, content_path=tmp_path / "other")
+    assert other.rule_discovery.content_repo.path == tmp_path / "other"
+    assert get_content_repository() is initialized_content_repo
+
+
+def test_rules_context_sees_rule_changes(client, initialized_content_repo):
+    """Test that the cached rules context picks up added and edited rules."""
+    guide = initialized_content_repo.path / "linux_os" / "guide"
+    (guide / "rule_a").mkdir(parents=True)
+    (guide / "rule_a" / "rule.yml").write_text("title: First rule\ndescription: d\n")
+
+    mapper = RuleMapper(client)
+    context = mapper._build_rules_context()
+    assert "Title: First rule" in context
+    assert mapper._build_rules_context() is context
+
+    (guide / "rule_b").mkdir()
+    (guide / "rule_b" / "rule.yml").write_text("title: Second rule\ndescription: d\n")
+    assert "- rule_b:" in mapper._build_rules_context()
+
+    (guide / "rule_a" / "rule.yml").write_text("title: Renamed first rule\ndescription: d\n")
+    assert "Title: Renamed first rule" in mapper._build_rules_context()
@@ -7,11 +7,14 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
+import content_agent.config.settings as settings_module
 from content_agent.config.settings import (
     BuildSettings,
     ContentSettings,
     Settings,
     TestingSettings,
+    initialize_settings,
+    reload_settings,
 )
 
 
@@ -188,6 +191,17 @@ build:
         finally:
             os.unlink(yaml_path)
 
+    def test_yaml_values_validated(self, tmp_path):
+        """Test YAML values are coerced and checked like constructor arguments."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("build:\n  build_dir: /yaml/builds\n")
+        settings = Settings.load(config_file)
+        assert settings.build.build_dir == Path("/yaml/builds")
+
+        config_file.write_text("build:\n  timeout: 1\n")
+        with pytest.raises(ValidationError):
+            Settings.load(config_file)
+
     def test_env_overrides_defaults(self):
         """Test environment variables override defaults when no YAML file provided."""
         # Clean up environment first
@@ -224,3 +238,56 @@ class TestPathExpansion:
         expanded = settings.managed_path.expanduser()
         assert "~" not in str(expanded)
         assert str(expanded).startswith(str(Path.home()))
+
+
+class TestInitializeSettings:
+    """Test repeated settings initialization."""
+
+    def test_initialize_settings_reuses_settings(self, tmp_path, monkeypatch):
+        """Test that settings are only reloaded when their inputs change."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("content:\n  branch: first\n")
+        monkeypatch.setenv("CONTENT_AGENT_BUILD__BUILD_DIR", str(tmp_path / "build"))
+        monkeypatch.setenv("CONTENT_AGENT_CONTENT__MANAGED_PATH", str(tmp_path / "content"))
+        monkeypatch.setattr(settings_module, "_settings", None)
+        monkeypatch.setattr(settings_module, "_settings_cache", {})
+
+        first = initialize_settings(config_file)
+        assert initialize_settings(config_file) is first
+        assert first.content.branch == "first"
+
+        config_file.write_text("content:\n  branch: second\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = initialize_settings(config_file)
+        assert second is not first
+        assert second.content.branch == "second"
+
+        monkeypatch.setenv("CONTENT_AGENT_TESTING__BACKEND", "docker")
+        third = initialize_settings(config_file)
+        assert third is not second
+        assert third.testing.backend == "docker"
+
+        assert reload_settings(config_file) is not third
+
+
+class TestYamlCache:
+    """Test caching of parsed config files."""
+
+    def test_load_yaml_cached(self, tmp_path, monkeypatch):
+        """Test that parsed YAML is reused until the file changes."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("content:\n  branch: first\n")
+        monkeypatch.setattr(settings_module, "_yaml_cache", {})
+
+        first = settings_module._load_yaml_cached(config_file)
+        first["content"]["branch"] = "modified"
+        assert settings_module._load_yaml_cached(config_file) == {"content": {"branch": "first"}}
+        assert len(settings_module._yaml_cache) == 1
+
+        config_file.write_text("content:\n  branch: second\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert settings_module._load_yaml_cached(config_file)["content"]["branch"] == "second"
+        # The edited file replaces its entry instead of adding one
+        assert len(settings_module._yaml_cache) == 1
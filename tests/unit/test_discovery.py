@@ -0,0 +1,732 @@
+"""Unit tests for content discovery."""
+
+import json
+import os
+import shutil
+from collections import OrderedDict
+
+import pytest
+
+from content_agent.core import discovery
+from content_agent.core.discovery import (
+    build_artifacts,
+    cache,
+    controls,
+    products,
+    profiles,
+    rules,
+    warmup,
+)
+from content_agent.core.discovery.build_artifacts import BuildArtifactsDiscovery
+from content_agent.core.discovery.controls import ControlDiscovery
+from content_agent.core.integration import initialize_content_repository
+
+SAMPLE_DATASTREAM = """<?xml version="1.0"?>
+<ds:data-stream-collection xmlns:ds="http://scap.nist.gov/schema/scap/source/1.2"
+    xmlns:xccdf="http://checklists.nist.gov/xccdf/1.2">
+  <ds:component>
+    <xccdf:Benchmark id="xccdf_org.ssgproject.content_benchmark_RHEL-9">
+      <xccdf:Profile id="xccdf_org.ssgproject.content_profile_ospp"/>
+      <xccdf:Profile id="xccdf_org.ssgproject.content_profile_stig"/>
+      <xccdf:Group id="xccdf_org.ssgproject.content_group_services">
+        <xccdf:Rule id="xccdf_org.ssgproject.content_rule_sshd_set_idle_timeout"/>
+      </xccdf:Group>
+    </xccdf:Benchmark>
+  </ds:component>
+</ds:data-stream-collection>
+"""
+
+
+@pytest.fixture
+def sample_rule(initialized_content_repo, sample_rule_yaml):
+    """Create a sample rule in the mock content repository."""
+    rule_dir = initialized_content_repo.path / "linux_os" / "guide" / "sshd_set_idle_timeout"
+    rule_dir.mkdir(parents=True)
+    rule_yml = rule_dir / "rule.yml"
+    rule_yml.write_text(sample_rule_yaml)
+    return rule_yml
+
+
+@pytest.fixture
+def build_dir(initialized_content_repo):
+    """Create build artifacts for rhel9 (with datastream) and fedora (without)."""
+    build = initialized_content_repo.build_path
+    (build / "rhel9" / "rules").mkdir(parents=True)
+    (build / "fedora" / "rules").mkdir(parents=True)
+    (build / "ssg-rhel9-ds.xml").write_text(SAMPLE_DATASTREAM)
+
+    rule_id = "sshd_set_idle_timeout"
+    (build / "rhel9" / "rules" / f"{rule_id}.json").write_text(
+        '{"title": "Set SSH ClientAliveInterval", "severity": "medium"}'
+    )
+    (build / "rhel9" / "fixes_from_templates" / "bash").mkdir(parents=True)
+    (build / "rhel9" / "fixes_from_templates" / "bash" / f"{rule_id}.sh").write_text(
+        "echo 'ClientAliveInterval 300' >> /etc/ssh/sshd_config\n"
+    )
+    (build / "rhel9" / "checks" / "oval").mkdir(parents=True)
+    (build / "rhel9" / "checks" / "oval" / f"{rule_id}.xml").write_text(
+        "<def-group><definition id='sshd_set_idle_timeout'/></def-group>\n"
+    )
+    return build
+
+
+def _touch(path):
+    """Bump the mtime of a path in case the filesystem timestamp is coarse."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestControlDiscovery:
+    """Test ControlDiscovery."""
+
+    def test_list_controls(self, initialized_content_repo):
+        """Test listing control frameworks."""
+        controls_dir = initialized_content_repo.path / "controls"
+        (controls_dir / "cis_rhel9.yml").write_text("id: cis_rhel9\n")
+        (controls_dir / "anssi.yml").write_text("id: anssi\n")
+
+        assert ControlDiscovery().list_controls() == ["anssi", "cis_rhel9"]
+
+    def test_list_controls_cache_invalidation(self, initialized_content_repo):
+        """Test that the cached listing is refreshed when the directory changes."""
+        controls_dir = initialized_content_repo.path / "controls"
+        (controls_dir / "anssi.yml").write_text("id: anssi\n")
+
+        discovery = ControlDiscovery()
+        assert discovery.list_controls() == ["anssi"]
+
+        (controls_dir / "stig_rhel9.yml").write_text("id: stig_rhel9\n")
+        _touch(controls_dir)
+
+        assert discovery.list_controls() == ["anssi", "stig_rhel9"]
+
+    def test_list_controls_missing_dir(self, initialized_content_repo):
+        """Test listing controls without a controls directory."""
+        (initialized_content_repo.path / "controls").rmdir()
+
+        assert ControlDiscovery().list_controls() == []
+
+    def test_parse_control_file_cache(self, initialized_content_repo):
+        """Test that control files are reparsed only when they or their includes change."""
+        controls_dir = initialized_content_repo.path / "controls"
+        control_path = controls_dir / "anssi.yml"
+        control_path.write_text("id: anssi\ntitle: ANSSI\nincludes:\n  - r1.yml\n")
+        (controls_dir / "anssi").mkdir()
+        requirement_path = controls_dir / "anssi" / "r1.yml"
+        requirement_path.write_text("id: R1\ntitle: First\ndescription: d\n")
+
+        discovery = ControlDiscovery()
+        first = discovery.parse_control_file(control_path)
+        assert [c.title for c in first.controls] == ["First"]
+        cached = controls._control_file_cache[control_path]
+        again = discovery.parse_control_file(control_path)
+        assert controls._control_file_cache[control_path] is cached
+        assert again == first
+        # Callers get their own copy of the cached model
+        first.controls[0].title = "Modified"
+        assert again.controls[0].title == "First"
+
+        requirement_path.write_text("id: R1\ntitle: Changed\ndescription: d\n")
+        _touch(requirement_path)
+        second = discovery.parse_control_file(control_path)
+        assert [c.title for c in second.controls] == ["Changed"]
+
+        control_path.write_text("id: anssi\ntitle: ANSSI v2\n")
+        _touch(control_path)
+        assert discovery.parse_control_file(control_path).title == "ANSSI v2"
+
+    def test_control_file_cache_bounded(self, initialized_content_repo, tmp_path, monkeypatch):
+        """Test that the control file cache evicts the least recently used files."""
+        monkeypatch.setattr(controls, "_CONTROL_FILE_CACHE_SIZE", 2)
+        monkeypatch.setattr(controls, "_control_file_cache", OrderedDict())
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.yml"
+            path.write_text(f"id: {name}\ntitle: {name}\n")
+            paths.append(path)
+
+        discovery = ControlDiscovery()
+        for path in paths:
+            discovery.parse_control_file(path)
+
+        assert list(controls._control_file_cache) == paths[1:]
+
+    def test_module_functions_share_discovery(self, initialized_content_repo):
+        """Test that module-level functions reuse one instance per content repository."""
+        controls.list_controls()
+        discovery = cache._shared_instances[ControlDiscovery]
+        controls.get_control_details("missing")
+        assert cache._shared_instances[ControlDiscovery] is discovery
+        assert discovery.content_repo is initialized_content_repo
+
+        other_path = initialized_content_repo.path.parent / "other"
+        for name in ["ssg", "linux_os", "products"]:
+            (other_path / name).mkdir(parents=True)
+        repo = initialize_content_repository(other_path)
+        assert controls.list_controls() == []
+        assert cache._shared_instances[ControlDiscovery] is not discovery
+        assert cache._shared_instances[ControlDiscovery].content_repo is repo
+
+
+class TestProductDiscovery:
+    """Test ProductDiscovery."""
+
+    def test_list_products_reuses_summaries(self, initialized_content_repo):
+        """Test that unchanged product.yml files are not parsed again."""
+        first = products.list_products()
+        second = products.list_products()
+        assert [p.product_id for p in first] == ["rhel9"]
+        assert second[0] is first[0]
+
+        product_yml = initialized_content_repo.path / "products" / "rhel9" / "product.yml"
+        product_yml.write_text(product_yml.read_text().replace("Linux 9", "Linux 9.4"))
+        _touch(product_yml)
+        assert products.list_products()[0].name == "Red Hat Enterprise Linux 9.4"
+
+    def test_product_details_cache(self, initialized_content_repo):
+        """Test that product details are reused until product.yml or profiles change."""
+        first = products.get_product_details("rhel9")
+        assert products.get_product_details("rhel9") is first
+        assert (
+            cache._shared_instances[products.ProductDiscovery].content_repo
+            is initialized_content_repo
+        )
+
+        profiles_dir = initialized_content_repo.path / "products" / "rhel9" / "profiles"
+        (profiles_dir / "cis.profile").write_text("title: CIS\n")
+        _touch(profiles_dir)
+        second = products.get_product_details("rhel9")
+        assert "cis" in second.profiles
+        assert second is not first
+
+    def test_warm_caches(self, build_dir, monkeypatch):
+        """Test that warming populates the listing caches and tolerates failures."""
+
+        def fail_listing():
+            raise RuntimeError("controls unavailable")
+
+        monkeypatch.setattr(warmup, "list_controls", fail_listing)
+        discovery.warm_caches()
+
+        assert build_dir in build_artifacts._built_products_cache
+        assert (build_dir.parent / "products" / "rhel9" / "product.yml") in (
+            products._summary_cache
+        )
+
+
+class TestRuleDetailsCache:
+    """Test the get_rule_details result cache."""
+
+    def test_repeated_calls_hit_cache(self, sample_rule, monkeypatch):
+        """Test that identical calls are served from the cache as separate copies."""
+        first = rules.get_rule_details("sshd_set_idle_timeout")
+        assert first is not None
+        assert first.title == "Configure SSH Idle Timeout"
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("cached details should not be reloaded")
+
+        monkeypatch.setattr(rules.RuleDiscovery, "get_rule_details", fail_load)
+        first.checks["modified"] = True
+        second = rules.get_rule_details("sshd_set_idle_timeout")
+
+        assert second is not first
+        assert "modified" not in second.checks
+        assert second.title == first.title
+
+    def test_modified_rule_invalidates_cache(self, sample_rule):
+        """Test that editing rule.yml invalidates the cached details."""
+        first = rules.get_rule_details("sshd_set_idle_timeout")
+
+        sample_rule.write_text(sample_rule.read_text().replace("Configure SSH", "Set SSH"))
+        _touch(sample_rule)
+        second = rules.get_rule_details("sshd_set_idle_timeout")
+
+        assert second is not first
+        assert second.title == "Set SSH Idle Timeout"
+
+    def test_rule_directory_change_invalidates_cache(self, sample_rule):
+        """Test that new checks and test scenarios invalidate the cached details."""
+        assert rules.get_rule_details("sshd_set_idle_timeout").test_scenarios == []
+
+        tests_dir = sample_rule.parent / "tests"
+        tests_dir.mkdir()
+        details = rules.get_rule_details("sshd_set_idle_timeout")
+        assert details.test_scenarios == []
+
+        (tests_dir / "correct_value.pass.sh").write_text("#!/bin/bash\n")
+        _touch(tests_dir)
+        details = rules.get_rule_details("sshd_set_idle_timeout")
+        assert details.test_scenarios == ["correct_value.pass.sh"]
+
+    def test_missing_rule_not_cached(self, initialized_content_repo):
+        """Test that a not-found result is not cached."""
+        assert rules.get_rule_details("sshd_set_idle_timeout") is None
+
+        rule_dir = initialized_content_repo.path / "linux_os" / "sshd_set_idle_timeout"
+        rule_dir.mkdir()
+        (rule_dir / "rule.yml").write_text("title: Idle Timeout\n")
+
+        assert rules.get_rule_details("sshd_set_idle_timeout").title == "Idle Timeout"
+
+
+class TestProfileDiscovery:
+    """Test ProfileDiscovery."""
+
+    def test_module_functions_share_discovery(
+        self, initialized_content_repo, sample_profile_content
+    ):
+        """Test that module-level functions reuse one instance per content repository."""
+        profiles_dir = initialized_content_repo.path / "products" / "rhel9" / "profiles"
+        profiles_dir.mkdir(exist_ok=True)
+        (profiles_dir / "ospp.profile").write_text(sample_profile_content)
+
+        assert [p.profile_id for p in profiles.list_profiles("rhel9")] == ["ospp"]
+        discovery = cache._shared_instances[profiles.ProfileDiscovery]
+        assert profiles.get_profile_details("ospp", "rhel9").rule_count == 3
+        assert cache._shared_instances[profiles.ProfileDiscovery] is discovery
+        assert discovery.content_repo is initialized_content_repo
+
+    def test_parse_profile(self, initialized_content_repo):
+        """Test parsing the profile format, including comments and nested metadata."""
+        content = (
+            "documentation_complete: true\n"
+            "metadata:\n"
+            "    SMEs:\n"
+            "        - someone\n"
+            "title: 'OSPP'\n"
+            "description: |-\n"
+            "    First line.\n"
+            "\n"
+            "    Second line.\n"
+            "extends: base\n"
+            "selections:\n"
+            "    - sshd_set_idle_timeout\n"
+            "# comment\n"
+            "    - '!unselect_me'\n"
+            "    - !unselect old_rule\n"
+            "    - var_password_minlen=15\n"
+            "platform: machine\n"
+            "    - not_a_selection\n"
+        )
+
+        data = profiles.ProfileDiscovery()._parse_profile(content)
+
+        assert data["title"] == "OSPP"
+        assert data["description"] == "|- First line. Second line."
+        assert data["extends"] == "base"
+        assert data["selections"] == [
+            "sshd_set_idle_timeout",
+            "'!unselect_me'",
+            "var_password_minlen=15",
+        ]
+
+
+class TestRuleDiscovery:
+    """Test RuleDiscovery."""
+
+    def test_rule_index(self, sample_rule, initialized_content_repo):
+        """Test that rules are indexed by directory name across the search paths."""
+        nested = initialized_content_repo.path / "shared" / "a" / "b" / "package_installed"
+        nested.mkdir(parents=True)
+        (nested / "rule.yml").write_text("title: Package installed\n")
+        (initialized_content_repo.path / "linux_os" / "link").symlink_to(nested.parent)
+
+        discovery = rules.RuleDiscovery()
+        discovery._build_rule_index()
+
+        assert discovery._rule_cache == {
+            "sshd_set_idle_timeout": sample_rule,
+            "package_installed": nested / "rule.yml",
+        }
+
+    def test_rule_index_concurrent_scan_keeps_walk_order(
+        self, initialized_content_repo, monkeypatch
+    ):
+        """Test that splitting the scan across workers keeps duplicate-id precedence."""
+        for rel in ["linux_os/a/dup", "linux_os/a/b/c/dup", "linux_os/b/dup", "shared/dup"]:
+            rule_dir = initialized_content_repo.path / rel
+            rule_dir.mkdir(parents=True)
+            (rule_dir / "rule.yml").write_text(f"title: {rel}\n")
+
+        concurrent = rules.RuleDiscovery()
+        concurrent._build_rule_index()
+        monkeypatch.setattr(rules, "INDEX_SPLIT_DEPTH", 0)
+        monkeypatch.setattr(rules, "_rule_trees", {})
+        sequential = rules.RuleDiscovery()
+        sequential._build_rule_index()
+
+        assert concurrent._rule_cache == sequential._rule_cache
+        assert (
+            concurrent._rule_cache["dup"] == initialized_content_repo.path / "shared/dup/rule.yml"
+        )
+
+    def test_rule_index_reuses_thread_pool(self, sample_rule, monkeypatch):
+        """Test that repeated index builds share one thread pool."""
+        monkeypatch.setattr(rules, "_index_executor", None)
+        # Scan each search root as a subtree, so the scan is spread over the pool
+        monkeypatch.setattr(rules, "INDEX_SPLIT_DEPTH", 0)
+        discovery = rules.RuleDiscovery()
+        discovery._build_rule_index()
+        executor = rules._index_executor
+        assert executor is not None
+
+        discovery.refresh_index()
+        assert rules._index_executor is executor
+        assert discovery._rule_cache == {"sshd_set_idle_timeout": sample_rule}
+
+    def test_rule_index_rescans_changed_directories(
+        self, sample_rule, initialized_content_repo, monkeypatch
+    ):
+        """Test that later index builds only list directories that changed."""
+        rules.RuleDiscovery()._build_rule_index()
+        listed = []
+        scandir = os.scandir
+        monkeypatch.setattr(rules.os, "scandir", lambda p: listed.append(p) or scandir(p))
+
+        discovery = rules.RuleDiscovery()
+        discovery._build_rule_index()
+        assert listed == []
+        assert list(discovery._rule_cache) == ["sshd_set_idle_timeout"]
+
+        guide = initialized_content_repo.path / "linux_os" / "guide"
+        (guide / "sshd_disable_root_login").mkdir()
+        (guide / "sshd_disable_root_login" / "rule.yml").write_text("title: Root login\n")
+        _touch(guide)
+        discovery._build_rule_index()
+        assert sorted(listed) == [str(guide), str(guide / "sshd_disable_root_login")]
+        assert sorted(discovery._rule_cache) == ["sshd_disable_root_login", "sshd_set_idle_timeout"]
+
+    def test_rule_index_snapshot(
+        self, sample_rule, initialized_content_repo, tmp_path, monkeypatch
+    ):
+        """Test that a new process reuses the scanned rule tree from the snapshot."""
+        monkeypatch.setattr(rules, "_rule_index_cache_dir", None)
+        rules.enable_rule_index_snapshot(tmp_path / "cache")
+        rules.RuleDiscovery()._build_rule_index()
+        assert len(list((tmp_path / "cache").glob("rule_index-*.json"))) == 1
+
+        monkeypatch.setattr(rules, "_rule_trees", {})
+        listed = []
+        scandir = os.scandir
+        monkeypatch.setattr(rules.os, "scandir", lambda p: listed.append(p) or scandir(p))
+        discovery = rules.RuleDiscovery()
+        discovery._build_rule_index()
+
+        assert listed == []
+        assert discovery._rule_cache == {"sshd_set_idle_timeout": sample_rule}
+
+    def test_rule_index_snapshot_validated(
+        self, sample_rule, initialized_content_repo, tmp_path, monkeypatch
+    ):
+        """Test that snapshots naming directories outside the repository are ignored."""
+        monkeypatch.setattr(rules, "_rule_index_cache_dir", None)
+        rules.enable_rule_index_snapshot(tmp_path / "cache")
+        rules.RuleDiscovery()._build_rule_index()
+        (snapshot_path,) = (tmp_path / "cache").glob("rule_index-*.json")
+
+        original = snapshot_path.read_text()
+        snapshot = json.loads(original)
+        snapshot["tree"]["/etc"] = [0, [], True]
+        snapshot_path.write_text(json.dumps(snapshot))
+        monkeypatch.setattr(rules, "_rule_trees", {})
+        assert rules._load_rule_tree(initialized_content_repo.path) == {}
+
+        # Subdirectories are walked too, so they must stay inside the repository
+        parent = min(json.loads(original)["tree"])
+        for subdir in ("/etc", os.path.join(parent, os.pardir), os.path.join(parent, "a", "b")):
+            snapshot = json.loads(original)
+            snapshot["tree"][parent][1].append(subdir)
+            snapshot_path.write_text(json.dumps(snapshot))
+            assert rules._load_rule_tree(initialized_content_repo.path) == {}
+
+        snapshot_path.write_text('{"version": 1, "path": "x", "tree": []}')
+        assert rules._load_rule_tree(initialized_content_repo.path) == {}
+
+    def test_search_results_reused_until_rule_changes(self, sample_rule):
+        """Test that unchanged rules are not parsed again by later searches."""
+        first = rules.search_rules("idle")
+        assert [r.rule_id for r in first] == ["sshd_set_idle_timeout"]
+        assert rules.search_rules("timeout")[0] is first[0]
+
+        sample_rule.write_text(sample_rule.read_text().replace("Configure SSH", "Set SSH"))
+        _touch(sample_rule)
+        assert rules.search_rules("idle")[0].title == "Set SSH Idle Timeout"
+
+    def test_rule_parsed_once_for_search_and_details(self, sample_rule, monkeypatch):
+        """Test that a searched rule is not parsed again for its details."""
+        parsed = []
+        safe_load = rules.safe_load
+        monkeypatch.setattr(rules, "safe_load", lambda f: parsed.append(f.name) or safe_load(f))
+
+        assert rules.search_rules("idle")
+        assert rules.get_rule_details("sshd_set_idle_timeout", include_rendered=False)
+        assert parsed == [str(sample_rule)]
+
+    def test_extract_products_from_identifiers(self, initialized_content_repo):
+        """Test that products are taken from qualified identifier and reference keys."""
+        data = {
+            "identifiers": {"cce@rhel9": "CCE-1", "cce@rhel8": "CCE-2", "cce": "CCE-3"},
+            "references": {"stigid@rhel9": "RHEL-09", "nist": "AC-2"},
+        }
+
+        extract = rules.RuleDiscovery()._extract_products_from_identifiers
+        assert extract(data) == ["rhel8", "rhel9"]
+        assert extract({}) == []
+
+    def test_rule_directory_contents(self, sample_rule):
+        """Test detection of remediations, checks and test scenarios."""
+        rule_dir = sample_rule.parent
+        (rule_dir / "bash").mkdir()
+        (rule_dir / "bash" / "shared.sh").write_text("true\n")
+        (rule_dir / "ansible").mkdir()
+        (rule_dir / "puppet.sh").write_text("true\n")
+        (rule_dir / "oval").mkdir()
+        (rule_dir / "tests").mkdir()
+        for name in ["wrong.fail.sh", "correct.pass.sh", "README"]:
+            (rule_dir / "tests" / name).write_text("")
+
+        details = rules.RuleDiscovery().get_rule_details(
+            "sshd_set_idle_timeout", include_rendered=False
+        )
+
+        assert details.remediations == {
+            "bash": True,
+            "ansible": False,
+            "anaconda": False,
+            "puppet": True,
+            "ignition": False,
+        }
+        assert details.checks == {"oval": True}
+        assert details.test_scenarios == ["correct.pass.sh", "wrong.fail.sh"]
+
+
+class TestBuildArtifactsDiscovery:
+    """Test BuildArtifactsDiscovery."""
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_get_datastream_info(self, build_dir, monkeypatch, use_lxml):
+        """Test reading datastream metadata and counts with and without lxml."""
+        if use_lxml:
+            pytest.importorskip("lxml")
+        else:
+            monkeypatch.setattr(build_artifacts, "etree", None)
+        info = BuildArtifactsDiscovery().get_datastream_info("rhel9")
+
+        assert info.exists is True
+        assert info.datastream_path == "build/ssg-rhel9-ds.xml"
+        assert info.file_size == (build_dir / "ssg-rhel9-ds.xml").stat().st_size
+        assert info.profiles_count == 2
+        assert info.rules_count == 1
+
+    def test_datastream_counts_cached(self, build_dir, monkeypatch):
+        """Test that an unchanged datastream is not parsed again."""
+        discovery = BuildArtifactsDiscovery()
+        first = discovery.get_datastream_info("rhel9")
+
+        def fail_count(f):
+            raise AssertionError("datastream parsed again")
+
+        monkeypatch.setattr(build_artifacts, "_count_profiles_and_rules", fail_count)
+        assert discovery.get_datastream_info("rhel9") == first
+
+        datastream = build_dir / "ssg-rhel9-ds.xml"
+        datastream.write_text(SAMPLE_DATASTREAM.replace("content_profile_stig", "stig"))
+        monkeypatch.undo()
+        assert discovery.get_datastream_info("rhel9").file_size == datastream.stat().st_size
+
+    def test_list_built_products_with_info(self, build_dir):
+        """Test that the batched listing matches per-product lookups."""
+        discovery = BuildArtifactsDiscovery()
+        infos = discovery.list_built_products_with_info()
+
+        assert [i.product for i in infos] == discovery.list_built_products()
+        assert infos == [discovery.get_datastream_info(p) for p in ["fedora", "rhel9"]]
+        assert infos[0].exists is False
+
+    def test_module_functions_share_discovery(self, build_dir, initialized_content_repo):
+        """Test that module-level functions reuse one instance per content repository."""
+        assert build_artifacts.list_built_products() == ["fedora", "rhel9"]
+        discovery = cache._shared_instances[BuildArtifactsDiscovery]
+        build_artifacts.get_rendered_rule("rhel9", "sshd_set_idle_timeout")
+        assert cache._shared_instances[BuildArtifactsDiscovery] is discovery
+        assert discovery.content_repo is initialized_content_repo
+
+    def test_list_built_products_cache(self, build_dir):
+        """Test that product builds appearing after the first listing are picked up."""
+        discovery = BuildArtifactsDiscovery()
+        (build_dir / "ubuntu2204").mkdir()
+        _touch(build_dir)
+        assert discovery.list_built_products() == ["fedora", "rhel9"]
+
+        (build_dir / "ubuntu2204" / "rules").mkdir()
+        _touch(build_dir / "ubuntu2204")
+        assert discovery.list_built_products() == ["fedora", "rhel9", "ubuntu2204"]
+
+        shutil.rmtree(build_dir / "rhel9")
+        _touch(build_dir)
+        assert discovery.list_built_products() == ["fedora", "ubuntu2204"]
+
+    def test_search_stops_inspecting_products_at_limit(self, build_dir, monkeypatch):
+        """Test that products after the one filling the limit are not inspected."""
+        (build_dir / "centos" / "rules").mkdir(parents=True)
+        (build_dir / "centos" / "rules" / "sshd_rule.json").write_text('{"title": "sshd"}')
+        inspected = []
+        is_product_build_dir = BuildArtifactsDiscovery._is_product_build_dir
+
+        def spy(self, path):
+            inspected.append(path.name)
+            return is_product_build_dir(self, path)
+
+        monkeypatch.setattr(BuildArtifactsDiscovery, "_is_product_build_dir", spy)
+        results = BuildArtifactsDiscovery().search_rendered_content("sshd", limit=1)
+
+        assert [r.product for r in results] == ["centos"]
+        assert inspected == ["centos"]
+        assert build_dir not in build_artifacts._built_products_cache
+
+    def test_search_rendered_content(self, build_dir):
+        """Test case-insensitive search across rendered artifacts."""
+        results = BuildArtifactsDiscovery().search_rendered_content("clientalive")
+
+        assert [r.match_type for r in results] == ["rule_json", "remediation_bash"]
+        assert {r.rule_id for r in results} == {"sshd_set_idle_timeout"}
+        assert "ClientAliveInterval 300" in results[1].match_snippet
+
+    def test_search_rendered_content_limit(self, build_dir):
+        """Test that search stops once the limit is reached."""
+        results = BuildArtifactsDiscovery().search_rendered_content("sshd", limit=1)
+
+        assert len(results) == 1
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_get_rendered_rule(self, build_dir, monkeypatch, use_orjson):
+        """Test reading rendered rule artifacts with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(build_artifacts, "orjson", None)
+        rendered = BuildArtifactsDiscovery().get_rendered_rule("rhel9", "sshd_set_idle_timeout")
+
+        assert "title: Set SSH ClientAliveInterval" in rendered.rendered_yaml
+        assert rendered.rendered_oval.startswith("<def-group>")
+        assert list(rendered.rendered_remediations) == ["bash"]
+        assert rendered.build_path == "build/rhel9/rules"
+
+        assert BuildArtifactsDiscovery().get_rendered_rule("rhel9", "missing_rule") is None
+
+    def test_rendered_index_picks_up_new_files(self, build_dir):
+        """Test that newly built artifacts are found after the index was populated."""
+        discovery = BuildArtifactsDiscovery()
+        rule_id = "sshd_set_idle_timeout"
+        assert "ansible" not in discovery.get_rendered_rule("rhel9", rule_id).rendered_remediations
+
+        ansible_dir = build_dir / "rhel9" / "fixes_from_templates" / "ansible"
+        ansible_dir.mkdir()
+        (ansible_dir / f"{rule_id}.yml").write_text("- name: Set ClientAliveInterval\n")
+        _touch(ansible_dir)
+
+        rendered = discovery.get_rendered_rule("rhel9", rule_id)
+        assert rendered.rendered_remediations["ansible"].startswith("- name:")
+
+    def test_rewritten_artifact_is_reread(self, build_dir):
+        """Test that an artifact rewritten in place is not served stale from the cache."""
+        discovery = BuildArtifactsDiscovery()
+        oval_path = build_dir / "rhel9" / "checks" / "oval" / "sshd_set_idle_timeout.xml"
+        assert (
+            "<definition"
+            in discovery.get_rendered_rule("rhel9", "sshd_set_idle_timeout").rendered_oval
+        )
+
+        oval_path.write_text("<def-group><criteria operator='AND'/></def-group>\n")
+        _touch(oval_path)
+
+        rendered = discovery.get_rendered_rule("rhel9", "sshd_set_idle_timeout")
+        assert "<criteria" in rendered.rendered_oval
+        assert discovery.search_rendered_content("criteria")[0].match_type == "oval"
+
+    def test_get_rendered_rules_batch(self, build_dir):
+        """Test fetching rendered content for several products at once."""
+        batch = BuildArtifactsDiscovery().get_rendered_rules_batch(
+            ["rhel9", "fedora"], "sshd_set_idle_timeout"
+        )
+
+        assert list(batch) == ["rhel9", "fedora"]
+        assert batch["rhel9"].product == "rhel9"
+        assert batch["fedora"] is None
+
+    def test_rule_details_include_rendered(self, build_dir, sample_rule):
+        """Test that rule details carry per-product rendered metadata."""
+        details = rules.get_rule_details("sshd_set_idle_timeout")
+
+        assert list(details.rendered) == ["rhel9"]
+        rendered = details.rendered["rhel9"]
+        assert rendered.has_oval is True
+        assert rendered.available_remediations == ["bash"]
+        assert rendered.rendered_oval is None
+        assert rendered.build_time is not None
+
+    def test_rule_details_metadata_not_read(self, build_dir, sample_rule, monkeypatch):
+        """Test that metadata sizes come from stat() without reading OVAL or scripts."""
+        product_build = build_dir / "rhel9"
+        oval_path = product_build / "checks" / "oval" / "sshd_set_idle_timeout.xml"
+        bash_path = product_build / "fixes_from_templates" / "bash" / "sshd_set_idle_timeout.sh"
+        read_text = build_artifacts._rendered_contents.read_text
+
+        def guarded_read_text(path):
+            assert path not in (oval_path, bash_path), f"{path.name} was read"
+            return read_text(path)
+
+        monkeypatch.setattr(build_artifacts._rendered_contents, "read_text", guarded_read_text)
+
+        rendered = rules.get_rule_details("sshd_set_idle_timeout").rendered["rhel9"]
+        assert rendered.oval_size == oval_path.stat().st_size
+        assert rendered.remediation_sizes == {"bash": bash_path.stat().st_size}
+
+        monkeypatch.undo()
+        full = rules.get_rule_details("sshd_set_idle_timeout", rendered_detail="full")
+        full_rendered = full.rendered["rhel9"]
+        assert rendered.has_yaml is True
+        assert rendered.yaml_size == full_rendered.yaml_size
+        assert rendered.oval_size == full_rendered.oval_size
+        assert rendered.remediation_sizes == full_rendered.remediation_sizes
+
+    def test_rule_details_unreadable_render_skipped(self, build_dir, sample_rule):
+        """Test that both detail levels skip a product whose rendered rule is unreadable."""
+        rule_json = build_dir / "rhel9" / "rules" / "sshd_set_idle_timeout.json"
+        rule_json.write_text("{not json")
+
+        metadata = rules.get_rule_details("sshd_set_idle_timeout")
+        full = rules.get_rule_details("sshd_set_idle_timeout", rendered_detail="full")
+
+        assert metadata.rendered is None
+        assert full.rendered is None
+
+    def test_rule_details_sizes_in_bytes(self, build_dir, sample_rule):
+        """Test that full mode reports the same byte sizes as metadata mode."""
+        oval_path = build_dir / "rhel9" / "checks" / "oval" / "sshd_set_idle_timeout.xml"
+        oval_path.write_text("<def><title>Délai d'inactivité</title></def>\n", encoding="utf-8")
+
+        metadata = rules.get_rule_details("sshd_set_idle_timeout").rendered["rhel9"]
+        full = rules.get_rule_details("sshd_set_idle_timeout", rendered_detail="full")
+
+        assert metadata.oval_size == oval_path.stat().st_size
+        assert full.rendered["rhel9"].oval_size == metadata.oval_size
+
+    def test_rule_details_product_filter(self, build_dir, sample_rule, monkeypatch):
+        """Test that a product filter reads that product without listing all builds."""
+
+        def fail_listing():
+            raise AssertionError("built products should not be listed")
+
+        monkeypatch.setattr(build_artifacts, "list_built_products", fail_listing)
+
+        details = rules.get_rule_details("sshd_set_idle_timeout", product="rhel9")
+        assert list(details.rendered) == ["rhel9"]
+
+    def test_rule_details_prodtype(self, build_dir, sample_rule):
+        """Test that rendered content is only gathered for products in prodtype."""
+        sample_rule.write_text(sample_rule.read_text() + "prodtype: fedora,rhel8\n")
+
+        details = rules.get_rule_details("sshd_set_idle_timeout")
+        assert details.rendered is None
@@ -0,0 +1,15 @@
+"""Unit tests for the command line entry point."""
+
+import logging
+
+from content_agent.__main__ import _SecondCachedFormatter
+
+
+def test_second_cached_formatter():
+    """Test that timestamps are reused within a second and refreshed after it."""
+    formatter = _SecondCachedFormatter("%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    plain = logging.Formatter("%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+    for created in [1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.0, 1_700_003_600.5]:
+        record = logging.makeLogRecord({"msg": "hello", "created": created})
+        assert formatter.format(record) == plain.format(record)
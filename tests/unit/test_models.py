@@ -14,6 +14,7 @@ from content_agent.models import (
     TemplateSchema,
     ValidationError,
     ValidationResult,
+    serialize,
 )
 
 
@@ -283,3 +284,26 @@ class TestModelSerialization:
 
         assert loaded.rule_id == original.rule_id
         assert loaded.severity == original.severity
+
+    def test_serialize(self, monkeypatch):
+        """Test serialize() output with and without orjson."""
+        from content_agent.models import serialization
+
+        rule = RuleDetails(
+            rule_id="test_rule",
+            title="Test Rule – é",
+            description="Test description",
+            severity="high",
+            file_path="test/rule.yml",
+            rule_dir="test/",
+        )
+        payload = {"rules": [rule], "count": 1}
+
+        json_str = serialize(payload)
+        monkeypatch.setattr(serialization, "orjson", None)
+        fallback_str = serialize(payload)
+
+        assert json_str == fallback_str
+        loaded = json.loads(json_str)
+        assert loaded["count"] == 1
+        assert RuleDetails(**loaded["rules"][0]) == rule
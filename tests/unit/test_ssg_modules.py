@@ -0,0 +1,66 @@
+"""Unit tests for the SSG modules wrapper."""
+
+import sys
+
+import pytest
+
+from content_agent.core.integration.ssg_modules import SSGModules
+
+
+@pytest.fixture
+def fake_ssg(tmp_path, monkeypatch):
+    """Provide a minimal importable ``ssg`` package."""
+    package = tmp_path / "ssg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "rules.py").write_text("NAME = 'rules'\n")
+    (package / "constants.py").write_text("NAME = 'constants'\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in [m for m in sys.modules if m == "ssg" or m.startswith("ssg.")]:
+        monkeypatch.delitem(sys.modules, name)
+
+    yield package
+
+    for name in [m for m in sys.modules if m == "ssg" or m.startswith("ssg.")]:
+        del sys.modules[name]
+
+
+def test_access_before_load_raises():
+    """Test that submodules cannot be accessed before load_modules()."""
+    with pytest.raises(ImportError, match="not loaded"):
+        _ = SSGModules().rules
+
+
+def test_submodules_imported_lazily(fake_ssg):
+    """Test that submodules are only imported on first access."""
+    modules = SSGModules()
+    modules.load_modules()
+
+    assert "ssg" in sys.modules
+    assert "ssg.rules" not in sys.modules
+
+    assert modules.rules.NAME == "rules"
+    assert "ssg.rules" in sys.modules
+    assert "ssg.constants" not in sys.modules
+    assert modules.rules is sys.modules["ssg.rules"]
+
+
+def test_constants_imported_lazily(fake_ssg):
+    """Test that ssg.constants is imported like the other submodules."""
+    modules = SSGModules()
+    modules.load_modules()
+    assert "ssg.constants" not in sys.modules
+
+    assert modules.constants.NAME == "constants"
+    assert modules.constants is sys.modules["ssg.constants"]
+
+
+def test_unknown_attribute(fake_ssg):
+    """Test that only known ssg submodules are exposed."""
+    modules = SSGModules()
+    modules.load_modules()
+
+    with pytest.raises(AttributeError, match="checks"):
+        _ = modules.checks
+    assert not hasattr(modules, "__dict__")